@@ -5,13 +5,9 @@ Interactive web interface for financial sentiment analysis
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import functools
 import json
 import os
-import glob
 import sys
 from datetime import datetime, timedelta
 import time
@@ -22,11 +18,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 # Import Serena integration
 from serena_integration import SerenaIntegration
 
-from src.scraper import DataCollector
-from src.analyzer import DataProcessor
-from src.claude_client import ClaudeAnalyst
-from src.reporter import MarkdownReporter
-from src.utils import ensure_directories, validate_api_keys, health_check
+# Plotting, NumPy and the pipeline components (src.scraper, src.analyzer,
+# src.claude_client, src.reporter) are imported inside the functions that use
+# them to keep the initial render fast.
+from src.utils import (
+    ensure_directories, validate_api_keys, health_check, read_json, hash_json, save_json_data,
+    get_latest_file, resolve_json_path, iter_jsonl
+)
 
 # Configure Streamlit page
 st.set_page_config(
@@ -72,6 +70,224 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Claude results keyed by a hash of the processed data they were generated from
+CLAUDE_CACHE_DIR = 'data/cache/claude'
+
+# HTML card templates, formatted once per row
+ACTIVITY_CARD_TEMPLATE = """
+<div class="metric-card">
+    <h4>{i}. @{username} ({name}) {emoji}</h4>
+    <p>{text}</p>
+    <small>
+        <strong>Impact Score:</strong> {impact:.2f} |
+        <span class="{css}"><strong>Sentiment:</strong> {sentiment:+.2f}</span>
+    </small>
+</div>
+"""
+
+TWEET_CARD_TEMPLATE = """
+<div class="metric-card">
+    <h4>{j}. @{username} ({user_name})</h4>
+    <p>{text}</p>
+    <div style="display: flex; gap: 20px; font-size: 0.8em; color: #666;">
+        <span>📅 {date}</span>
+        <span>❤️ {likes:,}</span>
+        <span>🔄 {retweets:,}</span>
+        <span>💬 {replies:,}</span>
+    </div>
+</div>
+"""
+
+# Keywords for the per-category sentiment chart
+POSITIVE_WORDS = ('bullish', 'good', 'up', 'growth', 'positive')
+NEGATIVE_WORDS = ('bearish', 'bad', 'down', 'crash', 'negative')
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _latest_processed():
+    """Latest processed analysis file, re-scanned at most every few seconds"""
+    return get_latest_file('data/processed/analysis_*.json')
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _latest_raw():
+    """Latest raw tweets file, re-scanned at most every few seconds"""
+    return get_latest_file('data/raw/tweets_*.json')
+
+
+@functools.lru_cache(maxsize=256)
+def _format_iso(timestamp: str, fmt: str = '%d.%m.%Y %H:%M:%S') -> str:
+    """Reformat an ISO timestamp for display; raises ValueError if it cannot be parsed"""
+    return datetime.fromisoformat(timestamp).strftime(fmt)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_collector():
+    """Shared DataCollector, built once per server process"""
+    from src.scraper import DataCollector
+    return DataCollector()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_processor():
+    """Shared DataProcessor, built once per server process"""
+    from src.analyzer import DataProcessor
+    return DataProcessor()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_claude_analyst():
+    """Shared ClaudeAnalyst (API client), built once per server process"""
+    from src.claude_client import ClaudeAnalyst
+    return ClaudeAnalyst()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_reporter():
+    """Shared MarkdownReporter, built once per server process"""
+    from src.reporter import MarkdownReporter
+    return MarkdownReporter()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_api_keys():
+    """API key presence, re-checked at most once a minute"""
+    return validate_api_keys()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_health():
+    """System health check, re-run at most every 30 seconds"""
+    return health_check()
+
+
+@st.cache_data(show_spinner=False)
+def _load_processed(path: str, mtime: float) -> dict:
+    """Parse a processed analysis file; mtime is part of the cache key"""
+    return read_json(path)
+
+
+def _category_sentiment(tweets):
+    """Return (keyword sentiment score, average engagement) for a category"""
+    positive = 0
+    negative = 0
+    total_engagement = 0
+
+    for tweet in tweets:
+        text = tweet.get('text', '').lower()
+        total_engagement += tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
+
+        if any(word in text for word in POSITIVE_WORDS):
+            positive += 1
+        elif any(word in text for word in NEGATIVE_WORDS):
+            negative += 1
+
+    count = max(len(tweets), 1)
+    return (positive - negative) / count, total_engagement / count
+
+
+@st.cache_data(show_spinner=False)
+def _sentiment_chart(path: str, mtime: float):
+    """Build the category sentiment figure (as a dict) and summary stats for a comprehensive file"""
+    import numpy as np
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
+    tweets_by_category = read_json(path).get('tweets_by_category', {})
+
+    # One row per active category, then transposed into parallel columns
+    rows = [
+        (category.replace('_', ' ').title(), len(tweets), *_category_sentiment(tweets))
+        for category, tweets in tweets_by_category.items() if tweets
+    ]
+    if not rows:
+        return None
+    category_names, tweet_counts, sentiment_scores, engagement_scores = map(list, zip(*rows))
+
+    # Create subplot with secondary y-axis
+    fig = make_subplots(
+        specs=[[{"secondary_y": True}]],
+        subplot_titles=["Sentiment według kategorii"]
+    )
+
+    # Bar colors and labels computed in one vectorized pass
+    scores = np.asarray(sentiment_scores, dtype=float)
+    bar_colors = np.where(scores > 0.1, 'green', np.where(scores < -0.1, 'red', 'gray'))
+    bar_labels = np.char.mod('%+.2f', scores)
+
+    # Add sentiment bars
+    fig.add_trace(
+        go.Bar(
+            x=category_names,
+            y=scores,
+            name="Sentiment Score",
+            marker_color=bar_colors,
+            text=bar_labels,
+            textposition="auto"
+        ),
+        secondary_y=False,
+    )
+
+    # Add tweet count line
+    fig.add_trace(
+        go.Scatter(
+            x=category_names,
+            y=tweet_counts,
+            mode="lines+markers",
+            name="Liczba tweetów",
+            line=dict(color="blue", width=2),
+            marker=dict(size=8)
+        ),
+        secondary_y=True,
+    )
+
+    # Update layout
+    fig.update_xaxes(title_text="Kategoria")
+    fig.update_yaxes(title_text="Sentiment Score", secondary_y=False)
+    fig.update_yaxes(title_text="Liczba tweetów", secondary_y=True)
+
+    fig.update_layout(
+        height=500,
+        showlegend=True,
+        title_text="Sentiment i aktywność według kategorii (654 tweets)"
+    )
+
+    return {
+        'figure': fig.to_dict(),
+        'total_tweets': sum(tweet_counts),
+        'avg_sentiment': float(scores.mean()),
+        'total_engagement': sum(engagement_scores)
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _category_pie(path: str, mtime: float, category: str):
+    """Build the sentiment distribution pie (as a dict) for one category of a processed file"""
+    import plotly.graph_objects as go
+
+    data = _load_processed(path, mtime).get('categories', {}).get(category, {})
+    sentiment_dist = data.get('sentiment_distribution', {})
+    if not sentiment_dist:
+        return None
+
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=['Pozytywny', 'Negatywny', 'Neutralny'],
+        values=[
+            sentiment_dist.get('positive', 0),
+            sentiment_dist.get('negative', 0),
+            sentiment_dist.get('neutral', 0)
+        ],
+        hole=0.3
+    )])
+
+    fig_pie.update_layout(
+        title=f"Rozkład sentymenty - {category.replace('_', ' ').title()}",
+        height=400
+    )
+
+    return fig_pie.to_dict()
+
+
 class StreamlitDashboard:
     """Main Streamlit Dashboard Class"""
 
@@ -96,13 +312,13 @@ class StreamlitDashboard:
         """Initialize components with error handling"""
         try:
             if not self.data_collector:
-                self.data_collector = DataCollector()
+                self.data_collector = _get_collector()
             if not self.data_processor:
-                self.data_processor = DataProcessor()
+                self.data_processor = _get_processor()
             if not self.claude_analyst:
-                self.claude_analyst = ClaudeAnalyst()
+                self.claude_analyst = _get_claude_analyst()
             if not self.reporter:
-                self.reporter = MarkdownReporter()
+                self.reporter = _get_reporter()
             return True
         except Exception as e:
             st.error(f"Error initializing components: {e}")
@@ -117,7 +333,7 @@ class StreamlitDashboard:
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            api_keys = validate_api_keys()
+            api_keys = _cached_api_keys()
             twitter_status = "✅" if api_keys.get('TWITTER_API_KEY') else "❌"
             st.metric("Twitter API", twitter_status)
 
@@ -136,18 +352,29 @@ class StreamlitDashboard:
             # Data freshness
             latest_file = self.get_latest_processed_file()
             if latest_file:
-                file_time = datetime.fromtimestamp(os.path.getctime(latest_file))
-                age = datetime.now() - file_time
-                if age.total_seconds() < 3600:  # Less than 1 hour
-                    freshness = "🟢 Fresh"
-                elif age.total_seconds() < 14400:  # Less than 4 hours
-                    freshness = "🟡 Recent"
-                else:
-                    freshness = "🔴 Old"
+                freshness = self.get_freshness_bucket(os.path.getctime(latest_file))
             else:
                 freshness = "❌ No Data"
             st.metric("Świeżość danych", freshness)
 
+    def get_freshness_bucket(self, ctime):
+        """Return the freshness label for a file ctime, cached in session state"""
+        cached = st.session_state.get('_fresh_cache')
+        now = time.time()
+        if cached and cached[0] == ctime and now < cached[2]:
+            return cached[1]
+
+        age = now - ctime
+        if age < 3600:  # Less than 1 hour
+            bucket, valid_until = "🟢 Fresh", ctime + 3600
+        elif age < 14400:  # Less than 4 hours
+            bucket, valid_until = "🟡 Recent", ctime + 14400
+        else:
+            bucket, valid_until = "🔴 Old", float('inf')
+
+        st.session_state['_fresh_cache'] = (ctime, bucket, valid_until)
+        return bucket
+
     def render_sidebar(self):
         """Render sidebar controls"""
         st.sidebar.header("🎛️ Panel Kontrolny")
@@ -173,17 +400,14 @@ class StreamlitDashboard:
 
         hours_back = st.sidebar.slider("Godziny wstecz", 1, 24, 4)
 
-        auto_refresh = st.sidebar.checkbox("Auto-odświeżanie (30s)", value=False)
-
-        if auto_refresh:
-            time.sleep(30)
-            st.rerun()
+        # Read in run(): only the metrics fragment refreshes on a timer
+        st.sidebar.checkbox("Auto-odświeżanie (30s)", value=False, key="auto_refresh")
 
         # System info
         st.sidebar.subheader("ℹ️ Informacje")
 
         if st.sidebar.button("System Health Check"):
-            health = health_check()
+            health = _cached_health()
             st.sidebar.json(health)
 
         # Serena integration
@@ -235,191 +459,110 @@ class StreamlitDashboard:
 
         sentiment_score = (positive_tweets - negative_tweets) / max(total_tweets, 1) * 100
 
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            if sentiment_score > 20:
-                sentiment_label = "Bullish"
-                delta_color = "normal"
-            elif sentiment_score < -20:
-                sentiment_label = "Bearish"
-                delta_color = "inverse"
-            else:
-                sentiment_label = "Neutral"
-                delta_color = "off"
-
-            st.metric(
-                "Market Sentiment",
-                sentiment_label,
-                delta=f"{sentiment_score:+.1f}%",
-                delta_color=delta_color
-            )
-
-        with col2:
-            st.metric("Łączne tweety", f"{total_tweets:,}")
-
-        with col3:
-            st.metric("Aktywne kategorie", active_categories)
-
-        with col4:
-            avg_engagement = total_engagement / max(total_tweets, 1)
-            if avg_engagement > 10000:
-                engagement_level = "Very High"
-                engagement_color = "🔴"
-            elif avg_engagement > 1000:
-                engagement_level = "High"
-                engagement_color = "🟡"
-            else:
-                engagement_level = "Normal"
-                engagement_color = "🟢"
-
-            st.metric("Zaangażowanie", f"{engagement_color} {engagement_level}")
-
-        # Additional metrics row
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("Konta", f"{total_accounts}")
-
-        with col2:
-            avg_tweets_per_account = total_tweets / max(total_accounts, 1)
-            st.metric("Śr. tweetów/konto", f"{avg_tweets_per_account:.1f}")
-
-        with col3:
-            # Most active category
-            most_active_cat = max(tweets_by_category.keys(),
-                                key=lambda k: len(tweets_by_category[k]),
-                                default="N/A")
-            if most_active_cat != "N/A":
-                most_active_count = len(tweets_by_category[most_active_cat])
-                st.metric("Najaktywniejsza", f"{most_active_cat} ({most_active_count})")
-            else:
-                st.metric("Najaktywniejsza", "N/A")
-
-        with col4:
-            timestamp = comprehensive_data.get('timestamp', '')
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    age = datetime.now() - dt
-                    if age.total_seconds() < 3600:  # Less than 1 hour
-                        freshness = "🟢 Fresh"
-                    elif age.total_seconds() < 14400:  # Less than 4 hours
-                        freshness = "🟡 Recent"
-                    else:
-                        freshness = "🔴 Old"
-                except:
-                    freshness = "❓ Unknown"
-            else:
+        # Delta colours match the .sentiment-* classes
+        if sentiment_score > 20:
+            sentiment_label = "Bullish"
+            sentiment_color = "#28a745"
+        elif sentiment_score < -20:
+            sentiment_label = "Bearish"
+            sentiment_color = "#dc3545"
+        else:
+            sentiment_label = "Neutral"
+            sentiment_color = "#6c757d"
+
+        avg_engagement = total_engagement / max(total_tweets, 1)
+        if avg_engagement > 10000:
+            engagement_level = "Very High"
+            engagement_color = "🔴"
+        elif avg_engagement > 1000:
+            engagement_level = "High"
+            engagement_color = "🟡"
+        else:
+            engagement_level = "Normal"
+            engagement_color = "🟢"
+
+        avg_tweets_per_account = total_tweets / max(total_accounts, 1)
+
+        # Most active category
+        most_active_cat = max(tweets_by_category.keys(),
+                            key=lambda k: len(tweets_by_category[k]),
+                            default="N/A")
+        if most_active_cat != "N/A":
+            most_active = f"{most_active_cat} ({len(tweets_by_category[most_active_cat])})"
+        else:
+            most_active = "N/A"
+
+        timestamp = comprehensive_data.get('timestamp', '')
+        if timestamp:
+            try:
+                dt = datetime.fromisoformat(timestamp)
+                age = datetime.now() - dt
+                if age.total_seconds() < 3600:  # Less than 1 hour
+                    freshness = "🟢 Fresh"
+                elif age.total_seconds() < 14400:  # Less than 4 hours
+                    freshness = "🟡 Recent"
+                else:
+                    freshness = "🔴 Old"
+            except:
                 freshness = "❓ Unknown"
-            st.metric("Świeżość danych", freshness)
-
+        else:
+            freshness = "❓ Unknown"
+
+        import pandas as pd
+
+        # One st.dataframe for the whole KPI table instead of one st.metric per cell
+        metrics = pd.DataFrame([
+            {"Metryka": "Market Sentiment", "Wartość": sentiment_label, "Zmiana": f"{sentiment_score:+.1f}%"},
+            {"Metryka": "Łączne tweety", "Wartość": f"{total_tweets:,}", "Zmiana": ""},
+            {"Metryka": "Aktywne kategorie", "Wartość": str(active_categories), "Zmiana": ""},
+            {"Metryka": "Zaangażowanie", "Wartość": f"{engagement_color} {engagement_level}", "Zmiana": ""},
+            {"Metryka": "Konta", "Wartość": f"{total_accounts}", "Zmiana": ""},
+            {"Metryka": "Śr. tweetów/konto", "Wartość": f"{avg_tweets_per_account:.1f}", "Zmiana": ""},
+            {"Metryka": "Najaktywniejsza", "Wartość": most_active, "Zmiana": ""},
+            {"Metryka": "Świeżość danych", "Wartość": freshness, "Zmiana": ""},
+        ])
+
+        def color_sentiment_delta(frame):
+            styles = pd.DataFrame("", index=frame.index, columns=frame.columns)
+            styles.loc[0, "Zmiana"] = f"color: {sentiment_color}; font-weight: bold"
+            return styles
+
+        st.dataframe(metrics.style.apply(color_sentiment_delta, axis=None), hide_index=True, use_container_width=True)
+
+    @st.fragment
     def render_sentiment_chart(self):
         """Render sentiment visualization"""
-        comprehensive_data = self.load_comprehensive_data()
+        import plotly.graph_objects as go
 
-        if not comprehensive_data:
+        comprehensive_file = 'data/raw/comprehensive_tweets_current.json'
+        if not os.path.exists(comprehensive_file):
             st.warning("Brak danych do wykresu. Użyj przycisku 'Użyj danych z cache' w zakładce Tweety.")
             return
 
-        st.subheader("📈 Analiza Sentymenty")
-
-        tweets_by_category = comprehensive_data.get('tweets_by_category', {})
-
-        if not tweets_by_category:
-            st.warning("Brak danych kategorii do wyświetlenia")
+        try:
+            chart = _sentiment_chart(comprehensive_file, os.path.getmtime(comprehensive_file))
+        except Exception as e:
+            st.error(f"Błąd ładowania danych: {e}")
             return
 
-        # Prepare data for visualization
-        category_names = []
-        sentiment_scores = []
-        tweet_counts = []
-        engagement_scores = []
+        st.subheader("📈 Analiza Sentymenty")
 
-        for category, tweets in tweets_by_category.items():
-            if tweets:
-                category_names.append(category.replace('_', ' ').title())
-                tweet_counts.append(len(tweets))
-
-                # Calculate sentiment for category
-                positive = 0
-                negative = 0
-                total_engagement = 0
-
-                for tweet in tweets:
-                    text = tweet.get('text', '').lower()
-                    engagement = tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
-                    total_engagement += engagement
-
-                    if any(word in text for word in ['bullish', 'good', 'up', 'growth', 'positive']):
-                        positive += 1
-                    elif any(word in text for word in ['bearish', 'bad', 'down', 'crash', 'negative']):
-                        negative += 1
-
-                sentiment_score = (positive - negative) / max(len(tweets), 1)
-                sentiment_scores.append(sentiment_score)
-                engagement_scores.append(total_engagement / max(len(tweets), 1))
-
-        if not category_names:
+        if not chart:
             st.warning("Brak aktywnych kategorii")
             return
 
-        # Create subplot with secondary y-axis
-        fig = make_subplots(
-            specs=[[{"secondary_y": True}]],
-            subplot_titles=["Sentiment według kategorii"]
-        )
-
-        # Add sentiment bars
-        fig.add_trace(
-            go.Bar(
-                x=category_names,
-                y=sentiment_scores,
-                name="Sentiment Score",
-                marker_color=['green' if s > 0.1 else 'red' if s < -0.1 else 'gray' for s in sentiment_scores],
-                text=[f"{s:+.2f}" for s in sentiment_scores],
-                textposition="auto"
-            ),
-            secondary_y=False,
-        )
-
-        # Add tweet count line
-        fig.add_trace(
-            go.Scatter(
-                x=category_names,
-                y=tweet_counts,
-                mode="lines+markers",
-                name="Liczba tweetów",
-                line=dict(color="blue", width=2),
-                marker=dict(size=8)
-            ),
-            secondary_y=True,
-        )
-
-        # Update layout
-        fig.update_xaxes(title_text="Kategoria")
-        fig.update_yaxes(title_text="Sentiment Score", secondary_y=False)
-        fig.update_yaxes(title_text="Liczba tweetów", secondary_y=True)
-
-        fig.update_layout(
-            height=500,
-            showlegend=True,
-            title_text="Sentiment i aktywność według kategorii (654 tweets)"
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(go.Figure(chart['figure']), use_container_width=True)
 
         # Show summary stats
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Łączne tweety", sum(tweet_counts))
+            st.metric("Łączne tweety", chart['total_tweets'])
         with col2:
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
-            st.metric("Średni sentiment", f"{avg_sentiment:+.3f}")
+            st.metric("Średni sentiment", f"{chart['avg_sentiment']:+.3f}")
         with col3:
-            total_engagement = sum(engagement_scores)
-            st.metric("Łączne zaangażowanie", f"{total_engagement:,.0f}")
+            st.metric("Łączne zaangażowanie", f"{chart['total_engagement']:,.0f}")
 
+    @st.fragment
     def render_category_details(self):
         """Render detailed category analysis"""
         latest_data = self.load_latest_processed_data()
@@ -431,74 +574,67 @@ class StreamlitDashboard:
 
         categories = latest_data.get('categories', {})
 
-        # Create tabs for each category
-        category_tabs = [cat.replace('_', ' ').title() for cat in categories.keys()
-                        if categories[cat].get('tweet_count', 0) > 0]
+        active_categories = [cat for cat, data in categories.items()
+                             if data.get('tweet_count', 0) > 0]
 
-        if not category_tabs:
+        if not active_categories:
             st.warning("Brak aktywnych kategorii")
             return
 
-        tabs = st.tabs(category_tabs)
-
-        for i, (category, data) in enumerate(categories.items()):
-            if data.get('tweet_count', 0) == 0:
-                continue
-
-            with tabs[i]:
-                col1, col2, col3 = st.columns(3)
+        # Render only the selected category instead of eagerly building every tab
+        selected = st.selectbox(
+            "Kategoria",
+            active_categories,
+            format_func=lambda cat: cat.replace('_', ' ').title(),
+            key="category_details_sel"
+        )
+        self._render_category_detail(selected, categories[selected])
 
-                with col1:
-                    st.metric(
-                        "Sentiment",
-                        data.get('sentiment_label', 'Unknown'),
-                        delta=f"{data.get('weighted_sentiment', 0.0):.2f}"
-                    )
+    def _render_category_detail(self, category, data):
+        """Render metrics, pie chart and top tweets for a single category"""
+        import plotly.graph_objects as go
 
-                with col2:
-                    st.metric("Tweety", data.get('tweet_count', 0))
+        col1, col2, col3 = st.columns(3)
 
-                with col3:
-                    st.metric(
-                        "Średni wpływ",
-                        f"{data.get('avg_influence', 0.0):.2f}"
-                    )
+        with col1:
+            st.metric(
+                "Sentiment",
+                data.get('sentiment_label', 'Unknown'),
+                delta=f"{data.get('weighted_sentiment', 0.0):.2f}"
+            )
 
-                # Sentiment distribution pie chart
-                sentiment_dist = data.get('sentiment_distribution', {})
-                if sentiment_dist:
-                    fig_pie = go.Figure(data=[go.Pie(
-                        labels=['Pozytywny', 'Negatywny', 'Neutralny'],
-                        values=[
-                            sentiment_dist.get('positive', 0),
-                            sentiment_dist.get('negative', 0),
-                            sentiment_dist.get('neutral', 0)
-                        ],
-                        hole=0.3
-                    )])
-
-                    fig_pie.update_layout(
-                        title=f"Rozkład sentymenty - {category.replace('_', ' ').title()}",
-                        height=400
-                    )
+        with col2:
+            st.metric("Tweety", data.get('tweet_count', 0))
 
-                    st.plotly_chart(fig_pie, use_container_width=True)
+        with col3:
+            st.metric(
+                "Średni wpływ",
+                f"{data.get('avg_influence', 0.0):.2f}"
+            )
 
-                # Top tweets for this category
-                top_tweets = data.get('top_tweets', [])
-                if top_tweets:
-                    st.write("**Top tweety:**")
-                    for j, tweet in enumerate(top_tweets[:3], 1):
-                        user = tweet.get('user', {})
-                        username = user.get('screen_name', 'Unknown')
-                        text = tweet.get('text', '')
-                        influence = tweet.get('influence_score', 0.0)
+        # Sentiment distribution pie chart (figure cached per analysis file)
+        latest_file = self.get_latest_processed_file()
+        if latest_file and data.get('sentiment_distribution'):
+            fig_pie = _category_pie(latest_file, os.path.getmtime(latest_file), category)
+            if fig_pie:
+                st.plotly_chart(go.Figure(fig_pie), use_container_width=True)
+
+        # Top tweets for this category
+        top_tweets = data.get('top_tweets', [])
+        if top_tweets:
+            st.write("**Top tweety:**")
+            for j, tweet in enumerate(top_tweets[:3], 1):
+                user = tweet.get('user', {})
+                username = user.get('screen_name', 'Unknown')
+                text = tweet.get('text', '')
+                influence = tweet.get('influence_score', 0.0)
 
-                        st.markdown(f"""
-                        **{j}. @{username}** (Wpływ: {influence:.2f})
-                        > {text}
-                        """)
+                st.markdown(f"""
+                **{j}. @{username}** (Wpływ: {influence:.2f})
+                > {text}
+                """)
 
+    @st.fragment
     def render_recent_activity(self):
         """Render recent activity and top tweets"""
         latest_data = self.load_latest_processed_data()
@@ -534,16 +670,10 @@ class StreamlitDashboard:
                 sentiment_class = "sentiment-neutral"
                 sentiment_emoji = "➡️"
 
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>{i}. @{username} ({name}) {sentiment_emoji}</h4>
-                <p>{text}</p>
-                <small>
-                    <strong>Impact Score:</strong> {impact_score:.2f} |
-                    <span class="{sentiment_class}"><strong>Sentiment:</strong> {sentiment_score:+.2f}</span>
-                </small>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(ACTIVITY_CARD_TEMPLATE.format(
+                i=i, username=username, name=name, emoji=sentiment_emoji, text=text,
+                impact=impact_score, css=sentiment_class, sentiment=sentiment_score
+            ), unsafe_allow_html=True)
 
     def run_data_collection(self):
         """Run data collection"""
@@ -554,6 +684,7 @@ class StreamlitDashboard:
             try:
                 raw_file = self.data_collector.collect_and_save(4)
                 if raw_file:
+                    _latest_raw.clear()
                     st.success(f"✅ Dane pobrane pomyślnie: {raw_file}")
                     st.session_state.last_update = datetime.now()
                 else:
@@ -567,17 +698,16 @@ class StreamlitDashboard:
             return
 
         # Find latest raw data file
-        raw_files = glob.glob('data/raw/tweets_*.json')
-        if not raw_files:
+        latest_raw_file = _latest_raw()
+        if not latest_raw_file:
             st.warning("Brak danych do analizy. Najpierw pobierz dane.")
             return
 
-        latest_raw_file = max(raw_files, key=os.path.getctime)
-
         with st.spinner("Analiza sentymenty w toku..."):
             try:
                 processed_file = self.data_processor.load_and_process(latest_raw_file)
                 if processed_file:
+                    _latest_processed.clear()
                     st.success(f"✅ Analiza ukończona: {processed_file}")
                     st.session_state.last_update = datetime.now()
                     st.rerun()  # Refresh the dashboard
@@ -617,17 +747,13 @@ class StreamlitDashboard:
             status_text.text("Krok 3/5: Ładowanie danych...")
             progress_bar.progress(60)
 
-            with open(processed_file, 'r', encoding='utf-8') as f:
-                processed_data = json.load(f)
+            processed_data = read_json(processed_file)
 
             # Step 4: Claude analysis
             status_text.text("Krok 4/5: Analiza AI...")
             progress_bar.progress(80)
 
-            claude_analysis = self.claude_analyst.analyze_market_sentiment(processed_data)
-            executive_summary = self.claude_analyst.generate_executive_summary(
-                processed_data, claude_analysis
-            )
+            claude_analysis, executive_summary = self.get_claude_analysis(processed_data)
 
             # Step 5: Generate report
             status_text.text("Krok 5/5: Generowanie raportu...")
@@ -639,14 +765,13 @@ class StreamlitDashboard:
             report_file = self.reporter.save_report(report_content, 'daily')
 
             if report_file:
+                _latest_raw.clear()
+                _latest_processed.clear()
                 st.success(f"✅ Pełny cykl ukończony pomyślnie!")
                 st.session_state.last_update = datetime.now()
                 status_text.text("Gotowe!")
 
-                # Show download button for report
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    report_content = f.read()
-
+                # Show download button for the report generated above
                 st.download_button(
                     label="📄 Pobierz raport",
                     data=report_content,
@@ -665,23 +790,50 @@ class StreamlitDashboard:
             progress_bar.empty()
             status_text.empty()
 
+    def get_claude_analysis(self, processed_data):
+        """Return (claude_analysis, executive_summary), reusing cached results for identical data"""
+        cache_file = os.path.join(CLAUDE_CACHE_DIR, f"{hash_json(processed_data)}.json")
+        if os.path.exists(cache_file):
+            try:
+                cached = read_json(cache_file)
+                return cached['claude_analysis'], cached['executive_summary']
+            except Exception:
+                pass  # Fall through to a fresh analysis
+
+        claude_analysis = self.claude_analyst.analyze_market_sentiment(processed_data)
+        executive_summary = self.claude_analyst.generate_executive_summary(
+            processed_data, claude_analysis
+        )
+
+        # Only persist successful API responses
+        if 'error' not in claude_analysis:
+            save_json_data({
+                'cached_at': datetime.now().isoformat(),
+                'model': self.claude_analyst.model,
+                'claude_analysis': claude_analysis,
+                'executive_summary': executive_summary
+            }, cache_file)
+
+        return claude_analysis, executive_summary
+
     def load_latest_processed_data(self):
         """Load latest processed data and update live preview"""
         try:
-            processed_files = glob.glob('data/processed/analysis_*.json')
-            if not processed_files:
+            latest_file = self.get_latest_processed_file()
+            if not latest_file:
                 return None
 
-            latest_file = max(processed_files, key=os.path.getctime)
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            mtime = os.path.getmtime(latest_file)
+            data = _load_processed(latest_file, mtime)
 
-            # Update live preview for Serena
-            try:
-                self.serena.create_live_analysis_file(data)
-            except Exception as serena_error:
-                # Don't fail if Serena update fails
-                pass
+            # Update live preview for Serena once per new analysis file
+            if st.session_state.get('_serena_synced') != (latest_file, mtime):
+                try:
+                    self.serena.create_live_analysis_file(data)
+                    st.session_state['_serena_synced'] = (latest_file, mtime)
+                except Exception as serena_error:
+                    # Don't fail if Serena update fails
+                    pass
 
             return data
         except Exception as e:
@@ -693,8 +845,7 @@ class StreamlitDashboard:
         try:
             comprehensive_file = 'data/raw/comprehensive_tweets_current.json'
             if os.path.exists(comprehensive_file):
-                with open(comprehensive_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(comprehensive_file)
             return None
         except Exception as e:
             st.error(f"Błąd ładowania danych: {e}")
@@ -706,20 +857,26 @@ class StreamlitDashboard:
             # First try comprehensive tweets (new system)
             comprehensive_file = 'data/raw/comprehensive_tweets_current.json'
             if os.path.exists(comprehensive_file):
-                with open(comprehensive_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('tweets_by_category', {})
+                return read_json(comprehensive_file).get('tweets_by_category', {})
+
+            # Then the last get_categorized_tweets.py run (JSON Lines, one tweet per line)
+            categorized_file = resolve_json_path('data/raw/categorized_tweets.jsonl')
+            if categorized_file:
+                tweets_by_category = {}
+                for tweet in iter_jsonl(categorized_file):
+                    tweets_by_category.setdefault(tweet.pop('category'), []).append(tweet)
+                return tweets_by_category
 
             # Fallback to sample file
             sample_file = 'data/raw/sample_categorized_tweets.json'
             if os.path.exists(sample_file):
-                with open(sample_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return read_json(sample_file)
             return None
         except Exception as e:
             st.error(f"Błąd ładowania kategoryzowanych tweetów: {e}")
             return None
 
+    @st.fragment
     def render_categorized_tweets(self):
         """Render categorized tweets display"""
         st.subheader("📱 Najnowsze Tweety według Kategorii")
@@ -735,14 +892,7 @@ class StreamlitDashboard:
                 if st.button("🔄 Użyj danych z cache", key="sample_tweets"):
                     with st.spinner("Ładowanie danych z cache..."):
                         try:
-                            import subprocess
-                            result = subprocess.run(
-                                ['python', 'convert_cache_to_comprehensive.py'],
-                                cwd=os.getcwd(),
-                                capture_output=True,
-                                text=True,
-                                timeout=60
-                            )
+                            result = self.run_script(['convert_cache_to_comprehensive.py'], timeout=60)
                             if result.returncode == 0:
                                 st.success("✅ Załadowano dane z cache!")
                                 st.rerun()
@@ -756,14 +906,7 @@ class StreamlitDashboard:
                     st.info("Pobieranie wszystkich kont może potrwać kilka minut...")
                     with st.spinner("Pobieranie kompletnych danych z cache..."):
                         try:
-                            import subprocess
-                            result = subprocess.run(
-                                ['python', 'comprehensive_tweet_collector.py'],
-                                cwd=os.getcwd(),
-                                capture_output=True,
-                                text=True,
-                                timeout=600
-                            )
+                            result = self.run_script(['comprehensive_tweet_collector.py'], timeout=600)
                             if result.returncode == 0:
                                 st.success("✅ Pobrano kompletne dane!")
                                 st.rerun()
@@ -787,75 +930,21 @@ class StreamlitDashboard:
                 avg_per_category = total_tweets / categories_count if categories_count > 0 else 0
                 st.metric("Średnio na kategorię", f"{avg_per_category:.1f}")
 
-        # Create tabs for each category
         active_categories = [(cat, tweets) for cat, tweets in tweets_data.items() if tweets]
 
         if not active_categories:
             st.warning("Brak aktywnych kategorii")
             return
 
-        # Create category tabs
-        tab_names = [f"{cat} ({len(tweets)})" for cat, tweets in active_categories]
-        tabs = st.tabs(tab_names)
-
-        for i, (category, tweets) in enumerate(active_categories):
-            with tabs[i]:
-                st.write(f"**{category}** - {len(tweets)} najnowszych tweetów")
-
-                # Category metrics
-                if tweets:
-                    total_likes = sum(tweet.get('like_count', 0) for tweet in tweets)
-                    total_retweets = sum(tweet.get('retweet_count', 0) for tweet in tweets)
-
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Łącznie polubień", f"{total_likes:,}")
-                    with col2:
-                        st.metric("Łącznie retweetów", f"{total_retweets:,}")
-                    with col3:
-                        avg_engagement = (total_likes + total_retweets) / len(tweets) if tweets else 0
-                        st.metric("Śr. zaangażowanie", f"{avg_engagement:.1f}")
-
-                # Display tweets
-                for j, tweet in enumerate(tweets, 1):
-                    username = tweet.get('username', 'unknown')
-                    user_name = tweet.get('user_name', username)
-                    text = tweet.get('text', 'Brak tekstu')
-                    created_at = tweet.get('created_at', '')
-                    likes = tweet.get('like_count', 0)
-                    retweets = tweet.get('retweet_count', 0)
-                    replies = tweet.get('reply_count', 0)
-
-                    # Display full text
-
-                    # Format date
-                    try:
-                        if created_at:
-                            from datetime import datetime
-                            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                            formatted_date = dt.strftime('%d.%m.%Y %H:%M')
-                        else:
-                            formatted_date = "Nieznana data"
-                    except:
-                        formatted_date = created_at
-
-                    # Create tweet card
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <h4>{j}. @{username} ({user_name})</h4>
-                        <p>{text}</p>
-                        <div style="display: flex; gap: 20px; font-size: 0.8em; color: #666;">
-                            <span>📅 {formatted_date}</span>
-                            <span>❤️ {likes:,}</span>
-                            <span>🔄 {retweets:,}</span>
-                            <span>💬 {replies:,}</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                # Refresh button for this category
-                if st.button(f"🔄 Odśwież {category}", key=f"refresh_{category}"):
-                    st.info(f"Odświeżanie kategorii {category}...")
+        # Render only the selected category instead of eagerly building every tab
+        tweets_by_name = dict(active_categories)
+        selected = st.selectbox(
+            "Kategoria",
+            list(tweets_by_name),
+            format_func=lambda cat: f"{cat} ({len(tweets_by_name[cat])})",
+            key="cat_sel"
+        )
+        self._render_category_tweets(selected, tweets_by_name[selected])
 
         # Global refresh button
         st.markdown("---")
@@ -864,14 +953,7 @@ class StreamlitDashboard:
             if st.button("🔄 Odśwież wszystkie tweety", key="refresh_all_tweets"):
                 with st.spinner("Pobieranie najnowszych tweetów..."):
                     try:
-                        import subprocess
-                        result = subprocess.run(
-                            ['python', 'comprehensive_tweet_collector.py', 'quick'],
-                            cwd=os.getcwd(),
-                            capture_output=True,
-                            text=True,
-                            timeout=300
-                        )
+                        result = self.run_script(['comprehensive_tweet_collector.py', 'quick'], timeout=300)
                         if result.returncode == 0:
                             st.success("✅ Odświeżono wszystkie tweety!")
                             st.rerun()
@@ -885,6 +967,56 @@ class StreamlitDashboard:
             if tweets_data:
                 st.caption(f"Ostatnia aktualizacja: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}")
 
+    def _render_category_tweets(self, category, tweets):
+        """Render metrics and tweet cards for a single category"""
+        st.write(f"**{category}** - {len(tweets)} najnowszych tweetów")
+
+        # Category metrics
+        if tweets:
+            total_likes = sum(tweet.get('like_count', 0) for tweet in tweets)
+            total_retweets = sum(tweet.get('retweet_count', 0) for tweet in tweets)
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Łącznie polubień", f"{total_likes:,}")
+            with col2:
+                st.metric("Łącznie retweetów", f"{total_retweets:,}")
+            with col3:
+                avg_engagement = (total_likes + total_retweets) / len(tweets) if tweets else 0
+                st.metric("Śr. zaangażowanie", f"{avg_engagement:.1f}")
+
+        # Display tweets
+        for j, tweet in enumerate(tweets, 1):
+            username = tweet.get('username', 'unknown')
+            user_name = tweet.get('user_name', username)
+            text = tweet.get('text', 'Brak tekstu')
+            created_at = tweet.get('created_at', '')
+            likes = tweet.get('like_count', 0)
+            retweets = tweet.get('retweet_count', 0)
+            replies = tweet.get('reply_count', 0)
+
+            # Display full text
+
+            # Format date
+            try:
+                if created_at:
+                    formatted_date = _format_iso(created_at.replace('Z', '+00:00'), '%d.%m.%Y %H:%M')
+                else:
+                    formatted_date = "Nieznana data"
+            except ValueError:
+                formatted_date = created_at
+
+            # Create tweet card
+            st.markdown(TWEET_CARD_TEMPLATE.format(
+                j=j, username=username, user_name=user_name, text=text, date=formatted_date,
+                likes=likes, retweets=retweets, replies=replies
+            ), unsafe_allow_html=True)
+
+        # Refresh button for this category
+        if st.button(f"🔄 Odśwież {category}", key=f"refresh_{category}"):
+            st.info(f"Odświeżanie kategorii {category}...")
+
+    @st.fragment
     def render_market_analysis(self):
         """Render comprehensive market analysis report"""
         st.subheader("📊 Analiza Rynkowa i Prognozy")
@@ -893,8 +1025,7 @@ class StreamlitDashboard:
         try:
             analysis_file = 'data/analysis/market_sentiment_analysis.json'
             if os.path.exists(analysis_file):
-                with open(analysis_file, 'r', encoding='utf-8') as f:
-                    analysis_data = json.load(f)
+                analysis_data = read_json(analysis_file)
             else:
                 analysis_data = None
 
@@ -918,14 +1049,7 @@ class StreamlitDashboard:
                 if st.button("🧠 Wygeneruj analizę rynkową", key="generate_analysis"):
                     with st.spinner("Generowanie analizy rynkowej..."):
                         try:
-                            import subprocess
-                            result = subprocess.run(
-                                ['python', 'local_market_analysis.py'],
-                                cwd=os.getcwd(),
-                                capture_output=True,
-                                text=True,
-                                timeout=60
-                            )
+                            result = self.run_script(['local_market_analysis.py'], timeout=60)
                             if result.returncode == 0:
                                 st.success("✅ Analiza wygenerowana!")
                                 st.rerun()
@@ -966,10 +1090,8 @@ class StreamlitDashboard:
             timestamp = analysis_data.get('timestamp', '')
             if timestamp:
                 try:
-                    dt = datetime.fromisoformat(timestamp)
-                    formatted_time = dt.strftime('%d.%m.%Y %H:%M:%S')
-                    st.caption(f"Analiza z: {formatted_time}")
-                except:
+                    st.caption(f"Analiza z: {_format_iso(timestamp)}")
+                except ValueError:
                     st.caption(f"Analiza z: {timestamp}")
 
         # Display full report
@@ -1000,14 +1122,7 @@ class StreamlitDashboard:
             if st.button("🔄 Odśwież analizę", key="refresh_analysis"):
                 with st.spinner("Regenerowanie analizy..."):
                     try:
-                        import subprocess
-                        result = subprocess.run(
-                            ['python', 'local_market_analysis.py'],
-                            cwd=os.getcwd(),
-                            capture_output=True,
-                            text=True,
-                            timeout=60
-                        )
+                        result = self.run_script(['local_market_analysis.py'], timeout=60)
                         if result.returncode == 0:
                             st.success("✅ Analiza zaktualizowana!")
                             st.rerun()
@@ -1019,6 +1134,7 @@ class StreamlitDashboard:
         with col2:
             st.info("💡 Tip: Najpierw odśwież tweety, potem analizę dla najaktualniejszych wyników")
 
+    @st.fragment
     def render_fund_manager_analysis(self):
         """Render professional fund manager analysis"""
         st.subheader("💼 Fund Manager Analysis - Ray Dalio Style")
@@ -1027,8 +1143,7 @@ class StreamlitDashboard:
         try:
             analysis_file = 'data/analysis/fund_manager_analysis_current.json'
             if os.path.exists(analysis_file):
-                with open(analysis_file, 'r', encoding='utf-8') as f:
-                    analysis_data = json.load(f)
+                analysis_data = read_json(analysis_file)
             else:
                 analysis_data = None
 
@@ -1052,18 +1167,10 @@ class StreamlitDashboard:
                 if st.button("🏦 Wygeneruj analizę Fund Manager", key="generate_fund_analysis"):
                     with st.spinner("Generowanie profesjonalnej analizy inwestycyjnej..."):
                         try:
-                            import subprocess
                             # First prepare demo data
-                            subprocess.run(['python', 'prepare_demo_data.py'],
-                                         cwd=os.getcwd(), timeout=30)
+                            self.run_script(['prepare_demo_data.py'], timeout=30)
                             # Then run fund manager analysis
-                            result = subprocess.run(
-                                ['python', 'fund_manager_analysis.py'],
-                                cwd=os.getcwd(),
-                                capture_output=True,
-                                text=True,
-                                timeout=120
-                            )
+                            result = self.run_script(['fund_manager_analysis.py'], timeout=120)
                             if result.returncode == 0:
                                 st.success("✅ Analiza Fund Manager wygenerowana!")
                                 st.rerun()
@@ -1077,19 +1184,11 @@ class StreamlitDashboard:
                     st.info("Pobieranie 10 tweetów z każdego konta (może potrwać kilka minut)")
                     with st.spinner("Pobieranie kompletnych danych..."):
                         try:
-                            import subprocess
-                            result = subprocess.run(
-                                ['python', 'comprehensive_tweet_collector.py'],
-                                cwd=os.getcwd(),
-                                capture_output=True,
-                                text=True,
-                                timeout=600
-                            )
+                            result = self.run_script(['comprehensive_tweet_collector.py'], timeout=600)
                             if result.returncode == 0:
                                 st.success("✅ Kompletne dane pobrane!")
                                 # Auto-run fund manager analysis
-                                subprocess.run(['python', 'fund_manager_analysis.py'],
-                                             cwd=os.getcwd(), timeout=120)
+                                self.run_script(['fund_manager_analysis.py'], timeout=120)
                                 st.success("✅ Analiza zaktualizowana!")
                                 st.rerun()
                             else:
@@ -1195,10 +1294,8 @@ class StreamlitDashboard:
             timestamp = analysis_data.get('timestamp', '')
             if timestamp:
                 try:
-                    dt = datetime.fromisoformat(timestamp)
-                    formatted_time = dt.strftime('%d.%m.%Y %H:%M:%S')
-                    st.caption(f"Professional Analysis Generated: {formatted_time}")
-                except:
+                    st.caption(f"Professional Analysis Generated: {_format_iso(timestamp)}")
+                except ValueError:
                     st.caption(f"Analysis from: {timestamp}")
 
         # Full professional report
@@ -1206,12 +1303,13 @@ class StreamlitDashboard:
             st.markdown("### 📋 Complete Fund Manager Report")
 
             # Download buttons
+            file_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             col1, col2, col3 = st.columns([2, 1, 1])
             with col2:
                 st.download_button(
                     label="📄 Download Report",
                     data=report_content,
-                    file_name=f"fund_manager_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                    file_name=f"fund_manager_analysis_{file_stamp}.md",
                     mime="text/markdown",
                     key="download_fund_analysis"
                 )
@@ -1221,7 +1319,7 @@ class StreamlitDashboard:
                     st.download_button(
                         label="📊 Download Data",
                         data=json.dumps(analysis_data, indent=2, ensure_ascii=False),
-                        file_name=f"fund_analysis_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                        file_name=f"fund_analysis_data_{file_stamp}.json",
                         mime="application/json",
                         key="download_fund_data"
                     )
@@ -1239,15 +1337,8 @@ class StreamlitDashboard:
             if st.button("🔄 Refresh Fund Analysis", key="refresh_fund_analysis"):
                 with st.spinner("Refreshing professional analysis..."):
                     try:
-                        import subprocess
                         # Run fund manager analysis
-                        result = subprocess.run(
-                            ['python', 'fund_manager_analysis.py'],
-                            cwd=os.getcwd(),
-                            capture_output=True,
-                            text=True,
-                            timeout=120
-                        )
+                        result = self.run_script(['fund_manager_analysis.py'], timeout=120)
                         if result.returncode == 0:
                             st.success("✅ Fund Manager Analysis refreshed!")
                             st.rerun()
@@ -1259,6 +1350,7 @@ class StreamlitDashboard:
         with col2:
             st.info("💡 Pro Tip: This analysis follows Ray Dalio's systematic investment principles")
 
+    @st.fragment
     def render_deep_sectoral_analysis(self):
         """Render deep sectoral analysis results"""
         st.subheader("🎯 Głęboka Analiza Sektorowa - Interpretacja Poglądów Ekspertów")
@@ -1282,10 +1374,10 @@ class StreamlitDashboard:
         # Check which analyses are available
         available_analyses = {}
         for sector, file_path in analysis_files.items():
-            if os.path.exists(file_path):
+            file_path = resolve_json_path(file_path)  # plain or .zst cache
+            if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        available_analyses[sector] = json.load(f)
+                    available_analyses[sector] = read_json(file_path)
                 except Exception as e:
                     st.error(f"Błąd ładowania analizy {sector}: {e}")
 
@@ -1297,14 +1389,7 @@ class StreamlitDashboard:
                 if st.button("🧠 Wygeneruj Głębokie Analizy Sektorowe", key="generate_deep_analysis"):
                     with st.spinner("Generowanie głębokich analiz sektorowych..."):
                         try:
-                            import subprocess
-                            result = subprocess.run(
-                                ['python', 'deep_sectoral_analysis.py'],
-                                cwd=os.getcwd(),
-                                capture_output=True,
-                                text=True,
-                                timeout=600
-                            )
+                            result = self.run_script(['deep_sectoral_analysis.py'], timeout=600)
                             if result.returncode == 0:
                                 st.success("✅ Głębokie analizy sektorowe wygenerowane!")
                                 st.rerun()
@@ -1354,6 +1439,8 @@ class StreamlitDashboard:
         # Display sectoral analyses
         st.markdown("### 🔍 Analizy Sektorowe")
 
+        file_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
         # Create tabs for each sector
         if available_analyses:
             sector_tabs = st.tabs(list(available_analyses.keys()))
@@ -1370,10 +1457,8 @@ class StreamlitDashboard:
                         timestamp = analysis_data.get('timestamp', '')
                         if timestamp:
                             try:
-                                dt = datetime.fromisoformat(timestamp)
-                                formatted_time = dt.strftime('%d.%m.%Y %H:%M')
-                                st.caption(f"Wygenerowano: {formatted_time}")
-                            except:
+                                st.caption(f"Wygenerowano: {_format_iso(timestamp, '%d.%m.%Y %H:%M')}")
+                            except ValueError:
                                 st.caption(f"Wygenerowano: {timestamp}")
 
                     # Display analysis content
@@ -1389,7 +1474,7 @@ class StreamlitDashboard:
                         st.download_button(
                             label=f"📄 Pobierz {sector}",
                             data=json.dumps(analysis_data, indent=2, ensure_ascii=False),
-                            file_name=f"deep_analysis_{sector.lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                            file_name=f"deep_analysis_{sector.lower()}_{file_stamp}.json",
                             mime="application/json",
                             key=f"download_{sector}"
                         )
@@ -1404,14 +1489,7 @@ class StreamlitDashboard:
             if st.button("🔄 Odśwież Analizy", key="refresh_deep_analysis"):
                 with st.spinner("Odświeżanie analiz sektorowych..."):
                     try:
-                        import subprocess
-                        result = subprocess.run(
-                            ['python', 'deep_sectoral_analysis.py'],
-                            cwd=os.getcwd(),
-                            capture_output=True,
-                            text=True,
-                            timeout=600
-                        )
+                        result = self.run_script(['deep_sectoral_analysis.py'], timeout=600)
                         if result.returncode == 0:
                             st.success("✅ Analizy odświeżone!")
                             st.rerun()
@@ -1435,7 +1513,7 @@ class StreamlitDashboard:
                 st.download_button(
                     label="📦 Pobierz Wszystkie",
                     data=json.dumps(comprehensive_data, indent=2, ensure_ascii=False),
-                    file_name=f"comprehensive_deep_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    file_name=f"comprehensive_deep_analysis_{file_stamp}.json",
                     mime="application/json",
                     key="download_all_deep_analyses"
                 )
@@ -1443,12 +1521,40 @@ class StreamlitDashboard:
         with col3:
             st.info("💡 Tip: Analizy fokusują się na interpretacji ZNACZENIA wypowiedzi autorów")
 
+    def run_script(self, args, timeout):
+        """Run a helper script without blocking the session, showing progress"""
+        import subprocess
+
+        progress = st.progress(0.0)
+        proc = subprocess.Popen(
+            ['python', *args],
+            cwd=os.getcwd(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        start = time.time()
+        try:
+            while True:
+                try:
+                    # Short communicate() timeouts keep draining the pipes
+                    stdout, stderr = proc.communicate(timeout=0.1)
+                    break
+                except subprocess.TimeoutExpired:
+                    elapsed = time.time() - start
+                    if elapsed > timeout:
+                        proc.kill()
+                        proc.communicate()
+                        raise subprocess.TimeoutExpired(proc.args, timeout)
+                    progress.progress(min(elapsed / timeout, 0.99))
+        finally:
+            progress.empty()
+
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
     def get_latest_processed_file(self):
         """Get path to latest processed file"""
-        processed_files = glob.glob('data/processed/analysis_*.json')
-        if not processed_files:
-            return None
-        return max(processed_files, key=os.path.getctime)
+        return _latest_processed()
 
     def run(self):
         """Main dashboard run method"""
@@ -1460,7 +1566,8 @@ class StreamlitDashboard:
         tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(["📊 Dashboard", "📱 Tweety", "🧠 Analiza", "📈 Wykresy", "🔍 Szczegóły", "🔥 Aktywność", "💼 Fund Manager", "🎯 Analiza Sektorowa"])
 
         with tab1:
-            self.render_main_metrics()
+            run_every = "30s" if st.session_state.get('auto_refresh') else None
+            st.fragment(self.render_main_metrics, run_every=run_every)()
 
         with tab2:
             self.render_categorized_tweets()
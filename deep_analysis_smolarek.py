@@ -3,56 +3,83 @@
 
 import os
 import sys
-import json
 from datetime import datetime
 
+from src.utils import read_json
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole dump
+    ijson = None
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-def extract_tweet_texts(json_file):
-    """Wydobywa teksty tweetów do głębokiej analizy"""
+EQ80 = '=' * 80
+DASH80 = '-' * 80
+
+TWEET_TEMPLATE = (
+    "\n[TWEET {i}]\n"
+    "Data: {date}\n"
+    "Wyświetlenia: {views:,} | Polubienia: {likes:,} | Retweety: {retweets:,}\n"
+    f"{DASH80}\n"
+    "{text}\n"
+    f"{EQ80}\n"
+)
+
+# Tweets buffered before each write to the output file
+WRITE_BATCH = 500
 
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
 
-    tweets = data.get('tweets', [])
+def iter_tweets(json_file):
+    """Yield tweets from a dump, streaming them with ijson when available"""
+    if ijson is None:
+        yield from read_json(json_file).get('tweets', [])
+        return
+
+    with open(json_file, 'rb') as f:
+        yield from ijson.items(f, 'tweets.item')
+
+
+def extract_tweet_texts(json_file):
+    """Wydobywa teksty tweetów do głębokiej analizy"""
 
-    print("="*80)
+    print(EQ80)
     print("PEŁNE TEKSTY TWEETÓW T_SMOLAREK DO ANALIZY")
-    print("="*80)
-    print(f"\nLiczba tweetów: {len(tweets)}\n")
+    print(EQ80)
 
     output_file = f"data/analysis/smolarek_tweets_full_text_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
     os.makedirs('data/analysis', exist_ok=True)
 
+    count = 0
     with open(output_file, 'w', encoding='utf-8') as out:
-        out.write("="*80 + "\n")
-        out.write("WSZYSTKIE TWEETY T_SMOLAREK - PEŁNA TREŚĆ\n")
-        out.write("="*80 + "\n\n")
-
-        for i, tweet in enumerate(tweets, 1):
-            text = tweet.get('text', '')
-            date = tweet.get('createdAt', 'N/A')
-            likes = tweet.get('likeCount', 0)
-            views = tweet.get('viewCount', 0)
-            retweets = tweet.get('retweetCount', 0)
-
-            tweet_info = f"\n[TWEET {i}]\n"
-            tweet_info += f"Data: {date}\n"
-            tweet_info += f"Wyświetlenia: {views:,} | Polubienia: {likes:,} | Retweety: {retweets:,}\n"
-            tweet_info += f"{'-'*80}\n"
-            tweet_info += f"{text}\n"
-            tweet_info += f"{'='*80}\n"
-
-            out.write(tweet_info)
-
-            # Also print to console (limited)
-            if i <= 5:  # Print first 5 to console
-                print(tweet_info)
-
-        if len(tweets) > 5:
-            print(f"\n... (pozostałe {len(tweets) - 5} tweetów zapisane w pliku)\n")
+        # Tweets are parsed and written in batches so the dump is never fully in memory
+        parts = [f"{EQ80}\nWSZYSTKIE TWEETY T_SMOLAREK - PEŁNA TREŚĆ\n{EQ80}\n\n"]
+        for count, tweet in enumerate(iter_tweets(json_file), 1):
+            tweet_info = TWEET_TEMPLATE.format(
+                i=count,
+                date=tweet.get('createdAt', 'N/A'),
+                views=tweet.get('viewCount', 0),
+                likes=tweet.get('likeCount', 0),
+                retweets=tweet.get('retweetCount', 0),
+                text=tweet.get('text', '')
+            )
+            parts.append(tweet_info)
+
+            # Also print to console (first 5 tweets only)
+            if count <= 5:
+                sys.stdout.write(tweet_info + "\n")
+
+            if len(parts) >= WRITE_BATCH:
+                out.write("".join(parts))
+                parts.clear()
+
+        out.write("".join(parts))
+
+    if count > 5:
+        print(f"\n... (pozostałe {count - 5} tweetów zapisane w pliku)\n")
+    print(f"\nLiczba tweetów: {count}")
 
     print(f"\n✓ Pełne teksty zapisane do: {output_file}")
     return output_file
@@ -6,64 +6,50 @@ Analiza semantyczna i konfrontacyjna poglądów ekspertów
 """
 
 import os
-import json
 import time
+import asyncio
+from collections import defaultdict, deque
 from datetime import datetime
 from dotenv import load_dotenv
+import numpy as np
 import anthropic
 
-load_dotenv()
-
-def load_comprehensive_tweets():
-    """Load tweets from comprehensive cache"""
-    try:
-        with open('data/raw/comprehensive_tweets_current.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('tweets_by_category', {})
-    except Exception as e:
-        print(f"[ERROR] Błąd ładowania tweetów: {e}")
-        return None
-
-def analyze_sector_with_claude(sector_name, tweets, claude_client):
-    """Analiza sektora z wykorzystaniem Claude AI"""
-
-    if not tweets:
-        return None
+from src.sector_analysis_cache import SectorAnalysisCache
+from src.utils import (
+    hash_json, read_json, read_json_mapped, write_json, dumps_json, resolve_json_path, json_output_path,
+    compressing_writer, write_json_zst
+)
 
-    print(f"[ANALIZA] {sector_name}: {len(tweets)} tweetów od {len(set(t.get('username', '') for t in tweets))} autorów")
-
-    # Prepare tweet content for analysis
-    tweets_content = ""
-    authors_viewpoints = {}
-
-    for tweet in tweets[:50]:  # Limit to most relevant tweets
-        username = tweet.get('username', 'unknown')
-        text = tweet.get('text', '')
-        engagement = tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
-
-        if username not in authors_viewpoints:
-            authors_viewpoints[username] = []
-
-        authors_viewpoints[username].append({
-            'text': text,
-            'engagement': engagement
-        })
-
-        tweets_content += f"\n@{username}: {text}\n"
-
-    # Create comprehensive analysis prompt
-    prompt = f"""# GŁĘBOKA ANALIZA SEKTOROWA: {sector_name.upper()}
-
-## ZADANIE ANALITYCZNE
-Przeanalizuj wypowiedzi ekspertów z sektora {sector_name} i wykonaj głęboką interpretację semantyczną ich poglądów.
-
-## DANE DO ANALIZY:
-{tweets_content}
-
-## AUTORZY I ICH POGLĄDY:
-{json.dumps(authors_viewpoints, indent=2, ensure_ascii=False)}
+load_dotenv()
 
-## WYMAGANIA ANALIZY:
+MAX_OUTPUT_TOKENS = 8000
+MAX_CONCURRENT_SECTORS = 4
+CHARS_PER_TOKEN = 4  # rough estimate used for rate-limit budgeting
+
+# Account limits for the rolling 60s window (kept 10% below to avoid 429s)
+TPM_LIMIT = int(os.getenv('CLAUDE_TPM_LIMIT', '40000'))
+RPM_LIMIT = int(os.getenv('CLAUDE_RPM_LIMIT', '50'))
+RATE_LIMIT_HEADROOM = 0.9
+
+# Input budget for tweet content per sector; tweets are capped at the
+# original 280-character limit and taken best-first while they fit
+TWEET_TOKEN_BUDGET = 3500
+MAX_TWEET_CHARS = 280
+
+# Latest Claude models first
+MODELS_TO_TRY = [
+    "claude-3-5-sonnet-20241022",
+    "claude-3-5-sonnet-20240620",
+    "claude-3-5-haiku-20241022",
+    "claude-3-haiku-20240307"
+]
+COMPREHENSIVE_FILE = 'data/analysis/deep_sectoral_analysis_comprehensive.json'
+WORKING_MODEL_FILE = 'data/cache/working_model.json'
+WORKING_MODEL_TTL = 24 * 3600
+DEAD_MODELS_FILE = 'data/cache/claude_dead_models.json'
+
+# Static analysis rubric shared by every sector, sent as a prompt-cached prefix
+RUBRIC_STATIC = """## WYMAGANIA ANALIZY:
 
 ### 1. SEMANTYCZNA INTERPRETACJA WYPOWIEDZI
 - Wydobądź kluczowe tezy i poglądy każdego autora
@@ -90,83 +76,408 @@ Przeanalizuj wypowiedzi ekspertów z sektora {sector_name} i wykonaj głęboką
 - Jakie są blind spots w analizie sektora?
 
 ## FORMAT ODPOWIEDZI (JSON):
-{{
-    "sector_overview": {{
-        "name": "{sector_name}",
-        "total_tweets": {len(tweets)},
-        "unique_authors": {len(authors_viewpoints)},
+{
+    "sector_overview": {
+        "name": "nazwa sektora",
+        "total_tweets": 0,
+        "unique_authors": 0,
         "dominant_themes": ["temat1", "temat2", "temat3"]
-    }},
-    "authors_analysis": {{
-        "author1": {{
+    },
+    "authors_analysis": {
+        "author1": {
             "key_positions": ["teza1", "teza2"],
             "confidence_level": "high/medium/low",
             "unique_insights": ["insight1", "insight2"],
             "potential_biases": ["bias1", "bias2"]
-        }}
-    }},
-    "viewpoints_confrontation": {{
+        }
+    },
+    "viewpoints_confrontation": {
         "major_agreements": ["zgoda1", "zgoda2"],
         "major_disagreements": ["spór1", "spór2"],
         "unresolved_tensions": ["napięcie1", "napięcie2"],
         "synthesis": "główna synteza poglądów"
-    }},
-    "investment_implications": {{
+    },
+    "investment_implications": {
         "actionable_insights": ["insight1", "insight2"],
         "contrarian_opportunities": ["okazja1", "okazja2"],
         "risk_warnings": ["ryzyko1", "ryzyko2"],
         "timing_indicators": ["timing1", "timing2"]
-    }},
-    "competitive_intelligence": {{
+    },
+    "competitive_intelligence": {
         "market_blind_spots": ["blind_spot1", "blind_spot2"],
         "emerging_narratives": ["narracja1", "narracja2"],
         "author_credibility_ranking": ["author1", "author2", "author3"],
         "predictive_value": "ocena wartości predykcyjnej analizy"
-    }}
-}}
+    }
+}
 
 Skoncentruj się na ZNACZENIU i INTERPRETACJI, nie na liczeniu słów kluczowych. Chcę zrozumieć co autorzy NAPRAWDĘ myślą i jak ich poglądy się ze sobą konfrontują."""
 
+# First model that answered the availability probe, shared by all sectors
+_MODEL_PROBE_CACHE = {}
+_MODEL_PROBE_LOCK = asyncio.Lock()
+
+# Models that returned 404/not_found -> time marked dead (persisted for 24h);
+# rate limits and server errors are transient and never land here
+_DEAD_MODELS = None
+_TRANSIENT_ERRORS = (anthropic.RateLimitError, anthropic.InternalServerError, anthropic.APIConnectionError)
+
+
+class RateLimiter:
+    """Proaktywny limiter tokenów i zapytań (TPM/RPM)
+
+    Zamiast stałej przerwy między sektorami śledzimy zużycie w oknie
+    ostatnich 60 sekund oraz budżet z nagłówków anthropic-ratelimit-*,
+    i czekamy tylko wtedy, gdy kolejne zapytanie by go przekroczyło.
+    """
+
+    def __init__(self, tpm_limit=TPM_LIMIT, rpm_limit=RPM_LIMIT):
+        self.tpm_limit = tpm_limit
+        self.rpm_limit = rpm_limit
+        self.window = deque()  # [timestamp, tokens] per request in the last 60s
+        self.remaining_tokens = None  # unknown until the first response
+        self.reset_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _window_wait(self, estimated_tokens):
+        now = time.time()
+        while self.window and self.window[0][0] + 60 <= now:
+            self.window.popleft()
+        if not self.window:
+            return 0.0
+        tokens_in_window = sum(tokens for _, tokens in self.window)
+        if (tokens_in_window + estimated_tokens > self.tpm_limit * RATE_LIMIT_HEADROOM
+                or len(self.window) + 1 > self.rpm_limit * RATE_LIMIT_HEADROOM):
+            return self.window[0][0] + 60 - now
+        return 0.0
+
+    async def acquire(self, estimated_tokens):
+        """Wait until the request fits the budget; returns its window entry"""
+        async with self._lock:
+            if self.remaining_tokens is not None and self.remaining_tokens < estimated_tokens:
+                wait = self.reset_at - time.time()
+                if wait > 0:
+                    print(f"[RATE LIMIT] Czekam {wait:.1f}s na odnowienie limitu tokenów")
+                    await asyncio.sleep(wait)
+                self.remaining_tokens = None
+            if self.remaining_tokens is not None:
+                self.remaining_tokens -= estimated_tokens
+
+            wait = self._window_wait(estimated_tokens)
+            while wait > 0:
+                print(f"[RATE LIMIT] Budżet TPM/RPM wyczerpany, czekam {wait:.1f}s")
+                await asyncio.sleep(wait)
+                wait = self._window_wait(estimated_tokens)
+
+            entry = [time.time(), estimated_tokens]
+            self.window.append(entry)
+            return entry
+
+    def update(self, headers, entry=None, usage=None):
+        """Refresh budget from response headers and replace the estimate with real usage"""
+        if entry is not None and usage is not None:
+            entry[1] = usage.input_tokens + usage.output_tokens
+        try:
+            remaining = headers.get('anthropic-ratelimit-tokens-remaining')
+            if remaining is not None:
+                self.remaining_tokens = int(remaining)
+            reset = headers.get('anthropic-ratelimit-tokens-reset')
+            if reset:
+                self.reset_at = datetime.fromisoformat(reset.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+
+
+async def gather_with_limits(coros, limit=MAX_CONCURRENT_SECTORS):
+    """asyncio.gather with at most `limit` coroutines in flight"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros))
+
+
+def _dead_models():
+    global _DEAD_MODELS
+    if _DEAD_MODELS is None:
+        try:
+            saved = read_json(DEAD_MODELS_FILE)
+        except (OSError, ValueError):
+            saved = {}
+        now = time.time()
+        _DEAD_MODELS = {model: ts for model, ts in saved.items() if now - ts < WORKING_MODEL_TTL}
+    return _DEAD_MODELS
+
+
+def _mark_model_dead(model):
+    """Remember a model that does not exist so no later call or run retries it"""
+    dead = _dead_models()
+    dead[model] = time.time()
+    if _MODEL_PROBE_CACHE.get('claude') == model:
+        del _MODEL_PROBE_CACHE['claude']
+    os.makedirs(os.path.dirname(DEAD_MODELS_FILE), exist_ok=True)
+    write_json(DEAD_MODELS_FILE, dead, indent=False)
+
+
+async def _resolve_working_model(client):
+    """Pin the first available model (probed once, persisted for 24h)"""
+    async with _MODEL_PROBE_LOCK:
+        if 'claude' in _MODEL_PROBE_CACHE:
+            return _MODEL_PROBE_CACHE['claude']
+
+        dead = _dead_models()
+
+        try:
+            saved = read_json(WORKING_MODEL_FILE)
+            if (saved.get('model') in MODELS_TO_TRY and saved['model'] not in dead
+                    and time.time() - saved.get('checked_at', 0) < WORKING_MODEL_TTL):
+                _MODEL_PROBE_CACHE['claude'] = saved['model']
+                return saved['model']
+        except (OSError, ValueError):
+            pass
+
+        for model in MODELS_TO_TRY:
+            if model in dead:
+                continue
+            try:
+                print(f"[CLAUDE] Sprawdzam dostępność modelu: {model}")
+                await client.messages.create(
+                    model=model,
+                    max_tokens=1,
+                    messages=[{"role": "user", "content": "ping"}]
+                )
+            except anthropic.NotFoundError as e:
+                print(f"[FAIL] Model {model} nie istnieje: {e}")
+                _mark_model_dead(model)
+                continue
+            except _TRANSIENT_ERRORS as e:
+                print(f"[FAIL] Model {model} chwilowo niedostępny: {e}")
+                continue
+            except Exception as e:
+                print(f"[FAIL] Model {model} niedostępny: {e}")
+                continue
+
+            _MODEL_PROBE_CACHE['claude'] = model
+            os.makedirs(os.path.dirname(WORKING_MODEL_FILE), exist_ok=True)
+            write_json(WORKING_MODEL_FILE, {'model': model, 'checked_at': time.time()}, indent=False)
+            return model
+
+        return None
+
+
+def score_and_topk(likes, rts, k):
+    """Indices of the k highest like + 2*retweet scores, best first
+
+    argpartition keeps the selection O(N) on large sector dumps; only the
+    k winners get sorted.
+    """
+    scores = likes + 2 * rts
+    if k < len(scores):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx], kind='stable')]
+
+
+def load_comprehensive_tweets():
+    """Load tweets from comprehensive cache"""
+    try:
+        path = resolve_json_path('data/raw/comprehensive_tweets_current.json')
+        if path is None:
+            print("[ERROR] Brak pliku comprehensive_tweets_current.json")
+            return None
+        data = read_json_mapped(path)
+        return data.get('tweets_by_category', {})
+    except Exception as e:
+        print(f"[ERROR] Błąd ładowania tweetów: {e}")
+        return None
+
+def select_sector_tweets(tweets):
+    """Most engaging tweets of a sector that fit the token budget
+
+    Tweets are taken in score order, each distinct tweet once, until the
+    next one's (truncated) text would overflow TWEET_TOKEN_BUDGET. Returns
+    the selected tweets and their like + retweet engagement.
+    """
+    likes = np.fromiter((t.get('like_count', 0) for t in tweets), dtype=np.int64, count=len(tweets))
+    rts = np.fromiter((t.get('retweet_count', 0) for t in tweets), dtype=np.int64, count=len(tweets))
+    # Every tweet costs at least one token, so no more than the budget can fit
+    ranked = score_and_topk(likes, rts, TWEET_TOKEN_BUDGET)
+
+    top_idx, used, seen = [], 0, set()
+    for i in ranked:
+        key = tweet_key(tweets[i])
+        if key in seen:
+            continue
+        seen.add(key)
+        cost = max(1, len(tweets[i].get('text', '')[:MAX_TWEET_CHARS]) // CHARS_PER_TOKEN)
+        if used + cost > TWEET_TOKEN_BUDGET:
+            break
+        used += cost
+        top_idx.append(i)
+
+    engagement = (likes + rts)[top_idx]
+    return [tweets[i] for i in top_idx], engagement.tolist()
+
+
+def tweet_key(tweet):
+    """Identity of a tweet for deduplication (content hash when the cache has no tweet_id)"""
+    return str(tweet.get('tweet_id') or hash_json([tweet.get('username', ''), tweet.get('text', '')])[:16])
+
+
+async def analyze_sector_with_claude(sector_name, tweets, selected, engagement, claude_client, limiter, cache=None):
+    """Analiza sektora z wykorzystaniem Claude AI"""
+
+    if not tweets:
+        return None
+
+    # Group the analyzed tweets per author in one pass: (text, engagement)
+    grouped = defaultdict(list)
+    for tweet, tweet_engagement in zip(selected, engagement):
+        grouped[tweet.get('username', 'unknown')].append((tweet.get('text', '')[:MAX_TWEET_CHARS], tweet_engagement))
+
+    tweets_content = "\n".join(
+        f"@{username} ({score}): {text}" for username, posts in grouped.items() for text, score in posts
+    )
+    authors = list(grouped.keys())
+
+    print(f"[ANALIZA] {sector_name}: {len(tweets)} tweetów od {len(grouped)} autorów")
+
+    # Per-sector tail; the shared rubric goes first as a cached prefix
+    sector_prompt = f"""# GŁĘBOKA ANALIZA SEKTOROWA: {sector_name.upper()}
+
+## ZADANIE ANALITYCZNE
+Przeanalizuj wypowiedzi ekspertów z sektora {sector_name} i wykonaj głęboką interpretację semantyczną ich poglądów zgodnie z powyższymi wymaganiami.
+W "sector_overview" podaj: name = "{sector_name}", total_tweets = {len(tweets)}, unique_authors = {len(authors)}.
+
+## DANE DO ANALIZY (w nawiasie zaangażowanie: polubienia + retweety):
+{tweets_content}"""
+
+    # Cached prefix reads still count towards the input-token limit
+    estimated_tokens = (len(RUBRIC_STATIC) + len(sector_prompt)) // CHARS_PER_TOKEN + MAX_OUTPUT_TOKENS
+
     try:
-        # Try latest Claude models first
-        models_to_try = [
-            "claude-3-5-sonnet-20241022",
-            "claude-3-5-sonnet-20240620",
-            "claude-3-5-haiku-20241022",
-            "claude-3-haiku-20240307"
-        ]
-
-        for model in models_to_try:
+        embedding = None
+        if cache is not None:
+            cached, embedding = cache.lookup(sector_name, selected, MODELS_TO_TRY, tweets_content)
+            if cached:
+                print(f"[CACHE] {sector_name}: analiza z cache ({cached.get('model_used')})")
+                return cached
+
+        while True:
+            model = await _resolve_working_model(claude_client)
+            if model is None:
+                print(f"[ERROR] Wszystkie modele Claude zawiodły dla sektora {sector_name}")
+                return None
+
+            print(f"[CLAUDE] Analizuję {sector_name} modelem: {model}")
+            window_entry = await limiter.acquire(estimated_tokens)
             try:
-                print(f"[CLAUDE] Próbuję model: {model}")
-                response = claude_client.messages.create(
+                raw_response = await claude_client.messages.with_raw_response.create(
                     model=model,
-                    max_tokens=8000,
+                    max_tokens=MAX_OUTPUT_TOKENS,
                     temperature=0.2,
                     messages=[{
                         "role": "user",
-                        "content": prompt
+                        "content": [
+                            {"type": "text", "text": RUBRIC_STATIC, "cache_control": {"type": "ephemeral"}},
+                            {"type": "text", "text": sector_prompt}
+                        ]
                     }]
                 )
-
-                print(f"[SUCCESS] Analiza sektora {sector_name} ukończona z modelem {model}")
-                return {
-                    "model_used": model,
-                    "analysis": response.content[0].text,
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            except Exception as e:
-                print(f"[FAIL] Model {model} failed: {e}")
+            except anthropic.NotFoundError as e:
+                # Pinned model was retired mid-run: drop it and re-probe
+                print(f"[FAIL] Model {model} nie istnieje: {e}")
+                _mark_model_dead(model)
                 continue
-
-        print(f"[ERROR] Wszystkie modele Claude zawiodły dla sektora {sector_name}")
-        return None
+            break
+
+        response = await raw_response.parse()
+        limiter.update(raw_response.headers, window_entry, response.usage)
+        print(f"[CLAUDE] {sector_name}: cache_read_input_tokens="
+              f"{getattr(response.usage, 'cache_read_input_tokens', 0) or 0}")
+
+        print(f"[SUCCESS] Analiza sektora {sector_name} ukończona z modelem {model}")
+        result = {
+            "model_used": model,
+            "analysis": response.content[0].text,
+            "timestamp": datetime.now().isoformat()
+        }
+        if cache is not None:
+            cache.put(sector_name, selected, model, result, embedding)
+        return result
 
     except Exception as e:
         print(f"[ERROR] Błąd analizy Claude dla {sector_name}: {e}")
         return None
 
+class ComprehensiveReportWriter:
+    """Streams sector analyses into the comprehensive report as they finish
+
+    Each analysis is written (under a lock) as soon as its sector completes,
+    so the full report never has to be held in memory. The file is built
+    under a temporary name (zstd-compressed when available) and moved into
+    place on close.
+    """
+
+    def __init__(self, path):
+        self.path = json_output_path(path)
+        self.tmp_path = self.path + '.tmp'
+        self.sectors = []
+        self._lock = asyncio.Lock()
+        self._file = compressing_writer(open(self.tmp_path, 'wb'))
+        self._file.write(b'{\n"sectoral_analyses": {')
+
+    async def add(self, sector, analysis):
+        async with self._lock:
+            separator = ',\n' if self.sectors else '\n'
+            chunk = f"{separator}{dumps_json(sector)}: {dumps_json(analysis, indent=True)}"
+            await asyncio.to_thread(self._file.write, chunk.encode('utf-8'))
+            self.sectors.append(sector)
+
+    def close(self, metadata):
+        self._file.write(f'\n}},\n"analysis_metadata": {dumps_json(metadata, indent=True)}\n}}\n'.encode('utf-8'))
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+
+
+async def _analyze_and_save(sector, tweets, selected, engagement, claude_client, limiter, cache, report):
+    print(f"\n--- ROZPOCZYNAM ANALIZĘ: {sector.upper()} ---")
+
+    analysis = await analyze_sector_with_claude(
+        sector, tweets, selected, engagement, claude_client, limiter, cache
+    )
+
+    if analysis:
+        # Save individual sector analysis off the event loop (compact: it is a cache
+        # read by the dashboards; the comprehensive report stays pretty-printed)
+        sector_file = await asyncio.to_thread(
+            write_json_zst, f'data/analysis/deep_analysis_{sector.lower()}.json', analysis, False
+        )
+        print(f"[SAVED] {sector_file}")
+        await report.add(sector, analysis)
+    else:
+        print(f"[FAILED] Analiza sektora {sector} nie powiodła się")
+
+
+async def _analyze_all_sectors(tweets_by_category, claude_client, report):
+    limiter = RateLimiter()
+    cache = SectorAnalysisCache()
+
+    tasks = []
+    for sector, tweets in tweets_by_category.items():
+        if not tweets:
+            print(f"[SKIP] {sector}: Brak tweetów")
+            continue
+        selected, engagement = select_sector_tweets(tweets)
+        tasks.append(_analyze_and_save(sector, tweets, selected, engagement, claude_client, limiter, cache, report))
+
+    await gather_with_limits(tasks)
+    print(f"[CACHE] {cache.stats()}")
+
+
 def run_deep_sectoral_analysis():
     """Main function to run deep sectoral analysis"""
 
@@ -181,66 +492,46 @@ def run_deep_sectoral_analysis():
 
     # Initialize Claude client
     try:
-        claude_client = anthropic.Anthropic(api_key=os.getenv('CLAUDE_API_KEY'))
+        claude_client = anthropic.AsyncAnthropic(
+            api_key=os.getenv('CLAUDE_API_KEY'),
+            default_headers={"anthropic-beta": "prompt-caching-2024-07-31"}
+        )
     except Exception as e:
         print(f"[ERROR] Nie można zainicjalizować klienta Claude: {e}")
         return None
 
-    # Analyze each sector
-    sectoral_analyses = {}
+    os.makedirs('data/analysis', exist_ok=True)
 
-    for sector, tweets in tweets_by_category.items():
-        if not tweets:
-            print(f"[SKIP] {sector}: Brak tweetów")
-            continue
-
-        print(f"\n--- ROZPOCZYNAM ANALIZĘ: {sector.upper()} ---")
-
-        analysis = analyze_sector_with_claude(sector, tweets, claude_client)
-
-        if analysis:
-            sectoral_analyses[sector] = analysis
-
-            # Save individual sector analysis
-            sector_file = f'data/analysis/deep_analysis_{sector.lower()}.json'
-            os.makedirs('data/analysis', exist_ok=True)
-
-            with open(sector_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False)
-
-            print(f"[SAVED] {sector_file}")
-
-            # Rate limiting between requests
-            time.sleep(10)  # 10 seconds between sectors to respect rate limits
-        else:
-            print(f"[FAILED] Analiza sektora {sector} nie powiodła się")
-
-    # Create comprehensive report
-    comprehensive_report = {
-        "analysis_metadata": {
+    # Analyze sectors concurrently, streaming each result into the comprehensive report
+    report = ComprehensiveReportWriter(COMPREHENSIVE_FILE)
+    try:
+        asyncio.run(_analyze_all_sectors(tweets_by_category, claude_client, report))
+    finally:
+        analysis_metadata = {
             "timestamp": datetime.now().isoformat(),
-            "total_sectors_analyzed": len(sectoral_analyses),
+            "total_sectors_analyzed": len(report.sectors),
             "analysis_type": "deep_sectoral_semantic"
-        },
-        "sectoral_analyses": sectoral_analyses
-    }
+        }
+        report.close(analysis_metadata)
 
-    # Save comprehensive analysis
-    comprehensive_file = 'data/analysis/deep_sectoral_analysis_comprehensive.json'
-    with open(comprehensive_file, 'w', encoding='utf-8') as f:
-        json.dump(comprehensive_report, f, indent=2, ensure_ascii=False)
+    if not report.sectors:
+        print(f"\n[ERROR] Żaden z {len(tweets_by_category)} sektorów nie został przeanalizowany")
+        return None
 
-    print(f"\n[SUCCESS] Kompletna analiza zapisana: {comprehensive_file}")
-    print(f"[STATS] Przeanalizowano {len(sectoral_analyses)} sektorów")
+    print(f"\n[SUCCESS] Kompletna analiza zapisana: {report.path}")
+    print(f"[STATS] Przeanalizowano {len(report.sectors)} sektorów")
 
-    return comprehensive_report
+    return {
+        "analysis_metadata": analysis_metadata,
+        "sectors_analyzed": report.sectors
+    }
 
 if __name__ == "__main__":
     result = run_deep_sectoral_analysis()
 
     if result:
         print("\n=== PODSUMOWANIE ===")
-        for sector in result['sectoral_analyses'].keys():
+        for sector in result['sectors_analyzed']:
             print(f"✓ {sector}: Analiza semantyczna ukończona")
         print(f"\n[READY] Głębokie analizy sektorowe gotowe!")
         print("Sprawdź pliki w folderze data/analysis/")
@@ -2,15 +2,58 @@
 """
 Fetch 100 tweets from kot_b0t using Twitter API v2 with pagination
 """
+import os
 import requests
 import json
 import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
 
 # Configuration
 USER_ID = "1222026166241902592"  # kot_b0t
-BEARER_TOKEN = "AAAAAAAAAAAAAAAAAAAAAAEK4QEAAAAAViLvNU%2FIgR%2FwwQOy2wy63iRey08%3DgTgI2xoNKbKd9lNMN2vFRpM8cJAqiW2eAzdu9eWG472mb1xpSv"
+BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN")
 OUTPUT_FILE = "data/cache/kot_b0t_100_tweets.json"
+POLITE_DELAY = 1.5  # seconds between pages, plus up to POLITE_JITTER
+POLITE_JITTER = 1.0
+
+# Shared session: pagination requests reuse one pooled TLS connection
+SESSION = requests.Session()
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+@dataclass
+class RateLimitState:
+    """x-rate-limit-* headers from the last Twitter API response"""
+    remaining: Optional[int] = None
+    reset: Optional[int] = None
+
+    @classmethod
+    def from_headers(cls, headers):
+        remaining = headers.get("x-rate-limit-remaining")
+        reset = headers.get("x-rate-limit-reset")
+        return cls(
+            remaining=int(remaining) if remaining is not None else None,
+            reset=int(reset) if reset is not None else None
+        )
+
+    def wait_seconds(self):
+        """Seconds until the window resets (60s if the API did not say)"""
+        if self.reset is None:
+            return 60
+        return max(1, self.reset - int(time.time()))
+
+
+def _get_page(url, headers, params, delay=0.0):
+    """GET one timeline page, optionally after a delay (runs in the prefetch worker)"""
+    if delay:
+        time.sleep(delay)
+    return SESSION.get(url, headers=headers, params=params, timeout=30)
+
 
 def fetch_tweets(user_id, bearer_token, max_results=100):
     """Fetch tweets using Twitter API v2"""
@@ -33,47 +76,63 @@ def fetch_tweets(user_id, bearer_token, max_results=100):
 
     print(f"Starting to fetch up to {max_results} tweets...")
 
-    while len(all_tweets) < max_results and request_count < max_requests:
-        request_count += 1
-
-        try:
-            print(f"\nRequest #{request_count}: Fetching tweets...")
-            response = requests.get(url, headers=headers, params=params, verify=False)
-
-            if response.status_code == 429:
-                print("Rate limit hit! Waiting 60 seconds...")
-                time.sleep(60)
-                continue
-
-            if response.status_code != 200:
-                print(f"Error: {response.status_code}")
-                print(response.text)
-                break
-
-            data = response.json()
-
-            if "data" not in data:
-                print("No data in response")
+    # One background worker keeps the next page request (and the polite delay
+    # before it) in flight while the current page is being processed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(_get_page, url, headers, dict(params))
+
+        while pending is not None:
+            request_count += 1
+
+            try:
+                print(f"\nRequest #{request_count}: Fetching tweets...")
+                response = pending.result()
+                pending = None
+
+                rate_limit = RateLimitState.from_headers(response.headers)
+
+                if response.status_code == 429:
+                    wait = rate_limit.wait_seconds()
+                    print(f"Rate limit hit! Waiting {wait} seconds until reset...")
+                    if request_count < max_requests:
+                        pending = executor.submit(_get_page, url, headers, dict(params), wait)
+                    continue
+
+                if response.status_code != 200:
+                    print(f"Error: {response.status_code}")
+                    print(response.text)
+                    break
+
+                data = response.json()
+
+                if "data" not in data:
+                    print("No data in response")
+                    break
+
+                tweets = data["data"]
+                next_token = data.get("meta", {}).get("next_token")
+
+                # Check if there's more data and fire the next request right away
+                if next_token and len(all_tweets) + len(tweets) < max_results and request_count < max_requests:
+                    params["pagination_token"] = next_token
+                    print(f"More data available, continuing...")
+                    if rate_limit.remaining == 0:
+                        # Quota exhausted: pause until reset instead of provoking a 429
+                        delay = rate_limit.wait_seconds()
+                        print(f"Rate limit exhausted, waiting {delay} seconds until reset...")
+                    else:
+                        delay = POLITE_DELAY + random.uniform(0, POLITE_JITTER)
+                    pending = executor.submit(_get_page, url, headers, dict(params), delay)
+                elif not next_token:
+                    print("No more tweets available")
+
+                all_tweets.extend(tweets)
+                print(f"Fetched {len(tweets)} tweets (Total: {len(all_tweets)})")
+
+            except Exception as e:
+                print(f"Exception: {e}")
                 break
 
-            tweets = data["data"]
-            all_tweets.extend(tweets)
-
-            print(f"Fetched {len(tweets)} tweets (Total: {len(all_tweets)})")
-
-            # Check if there's more data
-            if "meta" in data and "next_token" in data["meta"]:
-                params["pagination_token"] = data["meta"]["next_token"]
-                print(f"More data available, continuing...")
-                time.sleep(2)  # Small delay between requests
-            else:
-                print("No more tweets available")
-                break
-
-        except Exception as e:
-            print(f"Exception: {e}")
-            break
-
     return all_tweets
 
 def save_tweets(tweets, output_file):
@@ -82,15 +141,16 @@ def save_tweets(tweets, output_file):
     formatted_tweets = []
 
     for idx, tweet in enumerate(tweets, 1):
+        metrics = tweet.get("public_metrics", {})
         formatted_tweet = {
             "username": "kot_b0t",
             "user_name": "Kot Bot",
             "text": tweet.get("text", ""),
             "created_at": tweet.get("created_at", ""),
-            "like_count": tweet.get("public_metrics", {}).get("like_count", 0),
-            "retweet_count": tweet.get("public_metrics", {}).get("retweet_count", 0),
-            "reply_count": tweet.get("public_metrics", {}).get("reply_count", 0),
-            "view_count": tweet.get("public_metrics", {}).get("impression_count", 0),
+            "like_count": metrics.get("like_count", 0),
+            "retweet_count": metrics.get("retweet_count", 0),
+            "reply_count": metrics.get("reply_count", 0),
+            "view_count": metrics.get("impression_count", 0),
             "tweet_id": tweet.get("id", ""),
             "tweet_index": idx
         }
@@ -113,6 +173,10 @@ def main():
     print("Twitter Tweet Fetcher - kot_b0t (100 tweets)")
     print("=" * 60)
 
+    if not BEARER_TOKEN:
+        print("\nTWITTER_BEARER_TOKEN not found in environment variables")
+        return
+
     # Fetch tweets
     tweets = fetch_tweets(USER_ID, BEARER_TOKEN, max_results=100)
 
@@ -128,8 +192,4 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    # Disable SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
     main()
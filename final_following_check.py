@@ -9,9 +9,11 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Shared session with the API key baked in, so both lookups reuse one connection
+SESSION = requests.Session()
+SESSION.headers.update({'x-api-key': os.getenv('TWITTERAPI_IO_KEY')})
+
 def final_check():
-    api_key = os.getenv('TWITTERAPI_IO_KEY')
-    headers = {'x-api-key': api_key}
     base_url = "https://api.twitterapi.io"
 
     username = "elonmusk"
@@ -24,7 +26,7 @@ def final_check():
     params = {'userName': username}
 
     try:
-        response = requests.get(user_url, headers=headers, params=params, timeout=15)
+        response = SESSION.get(user_url, params=params, timeout=15)
         print(f"Status: {response.status_code}")
 
         if response.status_code == 200:
@@ -44,7 +46,7 @@ def final_check():
                 following_url = f"{base_url}/twitter/user/following"
                 following_params = {'userName': username}
 
-                following_response = requests.get(following_url, headers=headers, params=following_params, timeout=20)
+                following_response = SESSION.get(following_url, params=following_params, timeout=20)
                 print(f"Status: {following_response.status_code}")
 
                 if following_response.status_code == 200:
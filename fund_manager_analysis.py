@@ -4,12 +4,90 @@
 import os
 import json
 import re
+import shutil
+import time
 from datetime import datetime
+from functools import lru_cache
+import heapq
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from textblob import TextBlob
+import anthropic
+import numpy as np
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from claude_client import ClaudeAnalyst
+from src.utils import dumps_json, read_json_mapped, resolve_json_path, write_json
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole file
+    ijson = None
+
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:  # score with TextBlob instead
+    SentimentIntensityAnalyzer = None
+
+# Lexicon-only scorer tuned for social media text; much cheaper than TextBlob's parser
+_VADER = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer is not None else None
+
+# Financial keyword weighting, one alternation per list. Counts are the number
+# of distinct keywords found anywhere in the text (substring match).
+BULLISH_KEYWORDS = ['bull', 'buy', 'growth', 'up', 'rise', 'gain', 'positive', 'strong', 'beat', 'exceed', 'rally', 'surge', 'breakout']
+BEARISH_KEYWORDS = ['bear', 'sell', 'decline', 'down', 'fall', 'loss', 'negative', 'weak', 'miss', 'crash', 'dump', 'correction', 'recession']
+UNCERTAINTY_KEYWORDS = ['volatile', 'uncertain', 'risk', 'caution', 'watch', 'concern', 'worry', 'fear', 'doubt']
+
+_BULL_RE = re.compile('|'.join(map(re.escape, BULLISH_KEYWORDS)))
+_BEAR_RE = re.compile('|'.join(map(re.escape, BEARISH_KEYWORDS)))
+_UNCERTAINTY_RE = re.compile('|'.join(map(re.escape, UNCERTAINTY_KEYWORDS)))
+
+# Most engaging tweets per category sent to Claude (limit to avoid rate limits)
+CLAUDE_TWEETS_PER_CATEGORY = 15
+
+# Below this many tweets the local analysis is used without calling Claude
+MIN_TWEETS_FOR_CLAUDE = 5
+
+# Claude rate limit handling: exponential backoff, starting at RATE_LIMIT_BACKOFF seconds
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BACKOFF = 5
+
+# Key financial themes and the words that signal them
+MARKET_THEMES = {
+    'Federal Reserve': ['fed', 'federal reserve', 'fomc', 'powell', 'interest rate', 'monetary policy'],
+    'Inflation': ['inflation', 'cpi', 'pce', 'deflation', 'price'],
+    'Bitcoin/Crypto': ['bitcoin', 'btc', 'crypto', 'ethereum', 'blockchain'],
+    'China/Geopolitics': ['china', 'taiwan', 'ukraine', 'russia', 'war', 'sanctions'],
+    'AI/Technology': ['ai', 'artificial intelligence', 'tech', 'nvidia', 'apple', 'google'],
+    'Banking/Credit': ['bank', 'credit', 'lending', 'mortgage', 'debt'],
+    'Energy': ['oil', 'energy', 'gas', 'crude', 'opec'],
+    'Real Estate': ['real estate', 'housing', 'mortgage', 'property']
+}
+
+_THEMES_BY_KEYWORD = {}
+for _theme, _keywords in MARKET_THEMES.items():
+    for _keyword in _keywords:
+        _THEMES_BY_KEYWORD.setdefault(_keyword, []).append(_theme)
+
+_THEME_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in sorted(_THEMES_BY_KEYWORD, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+# Local (no Claude) signal words, matched as substrings like a plain `in` test.
+# The lookahead lets matches overlap, so no word hides another one.
+_LOCAL_SIGNALS = {
+    'buy': ['buy', 'bought', 'position', 'invest'],
+    'intel': ['intel', 'intc'],
+    'chips': ['nvda', 'nvidia', 'amd'],
+    'macro': ['rate', 'fed', 'federal reserve', 'interest'],
+    'crypto': ['crypto', 'bitcoin', 'btc'],
+    'real_estate': ['real estate', 'mortgage', 'refinance'],
+    'earnings': ['earnings', 'q3', 'quarter']
+}
+_LOCAL_GROUPS = {word: group for group, words in _LOCAL_SIGNALS.items() for word in words}
+_LOCAL_RE = re.compile('(?=(' + '|'.join(map(re.escape, _LOCAL_GROUPS)) + '))')
 
 def load_investment_prompt():
     """Load the professional investment analysis prompt"""
@@ -20,38 +98,37 @@ def load_investment_prompt():
         print(f"Warning: Could not load investment prompt: {e}")
         return None
 
-def analyze_tweets_with_claude(tweets_data):
-    """Use Claude AI to analyze tweet content and extract investment insights"""
-    try:
-        claude = ClaudeAnalyst()
+def analyze_tweets_with_claude(tweets_data, claude_candidates, claude=None):
+    """Use Claude AI to analyze tweet content and extract investment insights
 
-        # Intelligent data sampling for Claude - select best tweets per category
-        claude_tweets = []
-        max_tweets_per_category = 15  # Limit to avoid rate limits
+    claude_candidates maps each category to its most engaging tweets, as
+    collected by _single_pass_aggregate.
+    """
+    # Too little data to be worth a Claude call
+    if sum(len(tweets) for tweets in tweets_data.values()) < MIN_TWEETS_FOR_CLAUDE:
+        return create_local_content_analysis(tweets_data)
 
-        for category, tweets in tweets_data.items():
-            # Sort tweets by engagement (likes + retweets) to get most influential
-            sorted_tweets = sorted(tweets,
-                key=lambda x: x.get('like_count', 0) + x.get('retweet_count', 0),
-                reverse=True
-            )
+    try:
+        if claude is None:
+            claude = ClaudeAnalyst()
 
-            # Take top engaging tweets from this category
-            top_tweets = sorted_tweets[:max_tweets_per_category]
+        # Intelligent data sampling for Claude - best tweets per category
+        claude_tweets = []
 
+        for category, top_tweets in claude_candidates.items():
             for tweet in top_tweets:
                 claude_tweets.append({
                     'category': category,
                     'username': tweet.get('username', ''),
                     'text': tweet.get('text', '')[:400],  # Limit text length for token efficiency
-                    'engagement': tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
+                    'engagement': tweet['_eng']
                 })
 
         print(f"[CLAUDE] Selected {len(claude_tweets)} high-engagement tweets for analysis")
 
         # Further reduce if still too many
         if len(claude_tweets) > 60:  # Conservative limit
-            claude_tweets = sorted(claude_tweets, key=lambda x: x['engagement'], reverse=True)[:60]
+            claude_tweets = heapq.nlargest(60, claude_tweets, key=itemgetter('engagement'))
             print(f"[CLAUDE] Reduced to top {len(claude_tweets)} most engaging tweets")
 
         # Create prompt for Claude
@@ -59,7 +136,7 @@ def analyze_tweets_with_claude(tweets_data):
 Jako doświadczony zarządzający funduszem inwestycyjnym w stylu Ray Dalio, przeanalizuj poniższe tweety z różnych kategorii finansowych i wyciągnij konkretne wnioski inwestycyjne.
 
 TWEETY DO ANALIZY:
-{json.dumps(claude_tweets, indent=2, ensure_ascii=False)}
+{dumps_json(claude_tweets, indent=True)}
 
 Proszę o analizę która zawiera:
 
@@ -96,26 +173,29 @@ Odpowiedz w formacie JSON z kluczami: investment_insights, market_sentiment, rec
 
         response = None
         for model in models_to_try:
-            try:
-                print(f"Trying model: {model}")
-                # Add delay to avoid rate limits
-                import time
-                time.sleep(2)
-
-                response = claude.client.messages.create(
-                    model=model,
-                    max_tokens=1500,  # Reduced for efficiency
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                print(f"[OK] Success with model: {model}")
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                try:
+                    print(f"Trying model: {model}")
+                    response = claude.client.messages.create(
+                        model=model,
+                        max_tokens=1500,  # Reduced for efficiency
+                        messages=[{"role": "user", "content": prompt}]
+                    )
+                    print(f"[OK] Success with model: {model}")
+                    break
+                except anthropic.RateLimitError as model_error:
+                    # Only rate limits are worth waiting for; back off and retry the same model
+                    if attempt == RATE_LIMIT_RETRIES:
+                        print(f"[FAIL] Failed with {model}: {model_error}")
+                        break
+                    delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+                    print(f"[WAIT] Rate limited - waiting {delay} seconds...")
+                    time.sleep(delay)
+                except Exception as model_error:
+                    print(f"[FAIL] Failed with {model}: {model_error}")
+                    break
+            if response:
                 break
-            except Exception as model_error:
-                print(f"[FAIL] Failed with {model}: {model_error}")
-                # Wait longer if rate limited
-                if "rate_limit" in str(model_error):
-                    print("[WAIT] Rate limited - waiting 10 seconds...")
-                    time.sleep(10)
-                continue
 
         if not response:
             raise Exception("All Claude models failed")
@@ -123,12 +203,12 @@ Odpowiedz w formacie JSON z kluczami: investment_insights, market_sentiment, rec
         # Parse JSON response
         analysis_text = response.content[0].text
 
-        # Try to extract JSON from response
-        import re
-        json_match = re.search(r'\{.*\}', analysis_text, re.DOTALL)
-        if json_match:
+        # Try to extract JSON from response: first '{' through last '}'
+        start = analysis_text.find('{')
+        end = analysis_text.rfind('}')
+        if start != -1 and end > start:
             try:
-                claude_data = json.loads(json_match.group())
+                claude_data = json.loads(analysis_text[start:end + 1])
 
                 # Format Claude response for better readability
                 return {
@@ -281,28 +361,31 @@ def create_local_content_analysis(tweets_data):
 
     for category, tweets in tweets_data.items():
         for tweet in tweets:
-            text = tweet.get('text', '').lower()
+            # One scan of the lowercased text finds every signal group present
+            groups = {_LOCAL_GROUPS[word] for word in _LOCAL_RE.findall(tweet.get('text', '').lower())}
+            if not groups:
+                continue
 
             # Extract specific investment signals
-            if any(word in text for word in ['buy', 'bought', 'position', 'invest']):
-                if 'intel' in text or 'intc' in text:
+            if 'buy' in groups:
+                if 'intel' in groups:
                     investment_insights.append("Institutional interest in Intel (INTC) - semiconductor sector gaining traction")
-                if any(stock in text for stock in ['nvda', 'nvidia', 'amd']):
+                if 'chips' in groups:
                     investment_insights.append("AI/semiconductor momentum continues with institutional buying")
 
             # Market sentiment signals
-            if any(word in text for word in ['rate', 'fed', 'federal reserve', 'interest']):
+            if 'macro' in groups:
                 macro_indicators.append("Federal Reserve policy remains key market driver")
 
-            if any(word in text for word in ['crypto', 'bitcoin', 'btc']):
+            if 'crypto' in groups:
                 market_signals.append("Crypto sentiment mixed - risk-on asset behavior continues")
 
             # Real estate signals
-            if any(word in text for word in ['real estate', 'mortgage', 'refinance']):
+            if 'real_estate' in groups:
                 investment_insights.append("Real estate sector showing momentum with rate sensitivity")
 
             # Earnings and performance signals
-            if any(word in text for word in ['earnings', 'q3', 'quarter']):
+            if 'earnings' in groups:
                 recommendations.append("Monitor Q3 earnings season for sector rotation opportunities")
 
     return {
@@ -312,115 +395,172 @@ def create_local_content_analysis(tweets_data):
         "macro_signals": " | ".join(macro_indicators[:2]) if macro_indicators else "Federal Reserve policy expectations driving cross-asset correlations"
     }
 
-def analyze_sentiment_advanced(text):
-    """Advanced sentiment analysis with financial keywords"""
-    try:
+@lru_cache(maxsize=50000)
+def _analyze_sentiment_impl(text):
+    """Sentiment of one text; memoized since retweets and promos repeat verbatim"""
+    if _VADER is not None:
+        scores = _VADER.polarity_scores(text)
+        polarity = scores['compound']
+        subjectivity = 1 - scores['neu']
+    else:
         blob = TextBlob(text)
         polarity = blob.sentiment.polarity
         subjectivity = blob.sentiment.subjectivity
 
-        # Financial keyword weighting
-        bullish_keywords = ['bull', 'buy', 'growth', 'up', 'rise', 'gain', 'positive', 'strong', 'beat', 'exceed', 'rally', 'surge', 'breakout']
-        bearish_keywords = ['bear', 'sell', 'decline', 'down', 'fall', 'loss', 'negative', 'weak', 'miss', 'crash', 'dump', 'correction', 'recession']
-        uncertainty_keywords = ['volatile', 'uncertain', 'risk', 'caution', 'watch', 'concern', 'worry', 'fear', 'doubt']
-
-        text_lower = text.lower()
+    text_lower = text.lower()
 
-        bullish_count = sum(1 for keyword in bullish_keywords if keyword in text_lower)
-        bearish_count = sum(1 for keyword in bearish_keywords if keyword in text_lower)
-        uncertainty_count = sum(1 for keyword in uncertainty_keywords if keyword in text_lower)
+    bullish_count = len(set(_BULL_RE.findall(text_lower)))
+    bearish_count = len(set(_BEAR_RE.findall(text_lower)))
+    uncertainty_count = len(set(_UNCERTAINTY_RE.findall(text_lower)))
 
-        # Adjust polarity based on financial keywords
-        keyword_adjustment = (bullish_count - bearish_count) * 0.1
-        final_polarity = polarity + keyword_adjustment
+    # Adjust polarity based on financial keywords
+    keyword_adjustment = (bullish_count - bearish_count) * 0.1
+    final_polarity = polarity + keyword_adjustment
 
-        # Clamp to [-1, 1]
-        final_polarity = max(-1.0, min(1.0, final_polarity))
-
-        return {
-            'polarity': final_polarity,
-            'subjectivity': subjectivity,
-            'bullish_signals': bullish_count,
-            'bearish_signals': bearish_count,
-            'uncertainty_signals': uncertainty_count
-        }
-    except:
-        return {'polarity': 0.0, 'subjectivity': 0.5, 'bullish_signals': 0, 'bearish_signals': 0, 'uncertainty_signals': 0}
+    # Clamp to [-1, 1]
+    final_polarity = max(-1.0, min(1.0, final_polarity))
 
-def extract_market_themes(tweets_data):
-    """Extract key market themes from all tweets"""
-    all_text = ""
-
-    for category, tweets in tweets_data.items():
-        for tweet in tweets:
-            all_text += " " + tweet.get('text', '')
-
-    # Key financial themes
-    themes = {
-        'Federal Reserve': len(re.findall(r'\b(fed|federal reserve|fomc|powell|interest rate|monetary policy)\b', all_text, re.IGNORECASE)),
-        'Inflation': len(re.findall(r'\b(inflation|cpi|pce|deflation|price)\b', all_text, re.IGNORECASE)),
-        'Bitcoin/Crypto': len(re.findall(r'\b(bitcoin|btc|crypto|ethereum|blockchain)\b', all_text, re.IGNORECASE)),
-        'China/Geopolitics': len(re.findall(r'\b(china|taiwan|ukraine|russia|war|sanctions)\b', all_text, re.IGNORECASE)),
-        'AI/Technology': len(re.findall(r'\b(ai|artificial intelligence|tech|nvidia|apple|google)\b', all_text, re.IGNORECASE)),
-        'Banking/Credit': len(re.findall(r'\b(bank|credit|lending|mortgage|debt)\b', all_text, re.IGNORECASE)),
-        'Energy': len(re.findall(r'\b(oil|energy|gas|crude|opec)\b', all_text, re.IGNORECASE)),
-        'Real Estate': len(re.findall(r'\b(real estate|housing|mortgage|property)\b', all_text, re.IGNORECASE))
+    return {
+        'polarity': final_polarity,
+        'subjectivity': subjectivity,
+        'bullish_signals': bullish_count,
+        'bearish_signals': bearish_count,
+        'uncertainty_signals': uncertainty_count
     }
 
-    return themes
+def analyze_sentiment_advanced(text):
+    """Advanced sentiment analysis with financial keywords
 
-def calculate_risk_metrics(tweets_data):
-    """Calculate various risk metrics from tweet data"""
+    The returned dict is shared between identical texts; treat it as read-only.
+    """
+    try:
+        return _analyze_sentiment_impl(text)
+    except:
+        return {'polarity': 0.0, 'subjectivity': 0.5, 'bullish_signals': 0, 'bearish_signals': 0, 'uncertainty_signals': 0}
 
+def _tweet_sentiment(tweet):
+    """Sentiment of a tweet, computed once and kept on the tweet as '_sent'"""
+    sentiment = tweet.get('_sent')
+    if sentiment is None:
+        sentiment = tweet['_sent'] = analyze_sentiment_advanced(tweet.get('text', ''))
+    return sentiment
+
+def _reduce_sentiments(polarities, cat_ids, n_cats):
+    """All sentiment reductions over a polarity array in vectorized NumPy
+
+    Returns (avg, volatility, extreme_ratio, per_category_sum, per_category_count);
+    the per-category arrays are indexed by the ids in cat_ids.
+    """
+    extreme = (polarities > 0.5) | (polarities < -0.5)
+    return (
+        float(polarities.mean()),
+        float(polarities.std()),
+        float(extreme.mean()),
+        np.bincount(cat_ids, weights=polarities, minlength=n_cats),
+        np.bincount(cat_ids, minlength=n_cats)
+    )
+
+def _single_pass_aggregate(tweets_data):
+    """Walk every tweet once and derive all per-tweet statistics from that pass
+
+    Returns (risk_metrics, market_themes, category_analysis, claude_candidates):
+    risk metrics over all tweets, theme mention counts, per-category sentiment
+    and engagement summaries, and the top CLAUDE_TWEETS_PER_CATEGORY tweets of
+    each category by engagement (likes + retweets), which is also attached
+    to every tweet as '_eng'.
+    """
     total_tweets = sum(len(tweets) for tweets in tweets_data.values())
     if total_tweets == 0:
-        return {}
+        return {}, dict.fromkeys(MARKET_THEMES, 0), {}, {}
+
+    n_cats = len(tweets_data)
+
+    # Parallel per-tweet columns; category sums come from np.bincount over cat_ids
+    sents = np.empty(total_tweets, dtype=np.float64)
+    engagements = np.empty(total_tweets, dtype=np.int64)
+    cat_ids = np.empty(total_tweets, dtype=np.int32)
 
-    # Sentiment distribution
-    sentiments = []
-    engagement_levels = []
     uncertainty_signals = 0
+    keyword_counts = Counter()
+    top_accounts = {}
+    claude_candidates = {}
+
+    i = 0
+    for category_id, (category, tweets) in enumerate(tweets_data.items()):
+        cat_ids[i:i + len(tweets)] = category_id
+        usernames = []
+        # Min-heap of (engagement, -position, tweet); ties keep the earlier tweet and
+        # the unique position means the tweet dicts themselves are never compared
+        heap = []
+
+        for position, tweet in enumerate(tweets):
+            text = tweet.get('text', '')
+            sentiment_data = _tweet_sentiment(tweet)
+            engagement = tweet['_eng'] = tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
+
+            sents[i] = sentiment_data['polarity']
+            engagements[i] = engagement
+            i += 1
+            uncertainty_signals += sentiment_data['uncertainty_signals']
+            keyword_counts.update(match.lower() for match in _THEME_RE.findall(text))
+            usernames.append(tweet['username'])
 
-    for category, tweets in tweets_data.items():
-        for tweet in tweets:
-            sentiment_data = analyze_sentiment_advanced(tweet.get('text', ''))
-            sentiments.append(sentiment_data['polarity'])
+            entry = (engagement, -position, tweet)
+            if len(heap) < CLAUDE_TWEETS_PER_CATEGORY:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
 
-            engagement = tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
-            engagement_levels.append(engagement)
+        claude_candidates[category] = [entry[2] for entry in sorted(heap, reverse=True)]
 
-            uncertainty_signals += sentiment_data['uncertainty_signals']
+        if tweets:
+            top_accounts[category] = list(set(usernames))[:5]
 
-    # Risk calculations
-    avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-    sentiment_volatility = sum((s - avg_sentiment) ** 2 for s in sentiments) / len(sentiments) if sentiments else 0
-    sentiment_volatility = sentiment_volatility ** 0.5
+    market_themes = dict.fromkeys(MARKET_THEMES, 0)
+    for keyword, count in keyword_counts.items():
+        for theme in _THEMES_BY_KEYWORD[keyword]:
+            market_themes[theme] += count
 
-    # Extreme sentiment ratio
-    extreme_positive = sum(1 for s in sentiments if s > 0.5)
-    extreme_negative = sum(1 for s in sentiments if s < -0.5)
-    extreme_ratio = (extreme_positive + extreme_negative) / len(sentiments) if sentiments else 0
+    avg_sentiment, volatility, extreme_ratio, cat_sums, cat_counts = _reduce_sentiments(sents, cat_ids, n_cats)
+    cat_engagement = np.bincount(cat_ids, weights=engagements, minlength=n_cats)
 
-    return {
+    risk_metrics = {
         'avg_sentiment': avg_sentiment,
-        'sentiment_volatility': sentiment_volatility,
+        'sentiment_volatility': volatility,
         'extreme_sentiment_ratio': extreme_ratio,
         'uncertainty_index': uncertainty_signals / total_tweets,
-        'avg_engagement': sum(engagement_levels) / len(engagement_levels) if engagement_levels else 0
+        'avg_engagement': float(engagements.mean())
     }
 
-def generate_fund_manager_analysis(tweets_data):
-    """Generate professional fund manager analysis"""
+    categories = list(tweets_data)
+    category_analysis = {}
+    for category_id in np.flatnonzero(cat_counts):
+        category = categories[category_id]
+        category_analysis[category] = {
+            'avg_sentiment': float(cat_sums[category_id] / cat_counts[category_id]),
+            'total_engagement': int(cat_engagement[category_id]),
+            'tweet_count': int(cat_counts[category_id]),
+            'top_accounts': top_accounts[category]
+        }
+
+    return risk_metrics, market_themes, category_analysis, claude_candidates
+
+def generate_fund_manager_analysis(tweets_data, claude=None):
+    """Generate professional fund manager analysis
+
+    Returns a dict with the Markdown 'report' and the 'risk_metrics' and
+    'market_themes' it was built from. claude is an optional ready
+    ClaudeAnalyst; one is created on demand otherwise.
+    """
 
     timestamp = datetime.now().strftime('%d.%m.%Y %H:%M:%S')
 
+    # Metrics, themes, category summaries and Claude sampling in one pass
+    risk_metrics, market_themes, category_analysis, claude_candidates = _single_pass_aggregate(tweets_data)
+
     # Get Claude AI analysis of tweet content
     print("Analyzing tweet content with Claude AI...")
-    claude_insights = analyze_tweets_with_claude(tweets_data)
-
-    # Calculate metrics
-    risk_metrics = calculate_risk_metrics(tweets_data)
-    market_themes = extract_market_themes(tweets_data)
+    claude_insights = analyze_tweets_with_claude(tweets_data, claude_candidates, claude)
 
     total_tweets = sum(len(tweets) for tweets in tweets_data.values())
     total_accounts = len(set(tweet['username'] for tweets in tweets_data.values() for tweet in tweets))
@@ -447,24 +587,13 @@ def generate_fund_manager_analysis(tweets_data):
         risk_rating = "MODERATE"
         investment_stance = "NEUTRALNY"
 
-    # Category analysis
-    category_analysis = {}
-    for category, tweets in tweets_data.items():
-        if not tweets:
-            continue
-
-        category_sentiments = [analyze_sentiment_advanced(tweet.get('text', ''))['polarity'] for tweet in tweets]
-        category_engagement = sum(tweet.get('like_count', 0) + tweet.get('retweet_count', 0) for tweet in tweets)
-
-        category_analysis[category] = {
-            'avg_sentiment': sum(category_sentiments) / len(category_sentiments) if category_sentiments else 0,
-            'total_engagement': category_engagement,
-            'tweet_count': len(tweets),
-            'top_accounts': list(set(tweet['username'] for tweet in tweets))[:5]
-        }
+    # Dominant theme, looked up once for the report
+    dom_theme = max(market_themes, key=market_themes.get)
+    dom_count = market_themes[dom_theme]
 
     # Generate report
-    report = f"""# FUND MANAGER INVESTMENT ANALYSIS
+    parts = []
+    parts.append(f"""# FUND MANAGER INVESTMENT ANALYSIS
 *Analysis Date: {timestamp}*
 *Data Source: {total_tweets} tweets from {total_accounts} financial accounts*
 
@@ -479,7 +608,7 @@ def generate_fund_manager_analysis(tweets_data):
 **Key Investment Thesis:**
 1. **Market Sentiment:** Średni sentiment wynosi {avg_sentiment:+.3f} z volatility {sentiment_volatility:.3f}, co sugeruje {"podwyższone napięcie" if sentiment_volatility > 0.3 else "relatywną stabilność"} na rynkach
 2. **Extreme Positioning:** {extreme_ratio:.1%} tweetów wykazuje ekstremalne sentyment, co {"wskazuje na potencjalne końcowe fazy trendu" if extreme_ratio > 0.3 else "sugeruje zrównoważone nastroje"}
-3. **Dominujące Tematy:** {max(market_themes, key=market_themes.get)} dominuje dyskusję ({market_themes[max(market_themes, key=market_themes.get)]} wzmianek)
+3. **Dominujące Tematy:** {dom_theme} dominuje dyskusję ({dom_count} wzmianek)
 
 ---
 
@@ -516,21 +645,21 @@ def generate_fund_manager_analysis(tweets_data):
 ---
 
 ## 4. CATEGORY-WISE SENTIMENT ANALYSIS
-"""
+""")
 
     for category, analysis in category_analysis.items():
         sentiment_label = "BULLISH" if analysis['avg_sentiment'] > 0.1 else "BEARISH" if analysis['avg_sentiment'] < -0.1 else "NEUTRAL"
 
-        report += f"""
+        parts.append(f"""
 ### {category.upper()}
 - **Sentiment:** {sentiment_label} ({analysis['avg_sentiment']:+.3f})
 - **Engagement Level:** {analysis['total_engagement']:,} interactions
 - **Data Points:** {analysis['tweet_count']} tweets
 - **Key Voices:** {', '.join(f"@{acc}" for acc in analysis['top_accounts'][:3])}
-"""
+""")
 
     # Risk and positioning section
-    report += f"""
+    parts.append(f"""
 
 ---
 
@@ -558,7 +687,7 @@ def generate_fund_manager_analysis(tweets_data):
 - **Uncertainty Index:** {risk_metrics.get('uncertainty_index', 0):.3f}
 
 ### Key Risk Factors
-1. **Market Consensus Risk:** {"High concentration in popular themes may indicate crowded trades" if max(market_themes.values()) > 20 else "Diversified attention across themes"}
+1. **Market Consensus Risk:** {"High concentration in popular themes may indicate crowded trades" if dom_count > 20 else "Diversified attention across themes"}
 2. **Sentiment Extremes:** {"Elevated extreme sentiment suggests potential reversal points" if extreme_ratio > 0.3 else "Balanced sentiment distribution"}
 3. **Volatility Regime:** {"High sentiment volatility indicates unstable market conditions" if sentiment_volatility > 0.4 else "Normal volatility environment"}
 
@@ -578,19 +707,19 @@ Alternatives: {2 if risk_rating == "VERY HIGH" else 2 if risk_rating == "HIGH" e
 ```
 
 ### TACTICAL RECOMMENDATIONS
-"""
+""")
 
     # Tactical recommendations based on themes
     if market_themes.get('AI/Technology', 0) > 15:
-        report += "\n**OVERWEIGHT:** Technology sector - AI adoption driving structural growth"
+        parts.append("\n**OVERWEIGHT:** Technology sector - AI adoption driving structural growth")
 
     if market_themes.get('Federal Reserve', 0) > 10 and avg_sentiment < 0:
-        report += "\n**UNDERWEIGHT:** Rate-sensitive sectors - Fed policy uncertainty"
+        parts.append("\n**UNDERWEIGHT:** Rate-sensitive sectors - Fed policy uncertainty")
 
     if market_themes.get('Bitcoin/Crypto', 0) > 10:
-        report += "\n**TACTICAL:** Small crypto allocation (1-3%) - institutional adoption accelerating"
+        parts.append("\n**TACTICAL:** Small crypto allocation (1-3%) - institutional adoption accelerating")
 
-    report += f"""
+    parts.append(f"""
 
 ---
 
@@ -622,9 +751,64 @@ Alternatives: {2 if risk_rating == "VERY HIGH" else 2 if risk_rating == "HIGH" e
 ---
 *Analysis Framework: Ray Dalio-inspired systematic approach*
 *Generated: {timestamp}*
-"""
+""")
+
+    return {
+        'report': "".join(parts),
+        'risk_metrics': risk_metrics,
+        'market_themes': market_themes
+    }
 
-    return report
+def _init_claude():
+    """ClaudeAnalyst, or None if it cannot be configured (reported later on use)"""
+    try:
+        return ClaudeAnalyst()
+    except Exception:
+        return None
+
+def load_comprehensive_data(data_path):
+    """Return (tweets_by_category, collection_summary) from the comprehensive tweets file
+
+    With ijson the file is streamed and only those two top-level fields are
+    materialized; otherwise the whole document is parsed.
+    """
+    if ijson is None or data_path.endswith('.zst'):
+        comprehensive_data = read_json_mapped(data_path)
+        return comprehensive_data.get('tweets_by_category', {}), comprehensive_data.get('collection_summary', {})
+
+    wanted = {'tweets_by_category': {}, 'collection_summary': {}}
+    found = 0
+    with open(data_path, 'rb') as f:
+        for key, value in ijson.kvitems(f, '', use_float=True):
+            if key in wanted:
+                wanted[key] = value
+                found += 1
+                if found == len(wanted):
+                    break
+    return wanted['tweets_by_category'], wanted['collection_summary']
+
+def _publish_current(file_path, current_path):
+    """Point current_path at the freshly written file_path without writing it twice
+
+    Hardlinks into a temp name and renames over current_path (atomic); copies
+    instead where hardlinks are unsupported.
+    """
+    tmp_path = current_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(file_path, tmp_path)
+    except OSError:
+        shutil.copyfile(file_path, tmp_path)
+    os.replace(tmp_path, current_path)
+
+def _write_text(file_path, text):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def _write_and_publish(writer, file_path, current_path, data):
+    writer(file_path, data)
+    _publish_current(file_path, current_path)
 
 def run_fund_manager_analysis():
     """Main function to run comprehensive fund manager analysis"""
@@ -634,15 +818,17 @@ def run_fund_manager_analysis():
     # Load latest comprehensive tweets data
     try:
         data_file = 'data/raw/comprehensive_tweets_current.json'
-        if not os.path.exists(data_file):
+        data_path = resolve_json_path(data_file)
+        if data_path is None:
             print(f"Nie znaleziono pliku {data_file}")
             print("Uruchom najpierw: comprehensive_tweet_collector.py")
             return None
 
-        with open(data_file, 'r', encoding='utf-8') as f:
-            comprehensive_data = json.load(f)
-
-        tweets_data = comprehensive_data.get('tweets_by_category', {})
+        # Parse the tweets file while the Claude client initializes
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            claude_future = pool.submit(_init_claude)
+            tweets_data, collection_summary = load_comprehensive_data(data_path)
+            claude = claude_future.result()
 
     except Exception as e:
         print(f"Błąd ładowania danych: {e}")
@@ -650,7 +836,8 @@ def run_fund_manager_analysis():
 
     # Generate analysis
     print("Generating professional fund manager analysis...")
-    analysis_report = generate_fund_manager_analysis(tweets_data)
+    analysis = generate_fund_manager_analysis(tweets_data, claude)
+    analysis_report = analysis['report']
 
     # Save analysis
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -661,25 +848,26 @@ def run_fund_manager_analysis():
 
     os.makedirs('data/analysis', exist_ok=True)
 
-    for file_path in [analysis_file, current_analysis_file]:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(analysis_report)
-
     # Save structured data
     json_analysis = {
         'timestamp': datetime.now().isoformat(),
-        'data_summary': comprehensive_data.get('collection_summary', {}),
-        'risk_metrics': calculate_risk_metrics(tweets_data),
-        'market_themes': extract_market_themes(tweets_data),
+        'data_summary': collection_summary,
+        'risk_metrics': analysis['risk_metrics'],
+        'market_themes': analysis['market_themes'],
         'full_report': analysis_report
     }
 
     json_file = f'data/analysis/fund_manager_analysis_{timestamp}.json'
     current_json_file = 'data/analysis/fund_manager_analysis_current.json'
 
-    for file_path in [json_file, current_json_file]:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(json_analysis, f, indent=2, ensure_ascii=False)
+    # Both reports are written concurrently, each then linked to its *_current name
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pending = [
+            pool.submit(_write_and_publish, _write_text, analysis_file, current_analysis_file, analysis_report),
+            pool.submit(_write_and_publish, write_json, json_file, current_json_file, json_analysis)
+        ]
+        for future in pending:
+            future.result()
 
     print(f"✅ Fund Manager Analysis completed!")
     print(f"📊 Reports saved to:")
@@ -3,13 +3,49 @@
 
 import os
 import requests
-import json
-import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from dotenv import load_dotenv
 
+from src.http_cache import ConditionalRequestCache
+from src.rate_limit import TokenBucket, retrying_adapter
+from src.utils import loads_json, write_jsonl_zst
+
 load_dotenv()
 
+# Output directory, created once at import
+RAW_DIR = Path('data/raw')
+RAW_DIR.mkdir(parents=True, exist_ok=True)
+
+API_KEY = os.getenv('TWITTERAPI_IO_KEY')
+BASE_URL = "https://api.twitterapi.io"
+LAST_TWEETS_URL = f"{BASE_URL}/twitter/user/last_tweets"
+
+# Shared keep-alive session with the API key baked in; 429 and 5xx are
+# retried with backoff (honouring Retry-After) before a response comes back
+SESSION = requests.Session()
+SESSION.headers.update({'x-api-key': API_KEY})
+SESSION.mount("https://", retrying_adapter())
+
+# Revalidated with ETag / Last-Modified, so unchanged timelines come back as 304
+HTTP_CACHE = ConditionalRequestCache()
+
+# Username part of an x.com profile URL
+_URL_RE = re.compile(r'https://x\.com/([a-zA-Z0-9_]+)')
+
+# twitterapi.io free tier: one request every 5 seconds (with a small margin).
+# Burst capacity stays 1 since the free tier rejects back-to-back calls.
+REQUEST_INTERVAL = 5.5
+LIMITER = TokenBucket(rate=1 / REQUEST_INTERVAL)
+
+# Requests in flight at once; the bucket above still sets the overall pace
+MAX_WORKERS = 4
+
+class OutOfCreditsError(Exception):
+    """twitterapi.io answered 402: no further request can succeed"""
+
 def parse_accounts_from_file():
     """Parse accounts from lista kont.txt"""
     accounts = {
@@ -33,8 +69,8 @@ def parse_accounts_from_file():
                 category_part, urls_part = line.split(':', 1)
                 category_name = category_part.strip()
 
-                # Extract usernames from URLs - better regex
-                urls = re.findall(r'https://x\.com/([a-zA-Z0-9_]+)', urls_part)
+                # Extract usernames from URLs
+                urls = _URL_RE.findall(urls_part)
                 print(f"Znalezione URLs: {urls}")
 
                 if 'Giełda' in line or category_name.startswith('1'):
@@ -57,18 +93,16 @@ def parse_accounts_from_file():
 
 def get_latest_tweet(username):
     """Get latest tweet from user using twitterapi.io"""
-    api_key = os.getenv('TWITTERAPI_IO_KEY')
-    headers = {'x-api-key': api_key}
-    base_url = "https://api.twitterapi.io"
-
-    tweets_url = f"{base_url}/twitter/user/last_tweets"
     params = {'userName': username}
 
     try:
-        response = requests.get(tweets_url, headers=headers, params=params, timeout=15)
+        response = HTTP_CACHE.get(SESSION, LAST_TWEETS_URL, params=params, timeout=15)
+        # A 304 revalidation is not billed as a full call
+        if response.not_modified:
+            LIMITER.refund()
 
         if response.status_code == 200:
-            data = response.json()
+            data = loads_json(response.content)
             if data.get('status') == 'success':
                 tweets = data.get('data', {}).get('tweets', [])
                 if tweets:
@@ -85,50 +119,87 @@ def get_latest_tweet(username):
                     }
             else:
                 print(f"@{username}: {data.get('msg', 'Błąd API')}")
+        elif response.status_code == 402:
+            raise OutOfCreditsError(f"@{username}: Brak kredytów")
         elif response.status_code == 429:
             print(f"@{username}: Rate limit")
-        elif response.status_code == 402:
-            print(f"@{username}: Brak kredytów")
         else:
             print(f"@{username}: HTTP {response.status_code}")
 
+    except OutOfCreditsError:
+        raise
     except Exception as e:
         print(f"@{username}: Błąd - {e}")
 
     return None
 
-def collect_all_tweets():
-    """Collect latest tweets from all categorized accounts"""
+def _fetch_latest_tweets(usernames):
+    """Fetch the latest tweet of every username on a small thread pool, paced for the rate limit
+
+    Results come back in the order of usernames; failed lookups are None.
+    Once the API reports no credits left, the remaining lookups are skipped.
+    """
+    out_of_credits = threading.Event()
+
+    def fetch(username):
+        if out_of_credits.is_set():
+            return None
+        LIMITER.acquire()
+        if out_of_credits.is_set():  # set while waiting for the token
+            return None
+        try:
+            return get_latest_tweet(username)
+        except OutOfCreditsError as e:
+            if not out_of_credits.is_set():
+                out_of_credits.set()
+                print(f"{e} - przerywam pobieranie")
+            return None
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(fetch, usernames))
+
+def collect_all_tweets(accounts=None):
+    """Collect latest tweets from all categorized accounts
+
+    accounts is the result of parse_accounts_from_file(); it is parsed here
+    when not given.
+    """
     print("=== POBIERANIE NAJNOWSZYCH TWEETÓW ===\n")
 
-    accounts = parse_accounts_from_file()
+    if accounts is None:
+        accounts = parse_accounts_from_file()
     all_tweets = {}
 
+    # One paced, concurrent run over every account, regrouped by category below
+    work = [(category, username) for category, usernames in accounts.items() for username in usernames]
+    print(f"Pobieranie {len(work)} kont (co {REQUEST_INTERVAL}s, równolegle)...")
+    results = _fetch_latest_tweets([username for _, username in work])
+    fetched = dict(zip(work, results))
+    HTTP_CACHE.save()
+
     for category, usernames in accounts.items():
-        print(f"\n{category.upper()} ({len(usernames)} kont):")
+        # Category report is collected and printed in one call
+        lines = [f"\n{category.upper()} ({len(usernames)} kont):"]
         category_tweets = []
 
         for username in usernames:
-            print(f"  Pobieranie @{username}...")
-            tweet = get_latest_tweet(username)
+            tweet = fetched[(category, username)]
 
             if tweet:
                 category_tweets.append(tweet)
-                print(f"    OK Pobrano: {tweet['text'][:50]}...")
+                lines.append(f"  @{username}: OK Pobrano: {tweet['text'][:50]}...")
             else:
-                print(f"    BRAK danych")
-
-            time.sleep(5.5)  # Rate limit dla twitterapi.io
+                lines.append(f"  @{username}: BRAK danych")
 
         all_tweets[category] = category_tweets
-        print(f"  Razem: {len(category_tweets)}/{len(usernames)} tweetów")
-
-    # Zapisz do pliku
-    output_file = 'data/raw/categorized_tweets.json'
-    os.makedirs('data/raw', exist_ok=True)
+        lines.append(f"  Razem: {len(category_tweets)}/{len(usernames)} tweetów")
+        print("\n".join(lines))
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_tweets, f, indent=2, ensure_ascii=False)
+    # Zapisz do pliku - one tweet per line, tagged with its category
+    output_file = write_jsonl_zst(
+        str(RAW_DIR / 'categorized_tweets.jsonl'),
+        ({'category': category, **tweet} for category, tweets in all_tweets.items() for tweet in tweets)
+    )
 
     print(f"\nOK Dane zapisane do: {output_file}")
 
@@ -154,4 +225,4 @@ if __name__ == "__main__":
 
     # Auto start for testing
     print("y")
-    collect_all_tweets()
\ No newline at end of file
+    collect_all_tweets(accounts)
\ No newline at end of file
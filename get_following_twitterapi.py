@@ -1,14 +1,69 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import io
 import os
+import sys
 import requests
-import json
 import time
+from pathlib import Path
 from dotenv import load_dotenv
 
+from src.utils import loads_json, write_json
+
+try:
+    import ijson
+except ImportError:  # parse the whole response body instead
+    ijson = None
+
 load_dotenv()
 
+# Output directory, created once at import
+RAW_DIR = Path('data/raw')
+RAW_DIR.mkdir(parents=True, exist_ok=True)
+
+# VERBOSE=1 also prints each user's name, description and follower count
+VERBOSE = os.getenv('VERBOSE', '').lower() not in ('', '0', 'false')
+
+# The only user fields kept from the following list
+FOLLOWING_FIELDS = ('userName', 'name', 'description', 'followersCount', 'verified')
+
+def _project_user(user):
+    return {field: user[field] for field in FOLLOWING_FIELDS if field in user}
+
+def read_following_response(response):
+    """Parse a streamed /twitter/user/following response
+
+    Returns {'status', 'msg', 'data': {'following': [...]}} with every user
+    projected to FOLLOWING_FIELDS. With ijson the body is parsed as it
+    arrives and only one user object is materialized at a time.
+    """
+    if ijson is None:
+        data = loads_json(response.content)
+        following = data.get('data', {}).get('following', [])
+        return {'status': data.get('status'), 'msg': data.get('msg'),
+                'data': {'following': [_project_user(user) for user in following]}}
+
+    response.raw.decode_content = True  # undo gzip/deflate transfer encoding
+    status = msg = None
+    following = []
+    builder = None
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if builder is not None:
+            if prefix == 'data.following.item' and event == 'end_map':
+                following.append(_project_user(builder.value))
+                builder = None
+            else:
+                builder.event(event, value)
+        elif prefix == 'data.following.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == 'status':
+            status = value
+        elif prefix == 'msg':
+            msg = value
+    return {'status': status, 'msg': msg, 'data': {'following': following}}
+
 def get_following_twitterapi_io(username):
     api_key = os.getenv('TWITTERAPI_IO_KEY')
 
@@ -24,11 +79,11 @@ def get_following_twitterapi_io(username):
 
     try:
         print("Pobieranie listy obserwowanych...")
-        response = requests.get(following_url, headers=headers, params=params, timeout=20)
+        response = requests.get(following_url, headers=headers, params=params, timeout=20, stream=True)
         print(f"Status: {response.status_code}")
 
         if response.status_code == 200:
-            data = response.json()
+            data = read_following_response(response)
 
             if data.get('status') == 'success':
                 following_data = data.get('data', {})
@@ -37,39 +92,36 @@ def get_following_twitterapi_io(username):
                 print(f"\nSUKCES! Pobrano {len(following_list)} obserwowanych uzytkownikow:")
                 print("=" * 80)
 
+                # Build the whole listing first, then write it to the console once
+                buf = io.StringIO()
                 for i, user in enumerate(following_list, 1):
                     username_followed = user.get('userName', 'N/A')
-                    name = user.get('name', 'Brak nazwy')
-                    description = user.get('description', 'Brak opisu')
-                    followers = user.get('followersCount', 0)
-                    verified = user.get('verified', False)
+                    verify_mark = " [VERIFIED]" if user.get('verified', False) else ""
+                    buf.write(f"{i:3d}. @{username_followed}{verify_mark}\n")
 
-                    # Obciecie opisu
-                    if len(description) > 80:
-                        description = description[:80] + "..."
+                    if VERBOSE:
+                        name = user.get('name', 'Brak nazwy')
+                        description = user.get('description', 'Brak opisu')
+                        followers = user.get('followersCount', 0)
 
-                    verify_mark = " [VERIFIED]" if verified else ""
+                        # Obciecie opisu
+                        if len(description) > 80:
+                            description = description[:80] + "..."
 
-                    print(f"{i:3d}. @{username_followed}{verify_mark}")
-                    print(f"     {name}")
-                    print(f"     {description}")
-                    print(f"     Followers: {followers:,}")
-                    print()
+                        buf.write(f"     {name}\n     {description}\n     Followers: {followers:,}\n\n")
+                sys.stdout.write(buf.getvalue())
 
                 # Zapisz do pliku
-                output_file = f'data/raw/{username}_following_twitterapi.json'
-                os.makedirs('data/raw', exist_ok=True)
+                output_file = RAW_DIR / f'{username}_following_twitterapi.json'
 
                 output_data = {
                     'username': username,
                     'following_count': len(following_list),
                     'following': following_list,
-                    'source': 'twitterapi.io',
-                    'api_response': data
+                    'source': 'twitterapi.io'
                 }
 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
+                write_json(output_file, output_data)
 
                 print(f"Dane zapisane do: {output_file}")
                 return True
@@ -93,7 +145,8 @@ def get_following_twitterapi_io(username):
 
         else:
             print(f"HTTP ERROR {response.status_code}")
-            print(f"Odpowiedz: {response.text}")
+            if VERBOSE:
+                print(f"Odpowiedz: {response.text}")
             return False
 
     except Exception as e:
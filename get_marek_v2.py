@@ -3,11 +3,17 @@
 
 import os
 import requests
-import json
+from pathlib import Path
 from dotenv import load_dotenv
 
+from src.utils import loads_json, write_json
+
 load_dotenv()
 
+# Output directory, created once at import
+RAW_DIR = Path('data/raw')
+RAW_DIR.mkdir(parents=True, exist_ok=True)
+
 def get_marek_tweet_v2():
     bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
 
@@ -23,7 +29,7 @@ def get_marek_tweet_v2():
         user_response = requests.get(user_url, headers=headers)
 
         if user_response.status_code == 200:
-            user_data = user_response.json()
+            user_data = loads_json(user_response.content)
             user_id = user_data['data']['id']
 
             # Get recent tweets
@@ -36,7 +42,7 @@ def get_marek_tweet_v2():
             tweets_response = requests.get(tweets_url, headers=headers, params=params)
 
             if tweets_response.status_code == 200:
-                tweets_data = tweets_response.json()
+                tweets_data = loads_json(tweets_response.content)
                 tweets = tweets_data.get('data', [])
 
                 if tweets:
@@ -78,9 +84,7 @@ def get_marek_tweet_v2():
                         'gold_commodities': []
                     }
 
-                    os.makedirs('data/raw', exist_ok=True)
-                    with open('data/raw/twitter_v2_data.json', 'w', encoding='utf-8') as f:
-                        json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+                    write_json(RAW_DIR / 'twitter_v2_data.json', dashboard_data)
 
                     print("✓ Data saved for dashboard!")
                     return True
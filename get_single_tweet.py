@@ -2,10 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import requests
 import json
 from dotenv import load_dotenv
 
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
 load_dotenv()
 
 def get_marek_tweet():
@@ -37,8 +42,7 @@ def get_marek_tweet():
                     print("\n" + "="*60)
                     print("LATEST TWEET FROM @MarekLangalis")
                     print("="*60)
-                    text = latest_tweet.get('text', 'No text').encode('ascii', 'ignore').decode('ascii')
-                    print(f"Text: {text}")
+                    print(f"Text: {latest_tweet.get('text', 'No text')}")
                     print(f"Date: {latest_tweet.get('createdAt', 'Unknown')}")
                     print(f"Likes: {latest_tweet.get('likeCount', 0)}")
                     print(f"Retweets: {latest_tweet.get('retweetCount', 0)}")
@@ -1,97 +1,82 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os
 import sys
-import requests
-import json
-import time
+import re
 from datetime import datetime
+from pathlib import Path
 from dotenv import load_dotenv
 
+from src.utils import loads_json, write_json
+from twitterapi_client import API_KEY, LAST_TWEETS_URL, LIMITER, SESSION, probe_user, project_tweet
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 load_dotenv()
 
-def get_smolarek_tweets(count=50):
-    """Pobiera ostatnie tweety z konta t_smolarek"""
-
-    api_key = os.getenv('TWITTER_API_KEY')
-
-    if not api_key:
-        print("BŁĄD: Brak klucza API w pliku .env")
-        return None
-
-    print(f"=== POBIERANIE {count} TWEETÓW T_SMOLAREK ===\n")
-
-    username = "t_smolarek"
-
-    headers = {'x-api-key': api_key}
-    base_url = "https://api.twitterapi.io"
-
-    # Get user info first
-    print(f"1. Sprawdzanie konta @{username}...")
-    user_url = f"{base_url}/twitter/user/info"
-    params = {'userName': username}
-
-    try:
-        response = requests.get(user_url, headers=headers, params=params, timeout=15)
-
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('status') == 'success':
-                user_data = data.get('data', {})
-                print(f"   ✓ Znaleziono: {user_data.get('name', 'N/A')}")
-                followers = user_data.get('followersCount', 0)
-                print(f"   Obserwujący: {followers:,}" if isinstance(followers, int) else f"   Obserwujący: {followers}")
-            else:
-                print(f"   ✗ Błąd API: {data.get('msg', 'Nieznany błąd')}")
-                return None
-        elif response.status_code == 429:
-            print("   ✗ RATE LIMIT - poczekaj chwilę")
-            return None
-        else:
-            print(f"   ✗ Błąd HTTP: {response.status_code}")
-            return None
-
-    except Exception as e:
-        print(f"   ✗ Błąd: {e}")
-        return None
-
-    # Wait for rate limit
-    print("   Czekam 6 sekund (rate limit)...")
-    time.sleep(6)
-
-    # Get tweets - API typically returns 20 tweets per request
+# Output directory, created once at import
+RAW_DIR = Path('data/raw')
+RAW_DIR.mkdir(parents=True, exist_ok=True)
+
+# Key topics and the lowercase substrings that signal them; AI is matched
+# as a whole word by _AI_RE instead
+TOPIC_RULES = {
+    'NVIDIA': ['nvidia', '$nvda'],
+    'ASML': ['asml'],
+    'TSMC': ['tsmc', '$tsm'],
+    'Chiny': ['chin', '🇨🇳'],
+    'AI': [],
+    'półprzewodniki/chipy': ['chip', 'półprzewodnik', 'semiconductor'],
+    'USA': ['usa', '🇺🇸', 'ameryk'],
+    'Europa/UE': ['europ', '🇪🇺', 'ue ', 'unii'],
+    'geopolityka': ['geopolit', 'handel', 'restrykcj', 'sankcj']
+}
+
+_TOPIC_BY_KEYWORD = {keyword.encode('utf-8'): topic for topic, keywords in TOPIC_RULES.items() for keyword in keywords}
+
+# Every topic keyword in one alternation over the UTF-8 bytes of the text;
+# the lookahead lets matches overlap, so each keyword is found as `in` would
+_TOPIC_RE = re.compile(b'(?=(' + b'|'.join(map(re.escape, _TOPIC_BY_KEYWORD)) + b'))')
+
+# 'ai' as a standalone word (str pattern, so Polish letters count as word characters)
+_AI_RE = re.compile(r'\bai\b')
+
+def tweet_topics(text):
+    """Key topics mentioned in a lowercased tweet text, each at most once"""
+    topics = {_TOPIC_BY_KEYWORD[keyword] for keyword in _TOPIC_RE.findall(text.encode('utf-8'))}
+    if _AI_RE.search(text):
+        topics.add('AI')
+    return topics
+
+def fetch_user_tweets(username, count=50):
+    """Page through last_tweets until count tweets (projected to TWEET_FIELDS) are collected"""
+    # API typically returns 20 tweets per request
     # We'll need to make multiple requests to get 50
-    print(f"\n2. Pobieranie tweetów...")
-
     all_tweets = []
     cursor = None
     requests_made = 0
     max_requests = 3  # To get ~60 tweets (20 per request)
 
-    tweets_url = f"{base_url}/twitter/user/last_tweets"
-
     while len(all_tweets) < count and requests_made < max_requests:
         params = {'userName': username}
         if cursor:
             params['cursor'] = cursor
 
         try:
-            response = requests.get(tweets_url, headers=headers, params=params, timeout=15)
+            LIMITER.acquire()
+            response = SESSION.get(LAST_TWEETS_URL, params=params, timeout=15)
             requests_made += 1
 
             if response.status_code == 200:
-                data = response.json()
+                data = loads_json(response.content)
                 if data.get('status') == 'success':
                     tweet_data = data.get('data', {})
                     tweets = tweet_data.get('tweets', [])
 
                     if tweets:
-                        all_tweets.extend(tweets)
+                        all_tweets.extend(map(project_tweet, tweets))
                         print(f"   ✓ Pobrano {len(tweets)} tweetów (łącznie: {len(all_tweets)})")
 
                         # Check if there's a cursor for next page
@@ -99,11 +84,6 @@ def get_smolarek_tweets(count=50):
 
                         if not cursor or len(all_tweets) >= count:
                             break
-
-                        # Wait before next request
-                        if requests_made < max_requests:
-                            print("   Czekam 6 sekund przed kolejnym zapytaniem...")
-                            time.sleep(6)
                     else:
                         print("   ✗ Brak więcej tweetów")
                         break
@@ -122,70 +102,64 @@ def get_smolarek_tweets(count=50):
             break
 
     # Trim to exactly the requested count
-    all_tweets = all_tweets[:count]
+    return all_tweets[:count]
+
+def save_all_tweets(username, all_tweets, timestamp):
+    """Write the smolarek_all_tweets_<timestamp>.json file; returns its path"""
+    filename = str(RAW_DIR / f"smolarek_all_tweets_{timestamp}.json")
+
+    write_json(filename, {
+        'username': username,
+        'fetched_at': timestamp,
+        'total_tweets': len(all_tweets),
+        'tweets': all_tweets
+    })
+
+    print(f"✓ Zapisano do pliku: {filename}")
+    return filename
+
+def print_topic_summary(topics):
+    """Print topic -> tweet count, most mentioned first"""
+    print("\n" + "="*80)
+    print("PODSUMOWANIE TEMATÓW:")
+    print("="*80)
+
+    for topic, count in sorted(topics.items(), key=lambda x: x[1], reverse=True):
+        if count > 0:
+            print(f"  {topic}: {count} tweetów")
+
+def get_smolarek_tweets(count=50, skip_user_probe=False):
+    """Pobiera ostatnie tweety z konta t_smolarek"""
+
+    if not API_KEY:
+        print("BŁĄD: Brak klucza API w pliku .env")
+        return None
+
+    print(f"=== POBIERANIE {count} TWEETÓW T_SMOLAREK ===\n")
+
+    username = "t_smolarek"
+
+    # Get user info first (skipped with skip_user_probe; reused for 5 min)
+    if not skip_user_probe and probe_user(username) is None:
+        return None
+
+    print(f"\n2. Pobieranie tweetów...")
+    all_tweets = fetch_user_tweets(username, count)
 
     if all_tweets:
         print(f"\n   ✓ KOŃCOWO POBRANO: {len(all_tweets)} tweetów\n")
 
-        # Save to file
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"data/raw/smolarek_all_tweets_{timestamp}.json"
-
-        os.makedirs('data/raw', exist_ok=True)
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'username': username,
-                'fetched_at': timestamp,
-                'total_tweets': len(all_tweets),
-                'tweets': all_tweets
-            }, f, indent=2, ensure_ascii=False)
-
-        print(f"✓ Zapisano do pliku: {filename}")
-
-        # Display summary
-        print("\n" + "="*80)
-        print("PODSUMOWANIE TEMATÓW:")
-        print("="*80)
-
-        # Count mentions of key topics
-        topics = {
-            'NVIDIA': 0,
-            'ASML': 0,
-            'TSMC': 0,
-            'Chiny': 0,
-            'AI': 0,
-            'półprzewodniki/chipy': 0,
-            'USA': 0,
-            'Europa/UE': 0,
-            'geopolityka': 0
-        }
+        filename = save_all_tweets(username, all_tweets, timestamp)
+
+        # Count tweets mentioning each key topic, one scan per tweet
+        topics = dict.fromkeys(TOPIC_RULES, 0)
 
         for tweet in all_tweets:
-            text = tweet.get('text', '').lower()
-
-            if 'nvidia' in text or '$nvda' in text:
-                topics['NVIDIA'] += 1
-            if 'asml' in text:
-                topics['ASML'] += 1
-            if 'tsmc' in text or '$tsm' in text:
-                topics['TSMC'] += 1
-            if 'chin' in text or '🇨🇳' in text:
-                topics['Chiny'] += 1
-            if ' ai ' in text or 'ai,' in text or 'ai.' in text or 'ai!' in text:
-                topics['AI'] += 1
-            if 'chip' in text or 'półprzewodnik' in text or 'semiconductor' in text:
-                topics['półprzewodniki/chipy'] += 1
-            if 'usa' in text or '🇺🇸' in text or 'ameryk' in text:
-                topics['USA'] += 1
-            if 'europ' in text or '🇪🇺' in text or 'ue ' in text or 'unii' in text:
-                topics['Europa/UE'] += 1
-            if 'geopolit' in text or 'handel' in text or 'restrykcj' in text or 'sankcj' in text:
-                topics['geopolityka'] += 1
-
-        for topic, count in sorted(topics.items(), key=lambda x: x[1], reverse=True):
-            if count > 0:
-                print(f"  {topic}: {count} tweetów")
+            for topic in tweet_topics(tweet.get('text', '').lower()):
+                topics[topic] += 1
+
+        print_topic_summary(topics)
 
         return filename
     else:
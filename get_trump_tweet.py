@@ -3,12 +3,12 @@
 
 import os
 import sys
-import requests
 import json
-import time
 from datetime import datetime
 from dotenv import load_dotenv
 
+from twitterapi_client import API_KEY, LAST_TWEETS_URL, LIMITER, SESSION, USER_INFO_URL
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -18,9 +18,7 @@ load_dotenv()
 def get_latest_trump_tweet():
     """Pobiera ostatni tweet Donalda Trumpa"""
 
-    api_key = os.getenv('TWITTER_API_KEY')
-
-    if not api_key:
+    if not API_KEY:
         print("BŁĄD: Brak klucza API w pliku .env")
         return
 
@@ -29,16 +27,13 @@ def get_latest_trump_tweet():
     # Donald Trump's username
     username = "realDonaldTrump"
 
-    headers = {'x-api-key': api_key}
-    base_url = "https://api.twitterapi.io"
-
     # First, get user info
     print(f"1. Sprawdzanie informacji o koncie @{username}...")
-    user_url = f"{base_url}/twitter/user/info"
     params = {'userName': username}
 
     try:
-        response = requests.get(user_url, headers=headers, params=params, timeout=15)
+        LIMITER.acquire()
+        response = SESSION.get(USER_INFO_URL, params=params, timeout=15)
 
         if response.status_code == 200:
             data = response.json()
@@ -66,17 +61,14 @@ def get_latest_trump_tweet():
         print(f"   ✗ Błąd: {e}")
         return
 
-    # Wait to avoid rate limit
-    print("   Czekam 6 sekund (rate limit)...")
-    time.sleep(6)
-
     # Now get latest tweets
     print(f"\n2. Pobieranie ostatnich tweetów...")
-    tweets_url = f"{base_url}/twitter/user/last_tweets"
     params = {'userName': username}
 
     try:
-        response = requests.get(tweets_url, headers=headers, params=params, timeout=15)
+        # Waits only for whatever is left of the rate-limit interval
+        LIMITER.acquire()
+        response = SESSION.get(LAST_TWEETS_URL, params=params, timeout=15)
 
         if response.status_code == 200:
             data = response.json()
@@ -8,18 +8,19 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-def get_user_following(username):
-    bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-
-    headers = {
-        'Authorization': f'Bearer {bearer_token}',
-        'Content-Type': 'application/json'
-    }
+# Shared keep-alive session: the user lookup and the following call reuse one TLS connection
+SESSION = requests.Session()
+SESSION.headers.update({
+    'Authorization': f"Bearer {os.getenv('TWITTER_BEARER_TOKEN')}",
+    'Content-Type': 'application/json'
+})
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10))
 
+def get_user_following(username):
     try:
         # First get user ID
         user_url = f"https://api.twitter.com/2/users/by/username/{username}"
-        user_response = requests.get(user_url, headers=headers)
+        user_response = SESSION.get(user_url)
 
         if user_response.status_code == 200:
             user_data = user_response.json()
@@ -33,7 +34,7 @@ def get_user_following(username):
                 'user.fields': 'name,username,description,public_metrics,verified'
             }
 
-            following_response = requests.get(following_url, headers=headers, params=params)
+            following_response = SESSION.get(following_url, params=params)
 
             if following_response.status_code == 200:
                 following_data = following_response.json()
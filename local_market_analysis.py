@@ -2,16 +2,34 @@
 # -*- coding: utf-8 -*-
 
 import os
-import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import numpy as np
 from textblob import TextBlob
 
+from src.utils import read_json, sha256_file, write_json
+
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole file
+    ijson = None
+
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:  # score with TextBlob instead
+    SentimentIntensityAnalyzer = None
+
+# Lexicon-only scorer tuned for social media text; much cheaper than TextBlob's parser
+_VADER = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer is not None else None
+
 def analyze_sentiment_simple(text):
-    """Simple sentiment analysis using TextBlob"""
+    """Simple sentiment analysis: VADER compound score, or TextBlob polarity without vaderSentiment"""
     try:
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
+        if _VADER is not None:
+            polarity = _VADER.polarity_scores(text)['compound']
+        else:
+            polarity = TextBlob(text).sentiment.polarity
 
         if polarity > 0.1:
             return "Pozytywny", polarity
@@ -22,50 +40,120 @@ def analyze_sentiment_simple(text):
     except:
         return "Neutralny", 0.0
 
+# Below this many tweets, starting worker processes costs more than it saves;
+# VADER is cheap enough per tweet that only very large batches benefit
+PARALLEL_MIN_TWEETS = 100 if _VADER is None else 5000
+
+def _polarity(text):
+    return analyze_sentiment_simple(text)[1]
+
+def score_texts(texts, executor=None):
+    """Polarity of every text as a float64 array
+
+    Batches of PARALLEL_MIN_TWEETS or more are spread over the worker
+    processes of executor when one is given.
+    """
+    if executor is None or len(texts) < PARALLEL_MIN_TWEETS:
+        return np.fromiter(map(_polarity, texts), dtype=np.float64, count=len(texts))
+    return np.fromiter(executor.map(_polarity, texts, chunksize=64), dtype=np.float64, count=len(texts))
+
+FINANCIAL_KEYWORDS = {
+    'bullish': ['wzrost', 'rośnie', 'up', 'rally', 'bull', 'green', 'gains', 'surge'],
+    'bearish': ['spadek', 'fall', 'down', 'bear', 'red', 'losses', 'drop', 'crash'],
+    'uncertainty': ['volatile', 'uncertain', 'risk', 'fear', 'panic', 'crisis'],
+    'institutions': ['fed', 'bank', 'federal', 'ecb', 'treasury', 'government'],
+    'crypto': ['bitcoin', 'btc', 'crypto', 'blockchain', 'eth', 'ethereum'],
+    'stocks': ['stock', 'shares', 'equity', 'market', 'trading', 'investing']
+}
+
+_ALL_KEYWORDS = [kw for kws in FINANCIAL_KEYWORDS.values() for kw in kws]
+
+# All keywords in one alternation, longest first, inside a lookahead so
+# matches may overlap. Every keyword that starts where the longest one does
+# is a prefix of it ('fed' in 'federal'), so those are credited too.
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, sorted(_ALL_KEYWORDS, key=len, reverse=True))) + '))')
+_PREFIXES = {kw: [other for other in _ALL_KEYWORDS if kw.startswith(other)] for kw in _ALL_KEYWORDS}
+
 def extract_financial_keywords(text):
-    """Extract financial keywords"""
-    financial_keywords = {
-        'bullish': ['wzrost', 'rośnie', 'up', 'rally', 'bull', 'green', 'gains', 'surge'],
-        'bearish': ['spadek', 'fall', 'down', 'bear', 'red', 'losses', 'drop', 'crash'],
-        'uncertainty': ['volatile', 'uncertain', 'risk', 'fear', 'panic', 'crisis'],
-        'institutions': ['fed', 'bank', 'federal', 'ecb', 'treasury', 'government'],
-        'crypto': ['bitcoin', 'btc', 'crypto', 'blockchain', 'eth', 'ethereum'],
-        'stocks': ['stock', 'shares', 'equity', 'market', 'trading', 'investing']
-    }
+    """Extract financial keywords (substring matches, in FINANCIAL_KEYWORDS order)"""
+    matched = set()
+    for kw in _KEYWORD_RE.findall(text.lower()):
+        matched.update(_PREFIXES[kw])
 
-    found_keywords = {}
-    text_lower = text.lower()
+    if not matched:
+        return {}
 
-    for category, keywords in financial_keywords.items():
-        found = [kw for kw in keywords if kw in text_lower]
+    found_keywords = {}
+    for category, keywords in FINANCIAL_KEYWORDS.items():
+        found = [kw for kw in keywords if kw in matched]
         if found:
             found_keywords[category] = found
 
     return found_keywords
 
+def iter_categories(source_file, prefix=''):
+    """Yield (category, tweets) pairs from source_file one category at a time
+
+    prefix is the JSON path of the category mapping ('' for the sample file,
+    'tweets_by_category' for the comprehensive one). Streams with ijson;
+    without it the whole file is parsed first.
+    """
+    if ijson is None:
+        data = read_json(source_file)
+        yield from (data.get(prefix, {}) if prefix else data).items()
+        return
+    with open(source_file, 'rb') as f:
+        yield from ijson.kvitems(f, prefix, use_float=True)
+
 def create_local_analysis():
     """Create comprehensive local analysis"""
 
-    # Load tweets
+    # First try comprehensive tweets (new system), fall back to the sample file
+    comprehensive_file = 'data/raw/comprehensive_tweets_current.json'
+    if os.path.exists(comprehensive_file):
+        source_file, prefix = comprehensive_file, 'tweets_by_category'
+    else:
+        source_file, prefix = 'data/raw/sample_categorized_tweets.json', ''
+
+    # Load tweets category by category; only per-category aggregates are kept.
+    # Every tweet is scored and scanned for keywords exactly once.
+    category_stats = {}
+    sentiment_sum = 0.0
+    # One worker pool for the whole run, started by the first category large
+    # enough to need it, so workers spawn and import the scorer only once
+    executor = None
+
     try:
-        # First try comprehensive tweets (new system)
-        comprehensive_file = 'data/raw/comprehensive_tweets_current.json'
-        if os.path.exists(comprehensive_file):
-            with open(comprehensive_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                tweets_data = data.get('tweets_by_category', {})
-        else:
-            # Fallback to sample file
-            with open('data/raw/sample_categorized_tweets.json', 'r', encoding='utf-8') as f:
-                tweets_data = json.load(f)
+        for category, tweets in iter_categories(source_file, prefix):
+            texts = [tweet.get('text', '') for tweet in tweets]
+            if executor is None and len(texts) >= PARALLEL_MIN_TWEETS:
+                executor = ProcessPoolExecutor()
+            scores = score_texts(texts, executor)
+            engagement = 0
+            category_keywords = {}
+
+            for tweet in tweets:
+                engagement += tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
+
+                for kw_cat, kws in extract_financial_keywords(tweet.get('text', '')).items():
+                    category_keywords.setdefault(kw_cat, []).extend(kws)
+
+            top_tweet = max(tweets, key=lambda t: t.get('like_count', 0) + t.get('retweet_count', 0)) if tweets else None
+            category_stats[category] = (len(tweets), float(scores.mean()) if tweets else 0, engagement, category_keywords, top_tweet)
+            sentiment_sum += float(scores.sum())
     except Exception as e:
         print(f"Błąd ładowania danych: {e}")
         return None
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    tweets_analyzed = sum(stats[0] for stats in category_stats.values())
 
     analysis_report = f"""# ANALIZA RYNKU FINANSOWEGO
 *Wygenerowano: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}*
 
-**Przeanalizowano {sum(len(tweets) for tweets in tweets_data.values())} tweetów z {len(tweets_data)} kategorii**
+**Przeanalizowano {tweets_analyzed} tweetów z {len(category_stats)} kategorii**
 
 ---
 
@@ -74,16 +162,9 @@ def create_local_analysis():
 """
 
     # Overall sentiment analysis
-    all_sentiments = []
-    total_engagement = 0
-
-    for category, tweets in tweets_data.items():
-        for tweet in tweets:
-            sentiment, score = analyze_sentiment_simple(tweet.get('text', ''))
-            all_sentiments.append(score)
-            total_engagement += tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
+    total_engagement = sum(stats[2] for stats in category_stats.values())
 
-    avg_sentiment = sum(all_sentiments) / len(all_sentiments) if all_sentiments else 0
+    avg_sentiment = sentiment_sum / tweets_analyzed if tweets_analyzed else 0
 
     # Sentiment rating
     if avg_sentiment > 0.2:
@@ -113,30 +194,12 @@ def create_local_analysis():
     # Category analysis
     analysis_report += "\n## 🔍 ANALIZA KATEGORIALNA\n\n"
 
-    for category, tweets in tweets_data.items():
-        if not tweets:
+    for category, (tweet_count, avg_cat_sentiment, category_engagement, category_keywords, top_tweet) in category_stats.items():
+        if not tweet_count:
             continue
 
         analysis_report += f"### {category}\n"
 
-        # Category sentiment
-        category_sentiments = []
-        category_engagement = 0
-        category_keywords = {}
-
-        for tweet in tweets:
-            sentiment, score = analyze_sentiment_simple(tweet.get('text', ''))
-            category_sentiments.append(score)
-            category_engagement += tweet.get('like_count', 0) + tweet.get('retweet_count', 0)
-
-            keywords = extract_financial_keywords(tweet.get('text', ''))
-            for kw_cat, kws in keywords.items():
-                if kw_cat not in category_keywords:
-                    category_keywords[kw_cat] = []
-                category_keywords[kw_cat].extend(kws)
-
-        avg_cat_sentiment = sum(category_sentiments) / len(category_sentiments) if category_sentiments else 0
-
         if avg_cat_sentiment > 0.1:
             cat_sentiment_label = "Pozytywny"
         elif avg_cat_sentiment < -0.1:
@@ -145,7 +208,7 @@ def create_local_analysis():
             cat_sentiment_label = "Neutralny"
 
         # Engagement level
-        avg_engagement = category_engagement / len(tweets) if tweets else 0
+        avg_engagement = category_engagement / tweet_count
         if avg_engagement > 500:
             engagement_level = "Wysoki"
         elif avg_engagement > 100:
@@ -156,15 +219,13 @@ def create_local_analysis():
         analysis_report += f"""
 **Sentiment:** {cat_sentiment_label} ({avg_cat_sentiment:+.3f})
 **Zaangażowanie:** {engagement_level} ({category_engagement:,} łącznych interakcji)
-**Liczba tweetów:** {len(tweets)}
+**Liczba tweetów:** {tweet_count}
 
 **Kluczowe tematy:**
 """
 
         # Most engaging tweet
-        if tweets:
-            top_tweet = max(tweets, key=lambda t: t.get('like_count', 0) + t.get('retweet_count', 0))
-            analysis_report += f"- Najważniejszy tweet: @{top_tweet.get('username', 'unknown')} ({top_tweet.get('like_count', 0)}❤️ {top_tweet.get('retweet_count', 0)}🔄)\n"
+        analysis_report += f"- Najważniejszy tweet: @{top_tweet.get('username', 'unknown')} ({top_tweet.get('like_count', 0)}❤️ {top_tweet.get('retweet_count', 0)}🔄)\n"
 
         if category_keywords:
             analysis_report += "- Wykryte sygnały: " + ", ".join([f"{cat} ({len(set(kws))})" for cat, kws in category_keywords.items()]) + "\n"
@@ -227,18 +288,18 @@ Nie stanowi porady inwestycyjnej. Zawsze przeprowadź własną analizę przed po
     # Save structured data
     analysis_data = {
         'timestamp': datetime.now().isoformat(),
-        'tweets_analyzed': sum(len(tweets) for tweets in tweets_data.values()),
-        'categories': list(tweets_data.keys()),
+        'tweets_analyzed': tweets_analyzed,
+        'categories': list(category_stats),
         'overall_sentiment': avg_sentiment,
         'sentiment_rating': sentiment_rating,
         'total_engagement': total_engagement,
-        'source_data': tweets_data,
+        'source_file': source_file,
+        'source_sha256': sha256_file(source_file),
         'analysis_report': analysis_report
     }
 
     json_file = 'data/analysis/market_sentiment_analysis.json'
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(analysis_data, f, indent=2, ensure_ascii=False)
+    write_json(json_file, analysis_data)
 
     print(f"Analiza zapisana do:")
     print(f"  - {markdown_file}")
@@ -6,11 +6,10 @@ Automated financial sentiment analysis from X (Twitter) data
 
 import os
 import sys
-import json
 import logging
 import schedule
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
 # Add src directory to Python path
@@ -20,7 +19,9 @@ from src.scraper import DataCollector
 from src.analyzer import DataProcessor
 from src.claude_client import ClaudeAnalyst
 from src.reporter import MarkdownReporter
-from src.utils import ensure_directories, setup_logging, health_check, validate_api_keys
+from src.utils import (
+    ensure_directories, setup_logging, health_check, validate_api_keys, get_latest_file, read_json
+)
 
 
 class FinancialAnalyzer:
@@ -87,8 +88,7 @@ class FinancialAnalyzer:
                 return None
 
             # Load processed data for reporting
-            with open(processed_data_file, 'r', encoding='utf-8') as f:
-                processed_data = json.load(f)
+            processed_data = read_json(processed_data_file)
 
             # Step 3: Generate Claude analysis
             self.logger.info("Step 3: Generating AI insights...")
@@ -125,14 +125,12 @@ class FinancialAnalyzer:
 
         try:
             # Find latest raw data
-            import glob
-            raw_files = glob.glob('data/raw/tweets_*.json')
+            latest_raw_file = get_latest_file('data/raw/tweets_*.json')
 
-            if not raw_files:
+            if not latest_raw_file:
                 self.logger.warning("No raw data files found for analysis")
                 return
 
-            latest_raw_file = max(raw_files, key=os.path.getctime)
             self.logger.info(f"Analyzing data from: {latest_raw_file}")
 
             # Process the data
@@ -152,19 +150,16 @@ class FinancialAnalyzer:
 
         try:
             # Find latest processed data
-            import glob
-            processed_files = glob.glob('data/processed/analysis_*.json')
+            latest_processed_file = get_latest_file('data/processed/analysis_*.json')
 
-            if not processed_files:
+            if not latest_processed_file:
                 self.logger.warning("No processed data files found for reporting")
                 return
 
-            latest_processed_file = max(processed_files, key=os.path.getctime)
             self.logger.info(f"Generating report from: {latest_processed_file}")
 
             # Load processed data
-            with open(latest_processed_file, 'r', encoding='utf-8') as f:
-                processed_data = json.load(f)
+            processed_data = read_json(latest_processed_file)
 
             # Generate Claude analysis
             claude_analysis = self.claude_analyst.analyze_market_sentiment(processed_data)
@@ -199,13 +194,11 @@ class FinancialAnalyzer:
             daily_reports = glob.glob('reports/daily/raport_daily_*.md')
 
             # Filter reports from last 7 days
-            week_ago = datetime.now() - timedelta(days=7)
-            recent_reports = []
-
-            for report_file in daily_reports:
-                file_time = datetime.fromtimestamp(os.path.getctime(report_file))
-                if file_time > week_ago:
-                    recent_reports.append(report_file)
+            week_ago = time.time() - 7 * 24 * 3600
+            recent_reports = [
+                report_file for report_file in daily_reports
+                if os.path.getctime(report_file) > week_ago
+            ]
 
             if not recent_reports:
                 self.logger.warning("No daily reports found for weekly summary")
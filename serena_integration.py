@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 import logging
 
+from src.utils import get_latest_file
+
 class SerenaIntegration:
     """Integration with Serena for live Markdown preview"""
 
@@ -241,10 +243,8 @@ This document is automatically updated when:
     def _get_latest_tweet_count(self) -> int:
         """Get latest tweet count from data"""
         try:
-            import glob
-            data_files = glob.glob(os.path.join(self.project_root, "data/processed/analysis_*.json"))
-            if data_files:
-                latest_file = max(data_files, key=os.path.getctime)
+            latest_file = get_latest_file(os.path.join(self.project_root, "data/processed/analysis_*.json"))
+            if latest_file:
                 with open(latest_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     return data.get('total_tweets', 0)
@@ -255,10 +255,8 @@ This document is automatically updated when:
     def _get_latest_sentiment(self) -> str:
         """Get latest overall sentiment"""
         try:
-            import glob
-            data_files = glob.glob(os.path.join(self.project_root, "data/processed/analysis_*.json"))
-            if data_files:
-                latest_file = max(data_files, key=os.path.getctime)
+            latest_file = get_latest_file(os.path.join(self.project_root, "data/processed/analysis_*.json"))
+            if latest_file:
                 with open(latest_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     return data.get('overall_sentiment', {}).get('sentiment_label', 'Unknown')
@@ -269,10 +267,8 @@ This document is automatically updated when:
     def _get_top_category(self) -> str:
         """Get category with most activity"""
         try:
-            import glob
-            data_files = glob.glob(os.path.join(self.project_root, "data/processed/analysis_*.json"))
-            if data_files:
-                latest_file = max(data_files, key=os.path.getctime)
+            latest_file = get_latest_file(os.path.join(self.project_root, "data/processed/analysis_*.json"))
+            if latest_file:
                 with open(latest_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     categories = data.get('categories', {})
@@ -330,7 +326,8 @@ This document is automatically updated when:
             for i, tweet in enumerate(top_tweets, 1):
                 user = tweet.get('user', {})
                 username = user.get('screen_name', 'Unknown')
-                text = tweet.get('text', '')[:150] + '...' if len(tweet.get('text', '')) > 150 else tweet.get('text', '')
+                text = tweet.get('text', '')
+                text = text[:150] + ('...' if len(text) > 150 else '')
                 impact = tweet.get('impact_score', 0.0)
 
                 live_content += f"**{i}. @{username}** (Impact: {impact:.2f})\n"
@@ -15,6 +15,8 @@ import sys
 from datetime import datetime, timedelta
 import time
 
+from src.utils import read_json, resolve_json_path
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="X Financial Analyzer - Smart",
@@ -682,10 +684,10 @@ def render_deep_sectoral_analysis():
 
     available_analyses = {}
     for sector, file_path in analysis_files.items():
-        if os.path.exists(file_path):
+        file_path = resolve_json_path(file_path)  # plain or .zst cache
+        if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    available_analyses[sector] = json.load(f)
+                available_analyses[sector] = read_json(file_path)
             except Exception as e:
                 st.error(f"Błąd ładowania analizy {sector}: {e}")
 
@@ -10,9 +10,12 @@ import time
 import os
 from datetime import datetime
 import sys
+from dotenv import load_dotenv
+
+load_dotenv()
 
 # Konfiguracja
-BEARER_TOKEN = "AAAAAAAAAAAAAAAAAAAAAAEK4QEAAAAAViLvNU%2FIgR%2FwwQOy2wy63iRey08%3DgTgI2xoNKbKd9lNMN2vFRpM8cJAqiW2eAzdu9eWG472mb1xpSv"
+BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN")
 OUTPUT_DIR = "data/cache"
 RATE_LIMIT_WAIT = 900  # 15 minut = 900 sekund
 
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single fetch of @t_smolarek's recent tweets feeding both outputs of
+get_smolarek_50_tweets.py (all tweets + topic summary) and
+get_smolarek_chips.py (chip-related tweets)
+"""
+
+import sys
+from datetime import datetime
+
+from get_smolarek_50_tweets import TOPIC_RULES, fetch_user_tweets, print_topic_summary, save_all_tweets, tweet_topics
+from get_smolarek_chips import is_chip_tweet, report_chip_tweets
+from twitterapi_client import API_KEY, probe_user
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+def fetch_and_partition_smolarek(count=50, skip_user_probe=False):
+    """Fetch count tweets once and write the all-tweets and chip-tweets files
+
+    Returns (all_tweets_file, chip_tweets_file); either is None when it was
+    not written.
+    """
+    if not API_KEY:
+        print("BŁĄD: Brak klucza API w pliku .env")
+        return None, None
+
+    print(f"=== POBIERANIE {count} TWEETÓW T_SMOLAREK (WSZYSTKIE + CHIPY) ===\n")
+
+    username = "t_smolarek"
+
+    if not skip_user_probe and probe_user(username) is None:
+        return None, None
+
+    print(f"\n2. Pobieranie tweetów...")
+    all_tweets = fetch_user_tweets(username, count)
+
+    if not all_tweets:
+        print("   ✗ Nie udało się pobrać tweetów")
+        return None, None
+
+    print(f"\n   ✓ KOŃCOWO POBRANO: {len(all_tweets)} tweetów\n")
+
+    # One pass: each text is lowercased once for both the topic count and the chip filter
+    topics = dict.fromkeys(TOPIC_RULES, 0)
+    chip_tweets = []
+
+    for tweet in all_tweets:
+        text = tweet.get('text', '').lower()
+        for topic in tweet_topics(text):
+            topics[topic] += 1
+        if is_chip_tweet(text):
+            chip_tweets.append(tweet)
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    all_file = save_all_tweets(username, all_tweets, timestamp)
+    print_topic_summary(topics)
+
+    print()
+    chips_file = report_chip_tweets(username, all_tweets, chip_tweets, timestamp)
+
+    return all_file, chips_file
+
+if __name__ == "__main__":
+    fetch_and_partition_smolarek(50)
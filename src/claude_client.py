@@ -182,7 +182,8 @@ class ClaudeAnalyst:
         if top_tweets:
             summary_parts.append("\nMost Influential Tweets:")
             for i, tweet in enumerate(top_tweets[:3], 1):
-                text = tweet.get('text', '')[:100] + '...' if len(tweet.get('text', '')) > 100 else tweet.get('text', '')
+                text = tweet.get('text', '')
+                text = text[:100] + ('...' if len(text) > 100 else '')
                 user = tweet.get('user', {}).get('screen_name', 'Unknown')
                 impact = tweet.get('impact_score', 0.0)
                 summary_parts.append(f"{i}. @{user}: \"{text}\" (Impact: {impact:.2f})")
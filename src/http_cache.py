@@ -0,0 +1,74 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from src.utils import read_json, write_json
+
+
+class ConditionalRequestCache:
+    """On-disk ETag / Last-Modified cache for repeated API GETs
+
+    Validators and bodies of successful responses are remembered; later
+    requests for the same URL and params send If-None-Match /
+    If-Modified-Since. A 304 reply is turned back into a 200 carrying the
+    stored body, with `response.not_modified = True`, so callers parse it
+    exactly like a fresh response.
+    """
+
+    DEFAULT_PATH = 'data/cache/http_conditional_cache.json'
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            self._entries: Dict[str, Dict[str, str]] = read_json(path) if os.path.exists(path) else {}
+        except ValueError:  # corrupt cache, start over
+            self._entries = {}
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        return f"{url}?{urlencode(sorted((params or {}).items()))}"
+
+    def get(self, session, url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 15):
+        key = self._key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        response.not_modified = False
+
+        if response.status_code == 304 and entry:
+            response.status_code = 200
+            response._content = entry['body'].encode('utf-8')
+            response.not_modified = True
+        elif response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                with self._lock:
+                    self._entries[key] = {
+                        'etag': etag or '',
+                        'last_modified': last_modified or '',
+                        'body': response.content.decode('utf-8', 'replace')
+                    }
+                    self._dirty = True
+
+        return response
+
+    def save(self):
+        """Persist new validators (no-op when nothing changed)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_json(self.path, self._entries, indent=False)
+            self._dirty = False
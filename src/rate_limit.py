@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by threads and asyncio tasks
+
+    Tokens refill continuously at `rate` per second up to `capacity`; every
+    request takes one. Time spent on the network already counts towards the
+    next token, unlike a fixed sleep after each call. A caller that finds
+    the bucket empty reserves a future token under the lock and waits
+    outside it, so concurrent callers queue up in order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait until it is actually available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self):
+        """Give back a token whose request was not billed (e.g. a 304 revalidation)"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the seconds waited"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """asyncio version of acquire()"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+# Throttled (429) and transient server errors are retried; 402 (out of
+# credits) is not, since waiting does not bring credits back
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def retrying_adapter(pool_size: int = 16) -> HTTPAdapter:
+    """Pooled HTTPAdapter with exponential backoff on RETRY_STATUSES
+
+    Up to 5 retries, backing off 2 s, 4 s, 8 s... unless the server sends
+    Retry-After, which wins. The final response is returned rather than
+    raised, so callers keep handling status codes themselves.
+    """
+    retries = Retry(total=5, backoff_factor=2, status_forcelist=RETRY_STATUSES,
+                    respect_retry_after_header=True, raise_on_status=False)
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
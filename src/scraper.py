@@ -2,11 +2,12 @@ import requests
 import json
 import os
 from datetime import datetime, timedelta
-import time
 import logging
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+from src.rate_limit import TokenBucket, retrying_adapter
+
 load_dotenv()
 
 class TwitterAPIClient:
@@ -21,10 +22,14 @@ class TwitterAPIClient:
             'x-api-key': self.api_key,
             'Content-Type': 'application/json'
         })
+        # 429 / 5xx are retried with exponential backoff, honouring Retry-After
+        self.session.mount("https://", retrying_adapter())
 
-        # Rate limiting for free tier: 1 request every 5 seconds
+        # Rate limiting for free tier: 1 request every 5 seconds. Time spent
+        # on the network counts towards the next token, so back-to-back
+        # collection cycles only wait for whatever is left of the interval
         self.request_delay = 5  # seconds between requests for free tier
-        self.last_request_time = None
+        self.limiter = TokenBucket(rate=1 / self.request_delay)
 
         # Setup logging
         logging.basicConfig(level=logging.INFO)
@@ -32,19 +37,9 @@ class TwitterAPIClient:
 
     def _rate_limit_check(self):
         """Check and enforce rate limiting for free tier (1 request per 5 seconds)"""
-        if self.last_request_time is None:
-            self.last_request_time = datetime.now()
-            return
-
-        now = datetime.now()
-        time_since_last = (now - self.last_request_time).total_seconds()
-
-        if time_since_last < self.request_delay:
-            wait_time = self.request_delay - time_since_last
-            self.logger.info(f"Rate limiting: waiting {wait_time:.1f} seconds")
-            time.sleep(wait_time)
-
-        self.last_request_time = datetime.now()
+        wait_time = self.limiter.acquire()
+        if wait_time > 0:
+            self.logger.info(f"Rate limiting: waited {wait_time:.1f} seconds")
 
     def get_user_tweets(self, username: str, count: int = 10,
                        since_hours: int = 24) -> List[Dict[str, Any]]:
@@ -246,9 +241,6 @@ class DataCollector:
 
                 category_tweets.extend(tweets)
 
-                # Small delay between requests to be respectful
-                time.sleep(1)
-
             all_tweets[category] = category_tweets
             self.logger.info(f"Collected {len(category_tweets)} tweets for {category}")
 
@@ -0,0 +1,121 @@
+import os
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils import hash_json, dumps_json
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # semantic tier disabled, exact-match cache still works
+    SentenceTransformer = None
+
+
+class SectorAnalysisCache:
+    """Two-tier (exact + semantic) cache for per-sector Claude analyses
+
+    Exact tier: sha256 of sector name, model and the sorted identities of
+    the tweets sent in the prompt (tweet_id, or a hash of author, date and
+    text for collector dumps that carry no id).
+    Semantic tier: cosine similarity of the sentence embedding of the
+    prompt's tweet content against earlier entries for the same sector
+    and model. Only active when sentence-transformers is installed.
+    """
+
+    DEFAULT_PATH = 'data/cache/sector_analysis_cache.db'
+    EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+    def __init__(self, db_path: str = DEFAULT_PATH, ttl: float = 7 * 24 * 3600,
+                 similarity_threshold: float = 0.95):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS sector_analysis (
+                key TEXT PRIMARY KEY,
+                sector TEXT,
+                model TEXT,
+                embedding BLOB,
+                response TEXT,
+                created_at REAL,
+                ttl REAL
+            )"""
+        )
+        self.conn.commit()
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self._encoder = None
+
+    @staticmethod
+    def tweet_identity(tweet: Dict[str, Any]) -> str:
+        if tweet.get('tweet_id'):
+            return str(tweet['tweet_id'])
+        return hash_json([tweet.get('username', ''), tweet.get('created_at', ''), tweet.get('text', '')])
+
+    @classmethod
+    def exact_key(cls, sector_name: str, tweets: List[Dict[str, Any]], model: str) -> str:
+        ids = sorted(cls.tweet_identity(t) for t in tweets)
+        return hash_json({'sector': sector_name, 'ids': ids, 'model': model})
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """Normalized float32 embedding of text, or None without the semantic tier"""
+        if SentenceTransformer is None:
+            return None
+        if self._encoder is None:
+            self._encoder = SentenceTransformer(self.EMBEDDING_MODEL)
+        return self._encoder.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, sector_name: str, tweets: List[Dict[str, Any]], models: List[str],
+               text: str) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """Return (cached response or None, embedding of text for a later put)
+
+        The embedding is only computed after an exact-tier miss.
+        """
+        now = time.time()
+        for model in models:
+            row = self.conn.execute(
+                "SELECT response FROM sector_analysis WHERE key = ? AND created_at + ttl > ?",
+                (self.exact_key(sector_name, tweets, model), now)
+            ).fetchone()
+            if row:
+                self.hits += 1
+                return json.loads(row[0]), None
+
+        embedding = self.embed(text)
+        if embedding is not None:
+            best, best_score = None, self.similarity_threshold
+            rows = self.conn.execute(
+                "SELECT embedding, response FROM sector_analysis "
+                "WHERE sector = ? AND embedding IS NOT NULL AND created_at + ttl > ? "
+                f"AND model IN ({','.join('?' * len(models))})",
+                (sector_name, now, *models)
+            )
+            for blob, response in rows:
+                score = float(np.dot(np.frombuffer(blob, dtype=np.float32), embedding))
+                if score >= best_score:
+                    best, best_score = response, score
+            if best is not None:
+                self.hits += 1
+                self.semantic_hits += 1
+                return json.loads(best), embedding
+
+        self.misses += 1
+        return None, embedding
+
+    def put(self, sector_name: str, tweets: List[Dict[str, Any]], model: str,
+            response: Dict[str, Any], embedding: Optional[np.ndarray] = None):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sector_analysis VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.exact_key(sector_name, tweets, model), sector_name, model,
+             embedding.tobytes() if embedding is not None else None,
+             dumps_json(response), time.time(), self.ttl)
+        )
+        self.conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'semantic_hits': self.semantic_hits, 'misses': self.misses}
@@ -1,10 +1,28 @@
 import os
 import json
+import fnmatch
+import hashlib
+import io
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import mmap
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 import glob
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # caches stay plain JSON
+    zstd = None
+
+ZSTD_LEVEL = 3
+
 
 def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     """Setup logging configuration"""
@@ -22,8 +40,16 @@ def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+# Set once ensure_directories() has run in this process
+_DIRECTORIES_READY = False
+
+
 def ensure_directories():
-    """Ensure all required directories exist"""
+    """Ensure all required directories exist (only checked once per process)"""
+    global _DIRECTORIES_READY
+    if _DIRECTORIES_READY:
+        return
+
     directories = [
         'data/raw',
         'data/processed',
@@ -37,23 +63,36 @@ def ensure_directories():
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
 
+    _DIRECTORIES_READY = True
+
 
 def get_latest_file(pattern: str) -> Optional[str]:
-    """Get the latest file matching a pattern"""
-    files = glob.glob(pattern)
-    if not files:
+    """Get the latest file matching a pattern (wildcards in the file name only)
+
+    Scans the directory once with os.scandir and reads ctimes from the
+    cached DirEntry stat results instead of glob + getctime per file.
+    """
+    directory, name_pattern = os.path.split(pattern)
+    latest, latest_ctime = None, -1.0
+    try:
+        with os.scandir(directory or '.') as entries:
+            for entry in entries:
+                if fnmatch.fnmatch(entry.name, name_pattern) and entry.is_file():
+                    ctime = entry.stat().st_ctime
+                    if ctime > latest_ctime:
+                        latest, latest_ctime = entry.path, ctime
+    except FileNotFoundError:
         return None
-    return max(files, key=os.path.getctime)
+    return latest
 
 
 def cleanup_old_files(directory: str, days_to_keep: int = 30):
     """Clean up old files in a directory"""
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+    cutoff_time = time.time() - days_to_keep * 24 * 3600
 
     for file_path in glob.glob(os.path.join(directory, '*')):
         if os.path.isfile(file_path):
-            file_date = datetime.fromtimestamp(os.path.getctime(file_path))
-            if file_date < cutoff_date:
+            if os.path.getctime(file_path) < cutoff_time:
                 try:
                     os.remove(file_path)
                     print(f"Removed old file: {file_path}")
@@ -74,12 +113,148 @@ def load_json_config(file_path: str) -> Dict[str, Any]:
         return {}
 
 
+def loads_json(raw) -> Any:
+    """Parse JSON from bytes or str (e.g. an HTTP response body), using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json(file_path: str) -> Any:
+    """Read and parse a JSON file (zstd-compressed if it ends in .zst), using orjson when available"""
+    with open(file_path, 'rb') as f:
+        if file_path.endswith('.zst'):
+            with zstd.ZstdDecompressor().stream_reader(f) as reader:
+                raw = reader.read()
+        else:
+            raw = f.read()
+    return loads_json(raw)
+
+
+def read_json_mapped(file_path: str) -> Any:
+    """Parse a large JSON file straight from a memory map (orjson only)
+
+    Skips the intermediate bytes copy of read_json; falls back to it when
+    orjson is unavailable, the file is compressed or empty.
+    """
+    if orjson is None or file_path.endswith('.zst') or os.path.getsize(file_path) == 0:
+        return read_json(file_path)
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def hash_json(data: Any) -> str:
+    """Stable SHA-256 fingerprint of a JSON-serializable object"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def sha256_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """Hex SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dumps_json(data: Any, indent: bool = False) -> str:
+    """Serialize to a UTF-8 JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+
+
+def write_json(file_path: str, data: Any, indent: bool = True):
+    """Write data as UTF-8 JSON, using orjson (binary mode) when available
+
+    The file is written under a temporary name and moved into place, so
+    readers never see a half-written file.
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def json_output_path(file_path: str) -> str:
+    """Where a JSON cache is written: file_path + '.zst' when zstandard is installed"""
+    return file_path + '.zst' if zstd is not None else file_path
+
+
+def compressing_writer(f):
+    """Wrap a binary file in a zstd stream writer (no-op without zstandard)"""
+    if zstd is None:
+        return f
+    return zstd.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(f)
+
+
+def write_json_zst(file_path: str, data: Any, indent: bool = True) -> str:
+    """Write a JSON cache zstd-compressed to file_path + '.zst'; returns the path written
+
+    Falls back to plain write_json(file_path) without zstandard.
+    """
+    if zstd is None:
+        write_json(file_path, data, indent)
+        return file_path
+    payload = dumps_json(data, indent).encode('utf-8')
+    with open(file_path + '.zst', 'wb') as f, compressing_writer(f) as writer:
+        writer.write(payload)
+    return file_path + '.zst'
+
+
+def write_jsonl_zst(file_path: str, records: Iterable[Dict[str, Any]]) -> str:
+    """Stream records as JSON Lines, zstd-compressed to file_path + '.zst'; returns the path written
+
+    One compact JSON object per line, so readers can decode record by
+    record. Written uncompressed to file_path without zstandard.
+    """
+    path = json_output_path(file_path)
+    with open(path, 'wb') as f, compressing_writer(f) as writer:
+        for record in records:
+            writer.write(dumps_json(record).encode('utf-8') + b'\n')
+    return path
+
+
+def iter_jsonl(file_path: str) -> Iterator[Any]:
+    """Yield the records of a JSON Lines file (zstd-compressed if it ends in .zst) one by one"""
+    with open(file_path, 'rb') as f:
+        if file_path.endswith('.zst'):
+            f = io.BufferedReader(zstd.ZstdDecompressor().stream_reader(f))
+        for line in f:
+            if line.strip():
+                yield loads_json(line)
+
+
+def resolve_json_path(file_path: str) -> Optional[str]:
+    """Newest existing variant of a JSON cache (file_path or file_path + '.zst')"""
+    candidates = [path for path in (file_path + '.zst', file_path) if os.path.exists(path)]
+    if zstd is None:
+        candidates = [path for path in candidates if not path.endswith('.zst')]
+    if not candidates:
+        return None
+    return max(candidates, key=os.path.getmtime)
+
+
 def save_json_data(data: Dict[str, Any], file_path: str) -> bool:
     """Save data to JSON file"""
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(file_path, data)
         return True
     except Exception as e:
         print(f"Error saving JSON data to {file_path}: {e}")
@@ -237,8 +412,6 @@ def health_check() -> Dict[str, Any]:
 
 def retry_with_backoff(func, max_retries: int = 3, base_delay: float = 1.0):
     """Retry function with exponential backoff"""
-    import time
-
     for attempt in range(max_retries):
         try:
             return func()
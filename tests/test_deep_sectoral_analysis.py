@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import deep_sectoral_analysis as dsa
+
+
+class FakeRawResponse:
+    """Mimics AsyncAPIResponse: parse() is a coroutine"""
+
+    headers = {}
+
+    def __init__(self, text):
+        self._text = text
+
+    async def parse(self):
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self._text)],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5, cache_read_input_tokens=0)
+        )
+
+
+class FakeAsyncAnthropic:
+    def __init__(self, fail=False, **kwargs):
+        self.fail = fail
+        self.requests = []
+
+        async def probe(**request):
+            return None
+
+        async def create(**request):
+            if self.fail:
+                raise RuntimeError('boom')
+            self.requests.append(request)
+            return FakeRawResponse('analysis')
+
+        self.messages = SimpleNamespace(create=probe, with_raw_response=SimpleNamespace(create=create))
+
+
+def tweet(username, text, likes=1):
+    return {'username': username, 'text': text, 'like_count': likes, 'retweet_count': 0}
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Run run_deep_sectoral_analysis in tmp_path against a fake Claude client"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(dsa, '_MODEL_PROBE_CACHE', {})
+    monkeypatch.setattr(dsa, '_MODEL_PROBE_LOCK', asyncio.Lock())
+    monkeypatch.setattr(dsa, '_DEAD_MODELS', None)
+    monkeypatch.setattr(dsa.SectorAnalysisCache, 'embed', lambda self, text: None)
+    monkeypatch.setattr(dsa, 'load_comprehensive_tweets', lambda: {
+        'Giełda': [tweet('alice', 'stocks rally'), tweet('bob', 'bear market')],
+        'Kryptowaluty': [tweet('carol', 'bitcoin surges')],
+    })
+
+    def run(client):
+        monkeypatch.setattr(dsa.anthropic, 'AsyncAnthropic', lambda **kwargs: client)
+        return dsa.run_deep_sectoral_analysis()
+
+    return run
+
+
+def test_every_sector_is_analyzed(run):
+    client = FakeAsyncAnthropic()
+    result = run(client)
+    assert sorted(result['sectors_analyzed']) == ['Giełda', 'Kryptowaluty']
+    assert len(client.requests) == 2
+
+
+def test_run_with_no_analyzed_sector_fails(run):
+    assert run(FakeAsyncAnthropic(fail=True)) is None
+
+
+def test_sector_prompt_holds_only_its_own_deduplicated_tweets(run, monkeypatch):
+    monkeypatch.setattr(dsa, 'load_comprehensive_tweets', lambda: {
+        'Giełda': [tweet('alice', 'stocks rally'), tweet('alice', 'stocks rally')],
+        'Kryptowaluty': [tweet('carol', 'bitcoin surges')],
+    })
+    client = FakeAsyncAnthropic()
+    run(client)
+
+    prompts = {}
+    for request in client.requests:
+        rubric, sector_prompt = request['messages'][0]['content']
+        assert rubric['text'] == dsa.RUBRIC_STATIC and 'cache_control' in rubric
+        prompts['GIEŁDA' in sector_prompt['text']] = sector_prompt['text']
+    assert prompts[True].count('stocks rally') == 1 and 'bitcoin' not in prompts[True]
+    assert 'stocks rally' not in prompts[False]
@@ -0,0 +1,80 @@
+import requests
+
+from src.http_cache import ConditionalRequestCache
+
+
+def make_response(status, body=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Replays queued responses and records the headers of each GET"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def test_etag_round_trip_turns_304_into_cached_200(tmp_path):
+    path = str(tmp_path / 'cache' / 'http.json')
+    session = FakeSession(
+        make_response(200, b'{"status": "success"}', {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Sep 2025 00:00:00 GMT'}),
+        make_response(304),
+    )
+    cache = ConditionalRequestCache(path)
+
+    first = cache.get(session, 'https://api.example/x', params={'userName': 'a'})
+    assert first.status_code == 200 and not first.not_modified
+    assert session.sent_headers[0] == {}
+
+    second = cache.get(session, 'https://api.example/x', params={'userName': 'a'})
+    assert session.sent_headers[1] == {
+        'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Sep 2025 00:00:00 GMT'
+    }
+    assert second.status_code == 200 and second.not_modified
+    assert second.json() == {'status': 'success'}
+
+
+def test_validators_survive_save_and_reload(tmp_path):
+    path = str(tmp_path / 'cache' / 'http.json')
+    cache = ConditionalRequestCache(path)
+    cache.get(FakeSession(make_response(200, b'{}', {'ETag': '"v1"'})), 'https://api.example/x')
+    cache.save()
+
+    session = FakeSession(make_response(304))
+    response = ConditionalRequestCache(path).get(session, 'https://api.example/x')
+    assert session.sent_headers[0] == {'If-None-Match': '"v1"'}
+    assert response.not_modified and response.json() == {}
+
+
+def test_params_are_part_of_the_key(tmp_path):
+    cache = ConditionalRequestCache(str(tmp_path / 'http.json'))
+    cache.get(FakeSession(make_response(200, b'{}', {'ETag': '"v1"'})), 'https://api.example/x', params={'userName': 'a'})
+
+    session = FakeSession(make_response(200, b'{}'))
+    cache.get(session, 'https://api.example/x', params={'userName': 'b'})
+    assert session.sent_headers[0] == {}
+
+
+def test_responses_without_validators_are_not_stored(tmp_path):
+    path = tmp_path / 'http.json'
+    cache = ConditionalRequestCache(str(path))
+    cache.get(FakeSession(make_response(200, b'{}')), 'https://api.example/x')
+    cache.save()
+    assert not path.exists()
+
+
+def test_corrupt_cache_file_starts_empty(tmp_path):
+    path = tmp_path / 'http.json'
+    path.write_text('{not json', encoding='utf-8')
+    session = FakeSession(make_response(200, b'{}'))
+    ConditionalRequestCache(str(path)).get(session, 'https://api.example/x')
+    assert session.sent_headers[0] == {}
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from src import rate_limit
+from src.rate_limit import RETRY_STATUSES, TokenBucket, retrying_adapter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleeping advances it and records the delay"""
+    state = {'now': 100.0, 'sleeps': []}
+
+    def sleep(delay):
+        state['sleeps'].append(delay)
+        state['now'] += delay
+
+    monkeypatch.setattr(rate_limit.time, 'monotonic', lambda: state['now'])
+    monkeypatch.setattr(rate_limit.time, 'sleep', sleep)
+    return state
+
+
+def test_first_token_is_immediate(clock):
+    bucket = TokenBucket(rate=1 / 6)
+    assert bucket.acquire() == 0.0
+    assert clock['sleeps'] == []
+
+
+def test_empty_bucket_waits_for_refill(clock):
+    bucket = TokenBucket(rate=1 / 6)
+    bucket.acquire()
+    assert bucket.acquire() == pytest.approx(6.0)
+    assert clock['sleeps'] == [pytest.approx(6.0)]
+
+
+def test_elapsed_time_counts_towards_next_token(clock):
+    bucket = TokenBucket(rate=1 / 6)
+    bucket.acquire()
+    clock['now'] += 4  # e.g. time spent on the request itself
+    assert bucket.acquire() == pytest.approx(2.0)
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=2)
+    clock['now'] += 1000
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_concurrent_callers_queue_in_order(clock):
+    bucket = TokenBucket(rate=1 / 6)
+    delays = [bucket._reserve() for _ in range(3)]
+    assert delays == [0.0, pytest.approx(6.0), pytest.approx(12.0)]
+
+
+def test_refund_returns_a_token(clock):
+    bucket = TokenBucket(rate=1 / 6)
+    bucket.acquire()
+    bucket.refund()
+    assert bucket.acquire() == 0.0
+
+
+def test_acquire_async_waits_like_acquire(clock, monkeypatch):
+    waited = []
+
+    async def fake_sleep(delay):
+        waited.append(delay)
+
+    monkeypatch.setattr(rate_limit.asyncio, 'sleep', fake_sleep)
+    bucket = TokenBucket(rate=1 / 6)
+
+    async def run():
+        return [await bucket.acquire_async(), await bucket.acquire_async()]
+
+    assert asyncio.run(run()) == [0.0, pytest.approx(6.0)]
+    assert waited == [pytest.approx(6.0)]
+
+
+def test_retrying_adapter_backs_off_on_throttling_only():
+    retries = retrying_adapter().max_retries
+    assert retries.total == 5
+    assert retries.respect_retry_after_header
+    assert not retries.raise_on_status
+    assert set(retries.status_forcelist) == set(RETRY_STATUSES)
+    assert 429 in RETRY_STATUSES and 402 not in RETRY_STATUSES
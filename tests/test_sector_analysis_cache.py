@@ -0,0 +1,61 @@
+import pytest
+
+from src.sector_analysis_cache import SectorAnalysisCache
+
+
+def collector_tweet(username, text, created_at='Thu Sep 18 10:23:47 +0000 2025'):
+    """Tweet dict shaped like comprehensive_tweet_collector.get_user_tweets output (no tweet_id)"""
+    return {'username': username, 'text': text, 'created_at': created_at, 'like_count': 1, 'retweet_count': 0}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = SectorAnalysisCache(str(tmp_path / 'cache.db'), ttl=60)
+    monkeypatch.setattr(cache, 'embed', lambda text: None)  # exact tier only
+    return cache
+
+
+def test_same_size_tweet_sets_do_not_collide():
+    first = [collector_tweet('alice', 'Fed cuts rates'), collector_tweet('bob', 'NVDA beats')]
+    second = [collector_tweet('alice', 'Oil spikes'), collector_tweet('bob', 'Gold at record')]
+    assert SectorAnalysisCache.exact_key('macro', first, 'm') != SectorAnalysisCache.exact_key('macro', second, 'm')
+
+
+def test_key_ignores_tweet_order():
+    tweets = [collector_tweet('alice', 'a'), collector_tweet('bob', 'b')]
+    assert (SectorAnalysisCache.exact_key('macro', tweets, 'm')
+            == SectorAnalysisCache.exact_key('macro', tweets[::-1], 'm'))
+
+
+def test_key_depends_on_sector_model_and_date():
+    tweets = [collector_tweet('alice', 'a')]
+    key = SectorAnalysisCache.exact_key('macro', tweets, 'm')
+    assert key != SectorAnalysisCache.exact_key('tech', tweets, 'm')
+    assert key != SectorAnalysisCache.exact_key('macro', tweets, 'other')
+    assert key != SectorAnalysisCache.exact_key('macro', [collector_tweet('alice', 'a', created_at='x')], 'm')
+
+
+def test_tweet_id_is_used_when_present():
+    assert SectorAnalysisCache.tweet_identity({'tweet_id': 123, 'text': 'a'}) == '123'
+
+
+def test_put_then_lookup_hits_only_for_same_tweets(cache):
+    tweets = [collector_tweet('alice', 'Fed cuts rates')]
+    other = [collector_tweet('alice', 'Oil spikes')]
+    cache.put('macro', tweets, 'm', {'analysis': 'x'})
+
+    assert cache.lookup('macro', tweets, ['m'], '')[0] == {'analysis': 'x'}
+    assert cache.lookup('macro', other, ['m'], '')[0] is None
+    assert cache.stats() == {'hits': 1, 'semantic_hits': 0, 'misses': 1}
+
+
+def test_entries_expire_after_ttl(cache, monkeypatch):
+    tweets = [collector_tweet('alice', 'Fed cuts rates')]
+    now = 1_000_000.0
+    monkeypatch.setattr('src.sector_analysis_cache.time.time', lambda: now)
+    cache.put('macro', tweets, 'm', {'analysis': 'x'})
+
+    now += 59
+    assert cache.lookup('macro', tweets, ['m'], '')[0] is not None
+    now += 2
+    assert cache.lookup('macro', tweets, ['m'], '')[0] is None
@@ -0,0 +1,99 @@
+import hashlib
+import json
+
+import pytest
+
+from src import utils
+from src.utils import (
+    dumps_json, hash_json, iter_jsonl, loads_json, read_json, read_json_mapped, sha256_file, write_json,
+    write_json_zst, write_jsonl_zst
+)
+
+DATA = {'sector': 'Tech', 'tweets': [{'text': 'Zażółć gęślą jaźń', 'likes': 3}], 'score': 0.25}
+
+
+def test_read_json_parses_utf8_file(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text(json.dumps(DATA, ensure_ascii=False), encoding='utf-8')
+    assert read_json(str(path)) == DATA
+
+
+def test_hash_json_ignores_key_order():
+    assert hash_json({'a': 1, 'b': 2}) == hash_json({'b': 2, 'a': 1})
+    assert hash_json({'a': 1}) != hash_json({'a': 2})
+
+
+@pytest.mark.parametrize('indent', [True, False])
+def test_write_json_round_trip(tmp_path, indent):
+    path = str(tmp_path / 'data.json')
+    write_json(path, DATA, indent)
+    assert read_json(path) == DATA
+
+
+def test_write_json_keeps_non_ascii_readable(tmp_path):
+    path = tmp_path / 'data.json'
+    write_json(str(path), DATA)
+    assert 'Zażółć' in path.read_text(encoding='utf-8')
+
+
+def test_dumps_and_loads_json_round_trip():
+    assert loads_json(dumps_json(DATA)) == DATA
+    assert loads_json(dumps_json(DATA, indent=True).encode('utf-8')) == DATA
+
+
+def test_read_json_mapped_matches_read_json(tmp_path):
+    path = str(tmp_path / 'data.json')
+    write_json(path, DATA)
+    assert read_json_mapped(path) == read_json(path) == DATA
+
+
+def test_write_json_zst_round_trip(tmp_path):
+    written = write_json_zst(str(tmp_path / 'data.json'), DATA)
+    assert written.endswith('.zst') == (utils.zstd is not None)
+    assert read_json(written) == DATA
+    assert read_json_mapped(written) == DATA
+
+
+def test_write_jsonl_zst_one_record_per_line(tmp_path):
+    records = [{'category': 'a', 'id': 1}, {'category': 'b', 'id': 2}]
+    written = write_jsonl_zst(str(tmp_path / 'tweets.jsonl'), iter(records))
+    with open(written, 'rb') as f:
+        raw = f.read()
+    if utils.zstd is not None:
+        raw = utils.zstd.ZstdDecompressor().stream_reader(raw).read()
+    assert [loads_json(line) for line in raw.splitlines()] == records
+
+
+def test_sha256_file_matches_hashlib(tmp_path):
+    path = tmp_path / 'blob.bin'
+    path.write_bytes(b'x' * 3000)
+    assert sha256_file(str(path), chunk_size=1024) == hashlib.sha256(b'x' * 3000).hexdigest()
+
+
+def test_get_latest_file_matches_name_pattern_only(tmp_path):
+    (tmp_path / 'raport_daily_1.md').write_text('a')
+    (tmp_path / 'other.md').write_text('b')
+    latest = utils.get_latest_file(str(tmp_path / 'raport_daily_*.md'))
+    assert latest == str(tmp_path / 'raport_daily_1.md')
+    assert utils.get_latest_file(str(tmp_path / 'missing' / '*.md')) is None
+
+
+def test_write_json_replaces_atomically(tmp_path):
+    path = tmp_path / 'data.json'
+    write_json(str(path), {'old': True})
+    with pytest.raises(TypeError):
+        write_json(str(path), {'bad': object()})
+    assert read_json(str(path)) == {'old': True}
+    assert [p.name for p in tmp_path.iterdir()] == ['data.json']
+
+
+@pytest.mark.parametrize('name', ['tweets.jsonl', 'tweets.jsonl.zst'])
+def test_iter_jsonl_reads_back_write_jsonl_zst(tmp_path, name, monkeypatch):
+    if name.endswith('.zst') and utils.zstd is None:
+        pytest.skip('zstandard not installed')
+    if not name.endswith('.zst'):
+        monkeypatch.setattr(utils, 'zstd', None)
+    records = [{'category': 'a', 'text': 'Zażółć'}, {'category': 'b', 'text': ''}]
+    written = write_jsonl_zst(str(tmp_path / 'tweets.jsonl'), iter(records))
+    assert written.endswith(name)
+    assert list(iter_jsonl(written)) == records
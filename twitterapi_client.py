@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared twitterapi.io plumbing for the single-account scripts (t_smolarek,
+Trump): one session, one rate limiter and a short-lived cache of
+user-info lookups
+"""
+
+import os
+import threading
+import time
+import requests
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+from src.http_cache import ConditionalRequestCache
+from src.rate_limit import TokenBucket, retrying_adapter
+from src.utils import loads_json
+
+load_dotenv()
+
+API_KEY = os.getenv('TWITTER_API_KEY')
+BASE_URL = "https://api.twitterapi.io"
+USER_INFO_URL = f"{BASE_URL}/twitter/user/info"
+LAST_TWEETS_URL = f"{BASE_URL}/twitter/user/last_tweets"
+
+# Shared keep-alive session with the API key baked in; 429 and 5xx are
+# retried with backoff (honouring Retry-After) before a response comes back
+SESSION = requests.Session()
+SESSION.headers.update({'x-api-key': API_KEY})
+SESSION.mount("https://", retrying_adapter())
+
+# twitterapi.io free tier allows one request every ~5 s; 6 s keeps a margin.
+# The bucket counts time spent on the network towards the next request.
+LIMITER = TokenBucket(rate=1 / 6)
+
+# Revalidated with ETag / Last-Modified, so unchanged responses come back as 304
+HTTP_CACHE = ConditionalRequestCache()
+
+# Tweet fields the smolarek outputs use; everything else in the API payload
+# (author object, entities, quoted tweets...) is dropped on arrival
+TWEET_FIELDS = ('id', 'text', 'createdAt', 'likeCount', 'retweetCount', 'replyCount', 'viewCount', 'url')
+
+# Successful user-info lookups are reused for USER_INFO_TTL seconds
+USER_INFO_TTL = 300
+USER_INFO_MAXSIZE = 128
+_user_info_cache = OrderedDict()
+_user_info_lock = threading.Lock()
+
+
+def project_tweet(tweet):
+    """Keep only TWEET_FIELDS that are present in an API tweet object"""
+    return {field: tweet[field] for field in TWEET_FIELDS if field in tweet}
+
+
+def get_user_info(username):
+    """User profile from /twitter/user/info, or None after printing why it failed
+
+    Repeated lookups of the same user within USER_INFO_TTL seconds are
+    answered from memory without a request or a rate-limit token.
+    """
+    now = time.monotonic()
+    with _user_info_lock:
+        cached = _user_info_cache.get(username)
+        if cached and now - cached[0] < USER_INFO_TTL:
+            _user_info_cache.move_to_end(username)
+            return cached[1]
+
+    try:
+        LIMITER.acquire()
+        response = HTTP_CACHE.get(SESSION, USER_INFO_URL, params={'userName': username}, timeout=15)
+        HTTP_CACHE.save()
+        # A 304 revalidation is not billed as a full call
+        if response.not_modified:
+            LIMITER.refund()
+
+        if response.status_code == 200:
+            data = loads_json(response.content)
+            if data.get('status') != 'success':
+                print(f"   ✗ Błąd API: {data.get('msg', 'Nieznany błąd')}")
+                return None
+        elif response.status_code == 429:
+            print("   ✗ RATE LIMIT - poczekaj chwilę")
+            return None
+        else:
+            print(f"   ✗ Błąd HTTP: {response.status_code}")
+            return None
+
+    except Exception as e:
+        print(f"   ✗ Błąd: {e}")
+        return None
+
+    user_data = data.get('data', {})
+    with _user_info_lock:
+        _user_info_cache[username] = (time.monotonic(), user_data)
+        _user_info_cache.move_to_end(username)
+        while len(_user_info_cache) > USER_INFO_MAXSIZE:
+            _user_info_cache.popitem(last=False)
+    return user_data
+
+
+def probe_user(username):
+    """Print the "1. Sprawdzanie konta" step for username; returns get_user_info()"""
+    print(f"1. Sprawdzanie konta @{username}...")
+    user_data = get_user_info(username)
+    if user_data is not None:
+        print(f"   ✓ Znaleziono: {user_data.get('name', 'N/A')}")
+        followers = user_data.get('followersCount', 0)
+        print(f"   Obserwujący: {followers:,}" if isinstance(followers, int) else f"   Obserwujący: {followers}")
+    return user_data